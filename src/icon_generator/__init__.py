@@ -1,5 +1,47 @@
-"""Icon generator package."""
+"""Icon generator package.
 
-from .generator.git import GitIconGenerator
+GitIconGenerator などの属性は初回参照時にインポートされるため、
+import icon_generator のみでは NumPy や Pillow は読み込まれない。
+"""
 
-__all__ = ["GitIconGenerator"]
+from typing import TYPE_CHECKING
+
+from .lazy_import import LazyAttributes
+
+if TYPE_CHECKING:
+    from .cache import (
+        disable_disk_cache,
+        disable_memory_cache,
+        enable_disk_cache,
+        enable_memory_cache,
+    )
+    from .generator.git import GitIconGenerator
+
+__all__ = [
+    "GitIconGenerator",
+    "disable_disk_cache",
+    "disable_memory_cache",
+    "enable_disk_cache",
+    "enable_memory_cache",
+]
+
+_lazy_attributes = LazyAttributes(
+    __name__,
+    {
+        "GitIconGenerator": ".generator.git",
+        "disable_disk_cache": ".cache",
+        "disable_memory_cache": ".cache",
+        "enable_disk_cache": ".cache",
+        "enable_memory_cache": ".cache",
+    },
+)
+
+
+def __getattr__(name: str) -> object:
+    """遅延インポートの対象となる属性を初回参照時にインポートする"""
+    return _lazy_attributes.resolve(name)
+
+
+def __dir__() -> list[str]:
+    """遅延インポートの対象を含む属性名の一覧を返す"""
+    return _lazy_attributes.names(globals())
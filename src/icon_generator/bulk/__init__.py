@@ -0,0 +1,37 @@
+"""Bulk and concurrent icon rendering package."""
+# __init__.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+from typing import TYPE_CHECKING
+
+from icon_generator.lazy_import import LazyAttributes
+
+if TYPE_CHECKING:
+    from .async_renderer import AsyncIconRenderer
+    from .process_renderer import ProcessIconRenderer
+    from .thread_renderer import ThreadIconRenderer
+
+__all__ = ["AsyncIconRenderer", "ProcessIconRenderer", "ThreadIconRenderer"]
+
+_lazy_attributes = LazyAttributes(
+    __name__,
+    {
+        "AsyncIconRenderer": ".async_renderer",
+        "ProcessIconRenderer": ".process_renderer",
+        "ThreadIconRenderer": ".thread_renderer",
+    },
+)
+
+
+def __getattr__(name: str) -> object:
+    """遅延インポートの対象となる属性を初回参照時にインポートする"""
+    return _lazy_attributes.resolve(name)
+
+
+def __dir__() -> list[str]:
+    """遅延インポートの対象を含む属性名の一覧を返す"""
+    return _lazy_attributes.names(globals())
@@ -0,0 +1,249 @@
+"""AsyncIconRendererモジュール:
+
+asyncio のイベントループをブロックせずにアイコン画像を生成するため、
+描画処理を Executor に委譲し、同時実行数を制限する機能を提供します。
+"""
+# async_renderer.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import asyncio
+import os
+import threading
+from collections import deque
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+)
+from concurrent.futures import Executor
+from typing import Any, ClassVar
+from weakref import WeakKeyDictionary
+
+from icon_generator.errors import ErrorMessages
+
+
+class AsyncIconRenderer:
+    """描画処理を Executor で実行し、同時実行数を制限する非同期レンダラ。
+
+    同時に Executor へ投入する描画処理は max_in_flight 件までとし、
+    超えた分はセマフォで待機させる。セマフォはイベントループごとに生成する。
+    map は入力を max_in_flight 件ずつ先読みし、結果が消費されるまで
+    次の入力を取得しないため、入力側にも背圧がかかる。
+    待機中のタスクがキャンセルされた場合、開始前の描画処理は実行されず、
+    実行中の描画処理は終了するまで同時実行数の枠を解放しない。
+
+    Attributes:
+        DEFAULT_MAX_IN_FLIGHT (int): 同時実行数の既定値 (CPU数)
+        executor (Executor | None): 描画処理を実行する Executor (None はループ既定)
+        max_in_flight (int): 同時に実行する描画処理の上限
+
+    Methods:
+        run(func, *args) -> Any:
+            描画処理を Executor で実行し、結果を返す。
+
+        map(func, items, *args) -> AsyncGenerator[tuple[Any, Any]]:
+            入力ごとの描画処理を並行して実行し、入力順に結果を返す。
+
+        get_default() -> AsyncIconRenderer:
+            プロセス内で共有する既定のレンダラを取得する。
+
+    """
+
+    DEFAULT_MAX_IN_FLIGHT = os.cpu_count() or 1
+
+    _default: ClassVar["AsyncIconRenderer | None"] = None
+
+    def __init__(
+        self,
+        executor: Executor | None = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> None:
+        """AsyncIconRendererのコンストラクタ。
+
+        Args:
+            executor (Executor | None, optional):
+                描画処理を実行する Executor。None の場合はイベントループの既定
+            max_in_flight (int, optional): 同時に実行する描画処理の上限 (既定はCPU数)
+
+        Raises:
+            ValueError: max_in_flight が1未満の場合に発生
+
+        """
+        if max_in_flight < 1:
+            message = ErrorMessages.INVALID_MAX_IN_FLIGHT.value
+            raise ValueError(message)
+
+        self.executor = executor
+        self.max_in_flight = max_in_flight
+        self._semaphores: WeakKeyDictionary[
+            asyncio.AbstractEventLoop,
+            asyncio.Semaphore,
+        ] = WeakKeyDictionary()
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:  # noqa: ANN401
+        """描画処理を Executor で実行し、結果を返す。
+
+        Args:
+            func (Callable[..., Any]): 描画処理
+            *args (Any): 描画処理の引数
+
+        Returns:
+            Any: 描画処理の戻り値
+
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_in_flight)
+            self._semaphores[loop] = semaphore
+
+        async with semaphore:
+            cancelled = threading.Event()
+            future = loop.run_in_executor(
+                self.executor,
+                self._call,
+                cancelled,
+                func,
+                args,
+            )
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # 開始前の処理は実行させず、実行中の処理は終わるまで枠を保持する
+                cancelled.set()
+                await asyncio.wait({future})
+                if not future.cancelled():
+                    future.exception()
+                raise
+
+    @staticmethod
+    def _call(
+        cancelled: threading.Event,
+        func: Callable[..., Any],
+        args: tuple[Any, ...],
+    ) -> Any:  # noqa: ANN401
+        """キャンセルされていなければ描画処理を実行する (Executor 上で実行)
+
+        Args:
+            cancelled (threading.Event): 呼び出し元でキャンセルされたか
+            func (Callable[..., Any]): 描画処理
+            args (tuple[Any, ...]): 描画処理の引数
+
+        Returns:
+            Any: 描画処理の戻り値 (キャンセル済みの場合は None)
+
+        """
+        if cancelled.is_set():
+            return None
+        return func(*args)
+
+    async def map(
+        self,
+        func: Callable[..., Any],
+        items: Iterable[Any] | AsyncIterable[Any],
+        *args: Any,  # noqa: ANN401
+    ) -> AsyncGenerator[tuple[Any, Any]]:
+        """入力ごとに func(item, *args) を並行して実行し、入力順に (入力, 結果) を返す。
+
+        先読みは max_in_flight 件までで、結果を消費するまで次の入力は取得しない。
+        例外の発生やキャンセル、aclose で終了した場合、未完了の描画処理を
+        キャンセルし、実行中の描画処理が終了するまで待ってから戻る。
+
+        Args:
+            func (Callable[..., Any]): 描画処理
+            items (Iterable[Any] | AsyncIterable[Any]): 入力の反復可能オブジェクト
+            *args (Any): 描画処理の入力以降の引数
+
+        Yields:
+            AsyncGenerator[tuple[Any, Any]]: (入力, 描画処理の戻り値)
+
+        """
+        pending: deque[tuple[Any, asyncio.Future[Any]]] = deque()
+        try:
+            async for item in self._iterate(items):
+                if len(pending) >= self.max_in_flight:
+                    yield await self._pop_oldest(pending)
+                future = asyncio.ensure_future(self.run(func, item, *args))
+                pending.append((item, future))
+
+            while pending:
+                yield await self._pop_oldest(pending)
+        finally:
+            for _, unfinished in pending:
+                unfinished.cancel()
+            await asyncio.gather(
+                *(unfinished for _, unfinished in pending),
+                return_exceptions=True,
+            )
+
+    @classmethod
+    async def _pop_oldest(
+        cls,
+        pending: deque[tuple[Any, "asyncio.Future[Any]"]],
+    ) -> tuple[Any, Any]:
+        """最も古い描画処理の終了を待ち、(入力, 結果) を取り出す。
+
+        待機中にキャンセルされた場合は、最も古い描画処理も pending に残したまま
+        呼び出し元に戻り、他の描画処理と同時にキャンセルされるようにする。
+
+        Args:
+            pending (deque[tuple[Any, asyncio.Future[Any]]]): 未完了の描画処理
+
+        Returns:
+            tuple[Any, Any]: (入力, 描画処理の戻り値)
+
+        """
+        item, future = pending[0]
+        result = await asyncio.shield(future)
+        pending.popleft()
+        return item, result
+
+    @classmethod
+    async def _iterate(
+        cls,
+        items: Iterable[Any] | AsyncIterable[Any],
+    ) -> AsyncIterator[Any]:
+        """同期・非同期の反復可能オブジェクトを非同期に反復する。
+
+        Args:
+            items (Iterable[Any] | AsyncIterable[Any]): 入力の反復可能オブジェクト
+
+        Yields:
+            AsyncIterator[Any]: 入力
+
+        """
+        if isinstance(items, AsyncIterable):
+            async for item in items:
+                yield item
+        else:
+            for item in items:
+                yield item
+
+    @classmethod
+    def get_default(cls) -> "AsyncIconRenderer":
+        """プロセス内で共有する既定のレンダラを取得する。
+
+        Returns:
+            AsyncIconRenderer: 既定の AsyncIconRenderer
+
+        """
+        if cls._default is None:
+            cls._default = AsyncIconRenderer()
+        return cls._default
+
+    @classmethod
+    def set_default(cls, renderer: "AsyncIconRenderer | None") -> None:
+        """プロセス内で共有する既定のレンダラを設定する。
+
+        Args:
+            renderer (AsyncIconRenderer | None):
+                既定とする AsyncIconRenderer。None の場合は次回取得時に再生成
+
+        """
+        cls._default = renderer
@@ -0,0 +1,269 @@
+"""ProcessIconRendererモジュール:
+
+大量のアイコン画像をプロセスプールで並列に生成し、生成結果を
+共有メモリ経由で受け渡す機能を提供します。
+"""
+# process_renderer.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import contextlib
+import itertools
+import os
+import uuid
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import resource_tracker
+from multiprocessing.context import BaseContext
+from multiprocessing.shared_memory import SharedMemory
+from typing import cast
+
+from icon_generator.errors import ErrorMessages
+
+RenderFunction = Callable[[uuid.UUID, int, str], bytes]
+# ワーカーの結果: (共有メモリ名、または画像を連結したバイト列, 各画像の長さ)
+ChunkResult = tuple[str | bytes, list[int]]
+UUID_BYTES = 16
+# 共有メモリで結果を受け渡すか。POSIX 以外 (Windows) では最後のハンドルを閉じた
+# 時点で共有メモリが破棄され、呼び出し元が開く前に消えるため、バイト列で受け渡す
+SHARED_MEMORY_HANDOFF = os.name == "posix"
+
+
+class ProcessIconRenderer:
+    """アイコン画像をプロセスプールで並列に生成するレンダラ。
+
+    UUID は chunk_size 件ずつのチャンクにまとめ、16バイトの連結として
+    ワーカープロセスに渡す。ワーカーはチャンク内の画像を1つの共有メモリに
+    書き込み、共有メモリ名と各画像の長さのみを返すため、画像ごとに
+    BytesIO や bytes を pickle 化してパイプで転送するコストがかからない。
+    POSIX 以外では共有メモリがワーカー側で閉じた時点で破棄されるため、
+    チャンク内の画像を連結した1つのバイト列で返す。
+    同時に投入するチャンクは workers の2倍までとし、入力が大量でも
+    メモリ使用量は一定に保たれる。
+
+    Attributes:
+        DEFAULT_CHUNK_SIZE (int): 1チャンクあたりの UUID 数の既定値
+        render (RenderFunction): (UUID, 画像サイズ, 画像フォーマット) から画像を生成
+        workers (int): ワーカープロセス数
+        chunk_size (int): 1チャンクあたりの UUID 数
+
+    Methods:
+        imap(uuids, image_size, image_format) -> Iterator[tuple[uuid.UUID, bytes]]:
+            UUID ごとの画像を並列に生成し、入力順に返す。
+
+    """
+
+    DEFAULT_CHUNK_SIZE = 256
+
+    def __init__(
+        self,
+        render: RenderFunction,
+        workers: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        """ProcessIconRendererのコンストラクタ。
+
+        Args:
+            render (RenderFunction):
+                (UUID, 画像サイズ, 画像フォーマット) から画像を生成する関数。
+                ワーカープロセスに渡すため pickle 可能である必要がある
+            workers (int | None, optional): ワーカープロセス数 (None の場合はCPU数)
+            chunk_size (int, optional): 1チャンクあたりの UUID 数 (既定は256)
+            mp_context (BaseContext | None, optional): プロセスの起動方式
+
+        Raises:
+            ValueError: workers または chunk_size が1未満の場合に発生
+
+        """
+        if workers is not None and workers < 1:
+            message = ErrorMessages.INVALID_WORKERS.value
+            raise ValueError(message)
+        if chunk_size < 1:
+            message = ErrorMessages.INVALID_CHUNK_SIZE.value
+            raise ValueError(message)
+
+        self.render = render
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._mp_context = mp_context
+
+    def imap(
+        self,
+        uuids: Iterable[uuid.UUID],
+        image_size: int,
+        image_format: str,
+    ) -> Iterator[tuple[uuid.UUID, bytes]]:
+        """UUID ごとの画像をプロセスプールで並列に生成し、入力順に (UUID, 画像) を返す。
+
+        Args:
+            uuids (Iterable[uuid.UUID]): UUIDの反復可能オブジェクト
+            image_size (int): イメージサイズ
+            image_format (str): 画像フォーマット名
+
+        Yields:
+            Iterator[tuple[uuid.UUID, bytes]]: (UUID, 画像のバイナリデータ)
+
+        """
+        iterator = iter(uuids)
+        chunks = iter(lambda: tuple(itertools.islice(iterator, self.chunk_size)), ())
+        pending: deque[tuple[tuple[uuid.UUID, ...], Future[ChunkResult]]]
+        pending = deque()
+        shared_memory = SHARED_MEMORY_HANDOFF
+
+        with ProcessPoolExecutor(self.workers, mp_context=self._mp_context) as pool:
+            try:
+                for chunk in chunks:
+                    future = pool.submit(
+                        _render_chunk,
+                        self.render,
+                        b"".join(unique_uuid.bytes for unique_uuid in chunk),
+                        image_size,
+                        image_format,
+                        shared_memory=shared_memory,
+                    )
+                    pending.append((chunk, future))
+                    if len(pending) >= self.workers * 2:
+                        yield from self._collect(*pending.popleft())
+
+                while pending:
+                    yield from self._collect(*pending.popleft())
+            finally:
+                for _, future in pending:
+                    future.cancel()
+                for _, future in pending:
+                    if not future.cancelled() and future.exception() is None:
+                        payload, _ = future.result()
+                        if isinstance(payload, str):
+                            _release(payload)
+
+    @classmethod
+    def _collect(
+        cls,
+        chunk: tuple[uuid.UUID, ...],
+        future: "Future[ChunkResult]",
+    ) -> list[tuple[uuid.UUID, bytes]]:
+        """チャンクの結果を読み出し、共有メモリの場合は解放する。
+
+        Args:
+            chunk (tuple[uuid.UUID, ...]): チャンクの UUID
+            future (Future[ChunkResult]):
+                (共有メモリ名、または連結した画像, 各画像の長さ)
+
+        Returns:
+            list[tuple[uuid.UUID, bytes]]: (UUID, 画像のバイナリデータ) のリスト
+
+        """
+        payload, lengths = future.result()
+        if isinstance(payload, bytes):
+            return cls._split(chunk, memoryview(payload), lengths)
+
+        shared = SharedMemory(name=payload)
+        try:
+            buffer = cast("memoryview", shared.buf)
+            results = cls._split(chunk, buffer, lengths)
+            del buffer
+        finally:
+            shared.close()
+            shared.unlink()
+        return results
+
+    @staticmethod
+    def _split(
+        chunk: tuple[uuid.UUID, ...],
+        buffer: memoryview,
+        lengths: list[int],
+    ) -> list[tuple[uuid.UUID, bytes]]:
+        """連結された画像を各画像の長さで分割する。
+
+        Args:
+            chunk (tuple[uuid.UUID, ...]): チャンクの UUID
+            buffer (memoryview): 画像を連結したバッファ
+            lengths (list[int]): 各画像の長さ
+
+        Returns:
+            list[tuple[uuid.UUID, bytes]]: (UUID, 画像のバイナリデータ) のリスト
+
+        """
+        offsets = itertools.accumulate(lengths, initial=0)
+        return [
+            (unique_uuid, bytes(buffer[start : start + length]))
+            for unique_uuid, start, length in zip(
+                chunk,
+                offsets,
+                lengths,
+                strict=False,
+            )
+        ]
+
+
+def _render_chunk(
+    render: RenderFunction,
+    uuid_bytes: bytes,
+    image_size: int,
+    image_format: str,
+    *,
+    shared_memory: bool = SHARED_MEMORY_HANDOFF,
+) -> ChunkResult:
+    """ワーカープロセスでチャンク内の画像を生成し、共有メモリに書き込む。
+
+    作成した共有メモリの所有権は呼び出し元のプロセスに移し、
+    呼び出し元が読み出した後に解放する。shared_memory が False の場合は
+    共有メモリを使わず、画像を連結したバイト列を返す。
+
+    Args:
+        render (RenderFunction): 画像を生成する関数
+        uuid_bytes (bytes): UUID のバイト列を連結したもの
+        image_size (int): イメージサイズ
+        image_format (str): 画像フォーマット名
+        shared_memory (bool, optional): 共有メモリで受け渡すか
+
+    Returns:
+        ChunkResult: (共有メモリ名、または連結した画像, 各画像の長さ)
+
+    """
+    options = (image_size, image_format)
+    images = [
+        render(uuid.UUID(bytes=uuid_bytes[start : start + UUID_BYTES]), *options)
+        for start in range(0, len(uuid_bytes), UUID_BYTES)
+    ]
+    lengths = [len(image) for image in images]
+    if not shared_memory:
+        return b"".join(images), lengths
+
+    shared = SharedMemory(create=True, size=max(1, sum(lengths)))
+    try:
+        buffer = cast("memoryview", shared.buf)
+        offset = 0
+        for image in images:
+            buffer[offset : offset + len(image)] = image
+            offset += len(image)
+        del buffer
+    except BaseException:
+        shared.close()
+        shared.unlink()
+        raise
+
+    name = shared.name
+    shared.close()
+    # ワーカーの終了時にリソーストラッカーが共有メモリを破棄しないよう、追跡を解除する
+    with contextlib.suppress(KeyError, ValueError):
+        resource_tracker.unregister(f"/{name}", "shared_memory")
+    return name, lengths
+
+
+def _release(name: str) -> None:
+    """読み出されなかった共有メモリを解放する。
+
+    Args:
+        name (str): 共有メモリ名
+
+    """
+    with contextlib.suppress(FileNotFoundError):
+        shared = SharedMemory(name=name)
+        shared.close()
+        shared.unlink()
@@ -0,0 +1,147 @@
+"""ThreadIconRendererモジュール:
+
+zlib による圧縮や Pillow のリサイズなど GIL を解放する処理を活かし、
+大量のアイコン画像をスレッドプールで並列に生成する機能を提供します。
+"""
+# thread_renderer.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import itertools
+import os
+import uuid
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from icon_generator.errors import ErrorMessages
+
+RenderFunction = Callable[[uuid.UUID, int, str], bytes]
+
+
+class ThreadIconRenderer:
+    """アイコン画像をスレッドプールで並列に生成するレンダラ。
+
+    プロセス間の転送が不要なため、画像1枚あたりの描画が軽く
+    ProcessIconRenderer では通信コストが上回る場合に向く。
+    Python レベルの処理を減らすため、UUID は chunk_size 件ずつのチャンクで
+    スレッドに渡し、Future の生成や結果の受け渡しはチャンク単位でのみ行う。
+    同時に投入するチャンクは max_pending (既定は workers の2倍) までとし、
+    入力が大量でもメモリ使用量は一定に保たれる。
+
+    Attributes:
+        DEFAULT_CHUNK_SIZE (int): 1チャンクあたりの UUID 数の既定値
+        render (RenderFunction): (UUID, 画像サイズ, 画像フォーマット) から画像を生成
+        workers (int): ワーカースレッド数
+        chunk_size (int): 1チャンクあたりの UUID 数
+        max_pending (int): 同時に投入するチャンク数の上限
+
+    Methods:
+        imap(uuids, image_size, image_format) -> Iterator[tuple[uuid.UUID, bytes]]:
+            UUID ごとの画像を並列に生成し、入力順に返す。
+
+    """
+
+    DEFAULT_CHUNK_SIZE = 32
+
+    def __init__(
+        self,
+        render: RenderFunction,
+        workers: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_pending: int | None = None,
+    ) -> None:
+        """ThreadIconRendererのコンストラクタ。
+
+        Args:
+            render (RenderFunction):
+                (UUID, 画像サイズ, 画像フォーマット) から画像を生成する関数。
+                複数のスレッドから同時に呼び出される
+            workers (int | None, optional): ワーカースレッド数 (None の場合はCPU数)
+            chunk_size (int, optional): 1チャンクあたりの UUID 数 (既定は32)
+            max_pending (int | None, optional):
+                同時に投入するチャンク数の上限 (None の場合は workers の2倍)
+
+        Raises:
+            ValueError: workers・chunk_size・max_pending が1未満の場合に発生
+
+        """
+        if workers is not None and workers < 1:
+            message = ErrorMessages.INVALID_WORKERS.value
+            raise ValueError(message)
+        if chunk_size < 1:
+            message = ErrorMessages.INVALID_CHUNK_SIZE.value
+            raise ValueError(message)
+        if max_pending is not None and max_pending < 1:
+            message = ErrorMessages.INVALID_MAX_PENDING.value
+            raise ValueError(message)
+
+        self.render = render
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.max_pending = max_pending or self.workers * 2
+
+    def imap(
+        self,
+        uuids: Iterable[uuid.UUID],
+        image_size: int,
+        image_format: str,
+    ) -> Iterator[tuple[uuid.UUID, bytes]]:
+        """UUID ごとの画像をスレッドプールで並列に生成し、入力順に (UUID, 画像) を返す。
+
+        Args:
+            uuids (Iterable[uuid.UUID]): UUIDの反復可能オブジェクト
+            image_size (int): イメージサイズ
+            image_format (str): 画像フォーマット名
+
+        Yields:
+            Iterator[tuple[uuid.UUID, bytes]]: (UUID, 画像のバイナリデータ)
+
+        """
+        iterator = iter(uuids)
+        chunks = iter(lambda: tuple(itertools.islice(iterator, self.chunk_size)), ())
+        pending: deque[tuple[tuple[uuid.UUID, ...], Future[list[bytes]]]] = deque()
+
+        with ThreadPoolExecutor(self.workers) as pool:
+            try:
+                for chunk in chunks:
+                    future = pool.submit(
+                        self._render_chunk,
+                        chunk,
+                        image_size,
+                        image_format,
+                    )
+                    pending.append((chunk, future))
+                    if len(pending) >= self.max_pending:
+                        done_chunk, done = pending.popleft()
+                        yield from zip(done_chunk, done.result(), strict=True)
+
+                while pending:
+                    done_chunk, done = pending.popleft()
+                    yield from zip(done_chunk, done.result(), strict=True)
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+    def _render_chunk(
+        self,
+        chunk: tuple[uuid.UUID, ...],
+        image_size: int,
+        image_format: str,
+    ) -> list[bytes]:
+        """ワーカースレッドでチャンク内の画像を生成する。
+
+        Args:
+            chunk (tuple[uuid.UUID, ...]): チャンクの UUID
+            image_size (int): イメージサイズ
+            image_format (str): 画像フォーマット名
+
+        Returns:
+            list[bytes]: 画像のバイナリデータのリスト
+
+        """
+        render = self.render
+        return [render(unique_uuid, image_size, image_format) for unique_uuid in chunk]
@@ -0,0 +1,24 @@
+"""Icon cache package."""
+# __init__.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+from .disk_cache import IconDiskCache, disable_disk_cache, enable_disk_cache
+from .memory_cache import (
+    CacheInfo,
+    IconMemoryCache,
+    disable_memory_cache,
+    enable_memory_cache,
+)
+
+__all__ = [
+    "CacheInfo",
+    "IconDiskCache",
+    "IconMemoryCache",
+    "disable_disk_cache",
+    "disable_memory_cache",
+    "enable_disk_cache",
+    "enable_memory_cache",
+]
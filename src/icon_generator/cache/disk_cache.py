@@ -0,0 +1,249 @@
+"""IconDiskCacheモジュール:
+
+生成済みのアイコン画像を描画内容から算出したキーでディスクに保存する、
+複数プロセスで共有可能なコンテンツアドレス方式のキャッシュを提供します。
+"""
+# disk_cache.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import contextlib
+import hashlib
+import os
+import shutil
+import threading
+import uuid
+from pathlib import Path
+from typing import ClassVar
+
+
+class IconDiskCache:
+    """描画内容をキーとして画像をディスクに保存するキャッシュ。
+
+    キーはパターンのビット列・RGB カラー・画像サイズ・画像フォーマットに
+    描画仕様と Pillow のバージョンを加えた SHA-256 で、同じ見た目のアイコンは
+    UUID が異なっても同じエントリを共有する。描画結果が変わる更新で描画仕様の
+    バージョンを上げるか、Pillow を更新すれば、古いエントリは参照されなくなる。
+    書き込みは同じディレクトリの一時ファイルに書き出し、fsync してから
+    os.replace で置き換えるため、複数のプロセスが同じディレクトリを共有しても、
+    書き込み直後に電源が断たれても、書きかけのファイルを読むことはない。
+    エントリは umask に従うパーミッション (0o666 & ~umask) で作成する。
+
+    Attributes:
+        SUFFIX (str): エントリのファイル拡張子
+        directory (Path): キャッシュディレクトリ
+        hits (int): キャッシュヒット数
+        misses (int): キャッシュミス数
+
+    Methods:
+        make_key(pattern_bits, rgb, image_size, image_format, ...) -> str:
+            描画内容からキャッシュのキーを算出する。
+
+        get(key: str) -> bytes | None:
+            キーに対応するデータを読み込む。
+
+        put(key: str, data: bytes) -> bool:
+            データをアトミックに書き込む。
+
+        clear() -> None:
+            全てのエントリを削除する。
+
+        enable(directory) -> IconDiskCache:
+            パッケージ全体で使用するキャッシュを有効化する。
+
+        disable() -> None:
+            パッケージ全体で使用するキャッシュを無効化する。
+
+        get_active() -> IconDiskCache | None:
+            パッケージ全体で使用中のキャッシュを取得する。
+
+    """
+
+    SUFFIX = ".bin"
+
+    _active: ClassVar["IconDiskCache | None"] = None
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        """IconDiskCacheのコンストラクタ。
+
+        Args:
+            directory (str | os.PathLike[str]):
+                キャッシュディレクトリ (存在しない場合は作成する)
+
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def make_key(  # noqa: PLR0913
+        cls,
+        pattern_bits: int,
+        rgb: tuple[int, int, int],
+        image_size: int,
+        image_format: str,
+        render_spec_version: int,
+        *,
+        library_version: str | None = None,
+    ) -> str:
+        """描画内容からキャッシュのキーを算出する。
+
+        Args:
+            pattern_bits (int): PatternGenerator.to_bits によるパターンのビット列
+            rgb (tuple[int, int, int]): アイコンの色 (0〜255の整数値x3)
+            image_size (int): イメージサイズ
+            image_format (str): 画像フォーマット名
+            render_spec_version (int): 描画仕様のバージョン
+            library_version (str | None, optional):
+                描画に使うライブラリのバージョン。None の場合は Pillow のバージョン
+
+        Returns:
+            str: SHA-256 の16進数文字列
+
+        """
+        if library_version is None:
+            # キャッシュの有効化だけでは Pillow を読み込まないよう、ここでインポートする
+            from PIL import __version__ as library_version  # noqa: PLC0415
+
+        red, green, blue = rgb
+        content = (
+            f"{render_spec_version}:{library_version}:{image_format}:{image_size}:"
+            f"{pattern_bits:04x}:{red:02x}{green:02x}{blue:02x}"
+        )
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def get(self, key: str) -> bytes | None:
+        """キーに対応するデータを読み込む。
+
+        Args:
+            key (str): make_key で算出したキー
+
+        Returns:
+            bytes | None: 保存されているデータ。存在しない場合は None
+
+        """
+        try:
+            data = self._path(key).read_bytes()
+        except OSError:
+            data = None
+
+        with self._lock:
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return data
+
+    def put(self, key: str, data: bytes) -> bool:
+        """データを一時ファイルに書き出して fsync し、os.replace で配置する。
+
+        書き込みに失敗してもキャッシュは描画を妨げないよう例外を送出しない。
+
+        Args:
+            key (str): make_key で算出したキー
+            data (bytes): 画像のバイナリデータ
+
+        Returns:
+            bool: 書き込みに成功した場合は True
+
+        """
+        path = self._path(key)
+        temp_path = path.parent / f".tmp-{uuid.uuid4().hex}"
+        created = False
+        try:
+            path.parent.mkdir(exist_ok=True)
+            # tempfile は 0o600 で作成するため、umask に従う 0o666 で作成する
+            fd = os.open(
+                temp_path,
+                os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0),
+                0o666,
+            )
+            created = True
+            with os.fdopen(fd, "wb") as temp_file:
+                temp_file.write(data)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            temp_path.replace(path)
+        except OSError:
+            if created:
+                with contextlib.suppress(OSError):
+                    temp_path.unlink()
+            return False
+        return True
+
+    def clear(self) -> None:
+        """全てのエントリを削除し、統計情報を初期化する。"""
+        for entry in self.directory.iterdir():
+            if entry.is_dir():
+                shutil.rmtree(entry, ignore_errors=True)
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        """キーに対応するエントリのパスを返す (先頭2文字のサブディレクトリに分散)
+
+        Args:
+            key (str): make_key で算出したキー
+
+        Returns:
+            Path: エントリのパス
+
+        """
+        return self.directory / key[:2] / f"{key}{self.SUFFIX}"
+
+    @classmethod
+    def enable(cls, directory: str | os.PathLike[str]) -> "IconDiskCache":
+        """パッケージ全体で使用するキャッシュを有効化する。
+
+        有効化以降、GitIconGenerator の画像生成はこのキャッシュを参照する。
+        既に有効な場合は新しいキャッシュに置き換える。
+
+        Args:
+            directory (str | os.PathLike[str]): キャッシュディレクトリ
+
+        Returns:
+            IconDiskCache: 有効化したキャッシュ
+
+        """
+        cache = IconDiskCache(directory)
+        cls._active = cache
+        return cache
+
+    @classmethod
+    def disable(cls) -> None:
+        """パッケージ全体で使用するキャッシュを無効化する。"""
+        cls._active = None
+
+    @classmethod
+    def get_active(cls) -> "IconDiskCache | None":
+        """パッケージ全体で使用中のキャッシュを取得する。
+
+        Returns:
+            IconDiskCache | None: 使用中のキャッシュ。無効な場合は None
+
+        """
+        return cls._active
+
+
+def enable_disk_cache(directory: str | os.PathLike[str]) -> IconDiskCache:
+    """パッケージ全体でディスクキャッシュを有効化する (IconDiskCache.enable)
+
+    Args:
+        directory (str | os.PathLike[str]): キャッシュディレクトリ
+
+    Returns:
+        IconDiskCache: 有効化したキャッシュ
+
+    """
+    return IconDiskCache.enable(directory)
+
+
+def disable_disk_cache() -> None:
+    """パッケージ全体でディスクキャッシュを無効化する (IconDiskCache.disable)"""
+    IconDiskCache.disable()
@@ -0,0 +1,223 @@
+"""IconMemoryCacheモジュール:
+
+生成済みのアイコン画像をプロセス内に保持する、
+バイト数上限付きの LRU キャッシュを提供します。
+"""
+# memory_cache.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import ClassVar, NamedTuple
+
+
+class CacheInfo(NamedTuple):
+    """キャッシュの統計情報。
+
+    Attributes:
+        hits (int): キャッシュヒット数
+        misses (int): キャッシュミス数
+        evictions (int): 上限超過により破棄したエントリ数
+        entries (int): 保持しているエントリ数
+        current_bytes (int): 保持しているデータの合計バイト数
+        max_bytes (int): 保持するデータの合計バイト数の上限
+
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    current_bytes: int
+    max_bytes: int
+
+
+class IconMemoryCache:
+    """生成済みのアイコン画像を保持する、バイト数上限付きのスレッドセーフな LRU。
+
+    キーは (UUID, 画像サイズ, 画像フォーマット) などのハッシュ可能な値で、
+    値は画像のバイナリデータ。保持するデータの合計バイト数が上限を超えた場合は
+    最も長く使われていないエントリから破棄する。上限を超える単一のデータは保持しない。
+
+    Attributes:
+        DEFAULT_MAX_BYTES (int): 合計バイト数の上限の既定値 (64MiB)
+        max_bytes (int): 保持するデータの合計バイト数の上限
+
+    Methods:
+        get(key: Hashable) -> bytes | None:
+            キーに対応するデータを取得する。
+
+        put(key: Hashable, data: bytes) -> None:
+            データを保持する。
+
+        info() -> CacheInfo:
+            統計情報を取得する。
+
+        clear() -> None:
+            全てのエントリと統計情報を破棄する。
+
+        enable(max_bytes: int) -> IconMemoryCache:
+            パッケージ全体で使用するキャッシュを有効化する。
+
+        disable() -> None:
+            パッケージ全体で使用するキャッシュを無効化する。
+
+        get_active() -> IconMemoryCache | None:
+            パッケージ全体で使用中のキャッシュを取得する。
+
+    """
+
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+    _active: ClassVar["IconMemoryCache | None"] = None
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """IconMemoryCacheのコンストラクタ。
+
+        Args:
+            max_bytes (int, optional): 保持するデータの合計バイト数の上限 (既定は64MiB)
+
+        """
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, bytes] = OrderedDict()
+        self._current_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """保持しているエントリ数を返す。
+
+        Returns:
+            int: エントリ数
+
+        """
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> bytes | None:
+        """キーに対応するデータを取得する。
+
+        Args:
+            key (Hashable): キャッシュのキー
+
+        Returns:
+            bytes | None: 保持しているデータ。存在しない場合は None
+
+        """
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return data
+
+    def put(self, key: Hashable, data: bytes) -> None:
+        """データを保持し、上限を超えた古いエントリを破棄する。
+
+        Args:
+            key (Hashable): キャッシュのキー
+            data (bytes): 画像のバイナリデータ
+
+        """
+        if len(data) > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._current_bytes -= len(previous)
+
+            self._entries[key] = data
+            self._current_bytes += len(data)
+            while self._current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._current_bytes -= len(evicted)
+                self._evictions += 1
+
+    def info(self) -> CacheInfo:
+        """統計情報を取得する。
+
+        Returns:
+            CacheInfo: キャッシュの統計情報
+
+        """
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                current_bytes=self._current_bytes,
+                max_bytes=self.max_bytes,
+            )
+
+    def clear(self) -> None:
+        """全てのエントリと統計情報を破棄する。"""
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    @classmethod
+    def enable(cls, max_bytes: int = DEFAULT_MAX_BYTES) -> "IconMemoryCache":
+        """パッケージ全体で使用するキャッシュを有効化する。
+
+        有効化以降、GitIconGenerator の画像生成はこのキャッシュを参照する。
+        既に有効な場合は新しいキャッシュに置き換える。
+
+        Args:
+            max_bytes (int, optional): 保持するデータの合計バイト数の上限 (既定は64MiB)
+
+        Returns:
+            IconMemoryCache: 有効化したキャッシュ
+
+        """
+        cache = IconMemoryCache(max_bytes=max_bytes)
+        cls._active = cache
+        return cache
+
+    @classmethod
+    def disable(cls) -> None:
+        """パッケージ全体で使用するキャッシュを無効化する。"""
+        cls._active = None
+
+    @classmethod
+    def get_active(cls) -> "IconMemoryCache | None":
+        """パッケージ全体で使用中のキャッシュを取得する。
+
+        Returns:
+            IconMemoryCache | None: 使用中のキャッシュ。無効な場合は None
+
+        """
+        return cls._active
+
+
+def enable_memory_cache(
+    max_bytes: int = IconMemoryCache.DEFAULT_MAX_BYTES,
+) -> IconMemoryCache:
+    """パッケージ全体でプロセス内キャッシュを有効化する (IconMemoryCache.enable)
+
+    Args:
+        max_bytes (int, optional): 保持するデータの合計バイト数の上限 (既定は64MiB)
+
+    Returns:
+        IconMemoryCache: 有効化したキャッシュ
+
+    """
+    return IconMemoryCache.enable(max_bytes=max_bytes)
+
+
+def disable_memory_cache() -> None:
+    """パッケージ全体でプロセス内キャッシュを無効化する (IconMemoryCache.disable)"""
+    IconMemoryCache.disable()
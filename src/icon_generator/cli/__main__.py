@@ -0,0 +1,14 @@
+"""python -m icon_generator.cli で icon-generator コマンドを実行するモジュール。"""
+# __main__.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import sys
+
+from .bulk_command import main
+
+if __name__ == "__main__":
+    sys.exit(main())
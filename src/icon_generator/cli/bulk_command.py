@@ -0,0 +1,579 @@
+"""bulk_commandモジュール:
+
+UUID の一覧からアイコン画像を一括生成し、ディレクトリ・アーカイブ・
+アイコンパックに書き出すコマンドライン (icon-generator) を提供します。
+"""
+# bulk_command.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import argparse
+import contextlib
+import os
+import random
+import sys
+import time
+import uuid
+from array import array
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
+from io import BytesIO
+from pathlib import Path
+from typing import BinaryIO, NamedTuple, TextIO
+
+import numpy as np
+
+from icon_generator.encoder import EncoderRegistry
+from icon_generator.errors import ErrorMessages
+from icon_generator.export import IconArchiveWriter
+from icon_generator.generator.git import GitIconGenerator
+from icon_generator.pack import IconPackBuilder
+
+IconSink = Callable[[uuid.UUID, int, bytes], None]
+
+OUTPUT_DIRECTORY = "dir"
+OUTPUT_PACK = "pack"
+OUTPUT_TYPES = (
+    OUTPUT_DIRECTORY,
+    IconArchiveWriter.FORMAT_ZIP,
+    IconArchiveWriter.FORMAT_TAR,
+    OUTPUT_PACK,
+)
+# 出力の種類として扱えないため、ディレクトリとみなさずにエラーとする拡張子
+UNSUPPORTED_ARCHIVE_SUFFIXES = frozenset(
+    {"gz", "tgz", "bz2", "tbz2", "xz", "txz", "zst", "lz", "7z", "rar"},
+)
+
+# ワーカー1つあたりに先行して投入する UUID 数の既定値
+DEFAULT_CHUNK_SIZE = 32
+
+
+class LatencyReservoir:
+    """生成時間を固定サイズの無作為標本 (Algorithm R) として保持する。
+
+    件数に関わらずメモリ使用量は capacity 件分に抑えられる。
+    件数と最大値は標本とは別に全件から正確に求める。
+
+    Attributes:
+        DEFAULT_CAPACITY (int): 標本として保持する件数の既定値
+        capacity (int): 標本として保持する件数
+        count (int): 追加された件数
+        maximum (float): 追加された値の最大値
+
+    """
+
+    DEFAULT_CAPACITY = 10_000
+
+    __slots__ = ("_random", "_samples", "capacity", "count", "maximum")
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, seed: int = 0) -> None:
+        """LatencyReservoir のコンストラクタ
+
+        Args:
+            capacity (int, optional): 標本として保持する件数
+            seed (int, optional): 標本の置き換えに使う乱数のシード
+
+        Raises:
+            ValueError: capacity が正の整数でない場合に発生
+
+        """
+        if capacity <= 0:
+            message = ErrorMessages.INVALID_RESERVOIR_CAPACITY.value
+            raise ValueError(message)
+        self.capacity = capacity
+        self.count = 0
+        self.maximum = 0.0
+        self._samples = array("d")
+        self._random = random.Random(seed)  # noqa: S311
+
+    def __len__(self) -> int:
+        """保持している標本の件数を返す。
+
+        Returns:
+            int: 標本の件数
+
+        """
+        return len(self._samples)
+
+    def add(self, value: float) -> None:
+        """値を追加する。
+
+        Args:
+            value (float): 生成時間 (秒)
+
+        """
+        self.count += 1
+        self.maximum = max(self.maximum, value)
+        if len(self._samples) < self.capacity:
+            self._samples.append(value)
+            return
+        index = self._random.randrange(self.count)
+        if index < self.capacity:
+            self._samples[index] = value
+
+    def percentiles(self, qs: Sequence[float]) -> list[float]:
+        """標本からパーセンタイルを求める。
+
+        Args:
+            qs (Sequence[float]): 0〜100 のパーセンタイル
+
+        Returns:
+            list[float]: パーセンタイルごとの値 (標本が空の場合は 0.0)
+
+        """
+        if not self._samples:
+            return [0.0 for _ in qs]
+        values = np.percentile(np.frombuffer(self._samples, dtype=np.float64), qs)
+        return [float(value) for value in values]
+
+
+class BulkSummary(NamedTuple):
+    """一括生成の処理件数・スループット・レイテンシの集計結果。
+
+    Attributes:
+        uuids (int): 処理した UUID 数
+        images (int): 書き出した画像の件数
+        total_bytes (int): 書き出した画像の合計バイト数
+        elapsed (float): 読み込みから書き出しまでの経過時間 (秒)
+        latency_p50 (float): UUID 1件 (全サイズ) の生成時間の中央値 (秒)
+        latency_p95 (float): UUID 1件 (全サイズ) の生成時間の95パーセンタイル (秒)
+        latency_p99 (float): UUID 1件 (全サイズ) の生成時間の99パーセンタイル (秒)
+        latency_max (float): UUID 1件 (全サイズ) の生成時間の最大値 (秒)
+
+    """
+
+    uuids: int
+    images: int
+    total_bytes: int
+    elapsed: float
+    latency_p50: float
+    latency_p95: float
+    latency_p99: float
+    latency_max: float
+
+    @classmethod
+    def collect(
+        cls,
+        uuids: int,
+        images: int,
+        total_bytes: int,
+        elapsed: float,
+        latencies: LatencyReservoir,
+    ) -> "BulkSummary":
+        """UUID ごとの生成時間の標本から集計結果を作成する。
+
+        Args:
+            uuids (int): 処理した UUID 数
+            images (int): 書き出した画像の件数
+            total_bytes (int): 書き出した画像の合計バイト数
+            elapsed (float): 経過時間 (秒)
+            latencies (LatencyReservoir): UUID ごとの生成時間 (秒) の標本
+
+        Returns:
+            BulkSummary: 集計結果
+
+        """
+        p50, p95, p99 = latencies.percentiles([50, 95, 99])
+        return cls(
+            uuids=uuids,
+            images=images,
+            total_bytes=total_bytes,
+            elapsed=elapsed,
+            latency_p50=p50,
+            latency_p95=p95,
+            latency_p99=p99,
+            latency_max=latencies.maximum,
+        )
+
+    def report(self) -> str:
+        """集計結果を人が読める複数行の文字列にする。
+
+        Returns:
+            str: 件数・スループット・レイテンシの要約
+
+        """
+        elapsed = max(self.elapsed, 1e-9)
+        megabytes = self.total_bytes / 1_000_000
+        return "\n".join(
+            [
+                (
+                    f"uuids: {self.uuids}, images: {self.images}, "
+                    f"bytes: {self.total_bytes} ({megabytes:.2f} MB), "
+                    f"elapsed: {self.elapsed:.3f} s"
+                ),
+                (
+                    f"throughput: {self.images / elapsed:.1f} images/s, "
+                    f"{megabytes / elapsed:.2f} MB/s"
+                ),
+                (
+                    f"latency: p50 {self.latency_p50 * 1000:.3f} ms, "
+                    f"p95 {self.latency_p95 * 1000:.3f} ms, "
+                    f"p99 {self.latency_p99 * 1000:.3f} ms, "
+                    f"max {self.latency_max * 1000:.3f} ms"
+                ),
+            ],
+        )
+
+
+def read_uuids(lines: Iterable[str]) -> Iterator[uuid.UUID]:
+    """1行に1つ記載された UUID を順に読み込む (空行と # 以降は無視する)
+
+    Args:
+        lines (Iterable[str]): 入力の各行
+
+    Raises:
+        ValueError: UUID として解釈できない行がある場合に発生
+
+    Yields:
+        Iterator[uuid.UUID]: UUID
+
+    """
+    for line_number, line in enumerate(lines, start=1):
+        value = line.split("#", 1)[0].strip()
+        if not value:
+            continue
+        try:
+            yield uuid.UUID(value)
+        except ValueError as e:
+            message = ErrorMessages.INVALID_UUID_LINE.format(
+                line=line_number,
+                value=value,
+            )
+            raise ValueError(message) from e
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """icon-generator のコマンドライン引数のパーサーを作成する。
+
+    Returns:
+        argparse.ArgumentParser: 引数のパーサー
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="icon-generator",
+        description=(
+            "Render identicons for UUIDs read from a file or stdin "
+            "into a directory, a ZIP/TAR archive or an icon pack."
+        ),
+    )
+    parser.add_argument(
+        "output",
+        type=Path,
+        help="output directory, .zip/.tar archive or .pack file",
+    )
+    parser.add_argument(
+        "-i",
+        "--input",
+        default="-",
+        help="file with one UUID per line ('-' reads stdin, the default)",
+    )
+    parser.add_argument(
+        "-t",
+        "--output-type",
+        choices=OUTPUT_TYPES,
+        help="output type (default: inferred from the output suffix)",
+    )
+    parser.add_argument(
+        "-s",
+        "--size",
+        dest="sizes",
+        type=_positive_int,
+        action="append",
+        help="image size in pixels; repeat for several sizes (default: 600)",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        dest="image_format",
+        default=GitIconGenerator.FORMAT_PNG,
+        choices=sorted(
+            {*GitIconGenerator.FILE_EXTENSIONS, *EncoderRegistry.names()},
+        ),
+        help="image format (default: png)",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=_positive_int,
+        help="worker threads (default: CPU count)",
+    )
+    parser.add_argument(
+        "-c",
+        "--chunk-size",
+        type=_positive_int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="UUIDs queued ahead per worker (default: %(default)s)",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """icon-generator コマンドを実行する。
+
+    Args:
+        argv (Sequence[str] | None, optional):
+            コマンドライン引数。None の場合は sys.argv を使用する
+
+    Returns:
+        int: 終了コード (成功時は0、生成や書き出しに失敗した場合は1)
+
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    sizes: list[int] = list(dict.fromkeys(args.sizes or [600]))
+
+    try:
+        output_type = args.output_type or _infer_output_type(args.output)
+        with ExitStack() as stack:
+            lines: TextIO = (
+                sys.stdin
+                if args.input == "-"
+                else stack.enter_context(Path(args.input).open(encoding="utf-8"))
+            )
+            sink = _open_sink(
+                stack,
+                args.output,
+                output_type,
+                sizes,
+                GitIconGenerator.file_extension(args.image_format),
+            )
+            summary = run(
+                read_uuids(lines),
+                sink,
+                sizes,
+                args.image_format,
+                workers=args.workers,
+                chunk_size=args.chunk_size,
+            )
+    except (ValueError, RuntimeError, OSError) as e:
+        print(f"{parser.prog}: error: {e}", file=sys.stderr)
+        return 1
+
+    print(summary.report())
+    return 0
+
+
+def run(  # noqa: PLR0913
+    uuids: Iterable[uuid.UUID],
+    sink: IconSink,
+    sizes: Sequence[int],
+    image_format: str,
+    *,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> BulkSummary:
+    """UUID ごとに各サイズの画像を並列に生成し、入力順に sink へ渡す。
+
+    ストリーム全体で1つのスレッドプールを使い、UUID ごとに1つのタスクで
+    GitIconGenerator.generate_sizes により全サイズを生成する (UUID の解析は1回のみ)
+    先行して投入するタスクは workers x chunk_size 件までに制限し、生成時間は
+    LatencyReservoir に保持するため、入力が大量でもメモリ使用量は一定に保たれる。
+
+    Args:
+        uuids (Iterable[uuid.UUID]): UUIDの反復可能オブジェクト
+        sink (IconSink): (UUID, イメージサイズ, 画像) を受け取る書き出し先
+        sizes (Sequence[int]): イメージサイズ
+        image_format (str): 画像フォーマット名
+        workers (int | None, optional): ワーカースレッド数 (None の場合はCPU数)
+        chunk_size (int, optional): ワーカー1つあたりに先行して投入する UUID 数
+
+    Raises:
+        ValueError: workers・chunk_size が正の整数でない場合、
+            または未対応の画像フォーマットの場合に発生
+        RuntimeError: 画像作成に失敗した際に発生
+
+    Returns:
+        BulkSummary: 集計結果
+
+    """
+    if workers is not None and workers <= 0:
+        message = ErrorMessages.INVALID_WORKERS.value
+        raise ValueError(message)
+    if chunk_size <= 0:
+        message = ErrorMessages.INVALID_CHUNK_SIZE.value
+        raise ValueError(message)
+    workers = workers or os.cpu_count() or 1
+    max_pending = workers * chunk_size
+
+    def render(unique_uuid: uuid.UUID) -> tuple[dict[int, BytesIO], float]:
+        start = time.perf_counter()
+        images = GitIconGenerator(unique_uuid).generate_sizes(sizes, image_format)
+        return images, time.perf_counter() - start
+
+    latencies = LatencyReservoir()
+    pending: deque[tuple[uuid.UUID, Future[tuple[dict[int, BytesIO], float]]]] = deque()
+    count = 0
+    total_bytes = 0
+
+    def write_oldest() -> None:
+        nonlocal count, total_bytes
+        unique_uuid, future = pending.popleft()
+        images, latency = future.result()
+        latencies.add(latency)
+        for image_size in sizes:
+            data = images[image_size].getvalue()
+            sink(unique_uuid, image_size, data)
+            total_bytes += len(data)
+        count += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(workers) as executor:
+        try:
+            for unique_uuid in uuids:
+                pending.append((unique_uuid, executor.submit(render, unique_uuid)))
+                if len(pending) >= max_pending:
+                    write_oldest()
+            while pending:
+                write_oldest()
+        finally:
+            for _, future in pending:
+                future.cancel()
+    elapsed = time.perf_counter() - start
+
+    return BulkSummary.collect(
+        count,
+        count * len(sizes),
+        total_bytes,
+        elapsed,
+        latencies,
+    )
+
+
+def _open_sink(
+    stack: ExitStack,
+    output: Path,
+    output_type: str,
+    sizes: Sequence[int],
+    extension: str,
+) -> IconSink:
+    """出力の種類に応じた書き出し先を開き、画像を書き出す関数を返す。
+
+    サイズが複数の場合、ディレクトリ・アーカイブでは <サイズ>/<UUID><拡張子>、
+    1つの場合は <UUID><拡張子> の名前で格納する。
+    アーカイブは IconPackBuilder と同様に同じディレクトリの一時ファイルへ書き出し、
+    正常に閉じた場合のみ出力先に配置する (失敗時に既存のファイルを壊さない)
+
+    Args:
+        stack (ExitStack): 書き出し先を閉じるための ExitStack
+        output (Path): 出力先のパス
+        output_type (str): OUTPUT_TYPES のいずれか
+        sizes (Sequence[int]): イメージサイズ
+        extension (str): 画像のファイル拡張子
+
+    Raises:
+        ValueError: アイコンパックに複数のサイズを指定した場合に発生
+
+    Returns:
+        IconSink: (UUID, イメージサイズ, 画像) を書き出す関数
+
+    """
+    per_size = len(sizes) > 1
+
+    def entry_name(unique_uuid: uuid.UUID, image_size: int) -> str:
+        name = f"{unique_uuid}{extension}"
+        return f"{image_size}/{name}" if per_size else name
+
+    if output_type == OUTPUT_PACK:
+        if per_size:
+            message = ErrorMessages.PACK_REQUIRES_SINGLE_SIZE.value
+            raise ValueError(message)
+        builder = stack.enter_context(IconPackBuilder(output))
+        return lambda unique_uuid, _, data: builder.add(unique_uuid, data)
+
+    if output_type == OUTPUT_DIRECTORY:
+        for size in sizes:
+            (output / str(size) if per_size else output).mkdir(
+                parents=True,
+                exist_ok=True,
+            )
+
+        def write_file(unique_uuid: uuid.UUID, image_size: int, data: bytes) -> None:
+            (output / entry_name(unique_uuid, image_size)).write_bytes(data)
+
+        return write_file
+
+    stream = stack.enter_context(_replace_on_success(output))
+    writer = stack.enter_context(IconArchiveWriter(stream, output_type))
+    return lambda unique_uuid, image_size, data: writer.add(
+        entry_name(unique_uuid, image_size),
+        data,
+    )
+
+
+@contextlib.contextmanager
+def _replace_on_success(output: Path) -> Iterator[BinaryIO]:
+    """出力先と同じディレクトリの一時ファイルを開き、正常終了時のみ出力先に配置する。
+
+    一時ファイルは umask に従うパーミッション (0o666 & ~umask) で作成する。
+
+    Args:
+        output (Path): 出力先のパス
+
+    Yields:
+        Iterator[BinaryIO]: 一時ファイルのストリーム
+
+    """
+    temp_path = output.parent / f".tmp-{uuid.uuid4().hex}"
+    fd = os.open(
+        temp_path,
+        os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0),
+        0o666,
+    )
+    try:
+        with os.fdopen(fd, "wb") as stream:
+            yield stream
+        temp_path.replace(output)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            temp_path.unlink()
+        raise
+
+
+def _infer_output_type(output: Path) -> str:
+    """出力先の拡張子から出力の種類を判定する。
+
+    Args:
+        output (Path): 出力先のパス
+
+    Raises:
+        ValueError: .gz・.7z など、未対応のアーカイブの拡張子の場合に発生
+
+    Returns:
+        str: .zip・.tar・.pack の場合はそれぞれの種類、それ以外はディレクトリ
+
+    """
+    suffix = output.suffix.lower().lstrip(".")
+    if suffix in UNSUPPORTED_ARCHIVE_SUFFIXES:
+        message = ErrorMessages.UNSUPPORTED_ARCHIVE_FORMAT.format(
+            archive_format=output.suffix,
+        )
+        raise ValueError(message)
+    return suffix if suffix in OUTPUT_TYPES else OUTPUT_DIRECTORY
+
+
+def _positive_int(value: str) -> int:
+    """コマンドライン引数を1以上の整数として解釈する。
+
+    Args:
+        value (str): 引数の文字列
+
+    Raises:
+        argparse.ArgumentTypeError: 1以上の整数でない場合に発生
+
+    Returns:
+        int: 解釈した整数
+
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        message = f"{value!r} is not a positive integer"
+        raise argparse.ArgumentTypeError(message)
+    return number
@@ -0,0 +1,10 @@
+"""Image encoder package."""
+# __init__.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+from .image_encoder import EncoderRegistry, ImageEncoder, PillowEncoder, RawEncoder
+
+__all__ = ["EncoderRegistry", "ImageEncoder", "PillowEncoder", "RawEncoder"]
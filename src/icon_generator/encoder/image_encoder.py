@@ -0,0 +1,307 @@
+"""ImageEncoderモジュール:
+
+描画済みの画像をバイナリデータに変換するエンコーダのインターフェースと、
+Pillow による PNG・WebP や無圧縮の RGB / RGBA などの名前付きプリセットを提供します。
+"""
+# image_encoder.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+from abc import ABC, abstractmethod
+from io import BytesIO
+from typing import BinaryIO, ClassVar
+
+from PIL import Image
+
+from icon_generator.errors import ErrorMessages
+
+
+class ImageEncoder(ABC):
+    """描画済みの画像をバイナリデータに変換するエンコーダの抽象基底クラス。
+
+    サブクラスは write を実装し、extension と media_type を設定する。
+    出力がオプションによって変わる場合は cache_token もオーバーライドする。
+
+    Attributes:
+        extension (str): ファイル拡張子 (例: ".png")
+        media_type (str): メディアタイプ (例: "image/png")
+        cache_token (str): 出力を左右する設定を表す文字列 (キャッシュのキーに使用)
+
+    Methods:
+        write(image: Image.Image, stream: BinaryIO) -> None:
+            画像をエンコードしてストリームに書き出す。
+
+        encode(image: Image.Image) -> bytes:
+            画像をエンコードしたバイナリデータを返す。
+
+    """
+
+    extension: str
+    media_type: str
+
+    @abstractmethod
+    def write(self, image: Image.Image, stream: BinaryIO) -> None:
+        """画像をエンコードしてストリームに書き出す。
+
+        Args:
+            image (Image.Image): 描画済みの画像
+            stream (BinaryIO): 書き込み可能なバイナリストリーム
+
+        """
+        ...
+
+    @property
+    def cache_token(self) -> str:
+        """出力を左右する設定を表す文字列を返す (既定はクラス名と拡張子)"""
+        return f"{type(self).__qualname__}{self.extension}"
+
+    def encode(self, image: Image.Image) -> bytes:
+        """画像をエンコードしたバイナリデータを返す。
+
+        Args:
+            image (Image.Image): 描画済みの画像
+
+        Returns:
+            bytes: エンコードしたバイナリデータ
+
+        """
+        buffer = BytesIO()
+        self.write(image, buffer)
+        return buffer.getvalue()
+
+
+class PillowEncoder(ImageEncoder):
+    """Pillow の Image.save で画像をエンコードするエンコーダ。
+
+    Attributes:
+        image_format (str): Pillow のフォーマット名 (例: "PNG", "WEBP")
+        options (dict[str, object]): Image.save に渡すオプション
+        extension (str): ファイル拡張子
+        media_type (str): メディアタイプ
+
+    """
+
+    def __init__(
+        self,
+        image_format: str,
+        extension: str,
+        media_type: str,
+        **options: object,
+    ) -> None:
+        """PillowEncoderのコンストラクタ。
+
+        Args:
+            image_format (str): Pillow のフォーマット名 (例: "PNG", "WEBP")
+            extension (str): ファイル拡張子
+            media_type (str): メディアタイプ
+            **options (object): Image.save に渡すオプション (compress_level など)
+
+        """
+        self.image_format = image_format
+        self.extension = extension
+        self.media_type = media_type
+        self.options = options
+
+    @property
+    def cache_token(self) -> str:
+        """フォーマット名と Image.save のオプションを表す文字列を返す。"""
+        options = ",".join(f"{k}={v!r}" for k, v in sorted(self.options.items()))
+        return f"{self.image_format}({options})"
+
+    def write(self, image: Image.Image, stream: BinaryIO) -> None:
+        """Image.save で画像をエンコードしてストリームに書き出す。
+
+        Args:
+            image (Image.Image): 描画済みの画像
+            stream (BinaryIO): 書き込み可能なバイナリストリーム
+
+        Raises:
+            ValueError: Pillow がフォーマットに対応していない場合
+                (WebP のプラグインがないビルドなど) に発生
+
+        """
+        try:
+            image.save(stream, self.image_format, **self.options)
+        except KeyError as e:
+            if self.image_format.upper() in Image.SAVE:
+                raise
+            message = ErrorMessages.UNAVAILABLE_PILLOW_FORMAT.format(
+                image_format=self.image_format,
+            )
+            raise ValueError(message) from e
+
+
+class RawEncoder(ImageEncoder):
+    """画素値をヘッダなしでそのまま並べる無圧縮のエンコーダ。
+
+    画像の幅・高さは呼び出し側で既知である前提とし、GPU へのアップロードや
+    他の画像処理への受け渡しなど、デコードのコストを避けたい用途に用いる。
+
+    Attributes:
+        mode (str): Pillow の画像モード (例: "RGB", "RGBA")
+        extension (str): ファイル拡張子 (例: ".rgb")
+        media_type (str): メディアタイプ (application/octet-stream)
+
+    """
+
+    def __init__(self, mode: str) -> None:
+        """RawEncoderのコンストラクタ。
+
+        Args:
+            mode (str): Pillow の画像モード (例: "RGB", "RGBA")
+
+        """
+        self.mode = mode
+        self.extension = f".{mode.lower()}"
+        self.media_type = "application/octet-stream"
+
+    @property
+    def cache_token(self) -> str:
+        """画像モードを表す文字列を返す。"""
+        return f"raw({self.mode})"
+
+    def write(self, image: Image.Image, stream: BinaryIO) -> None:
+        """画像を mode に変換し、画素値をストリームに書き出す。
+
+        Args:
+            image (Image.Image): 描画済みの画像
+            stream (BinaryIO): 書き込み可能なバイナリストリーム
+
+        """
+        if image.mode != self.mode:
+            image = image.convert(self.mode)
+        stream.write(image.tobytes())
+
+
+class EncoderRegistry:
+    """名前付きのエンコーダ (プリセット) を管理するクラス。
+
+    既定で以下のプリセットを登録する。register で追加・置き換えができるが、
+    既定のプリセットは generate_on_memory などの出力が変わらないよう置き換えできない。
+    GitIconGenerator が独自に扱うフォーマット名 ("svg"・"png-indexed") も、
+    登録したエンコーダが使われないため登録できない。
+
+    - "png": Pillow の既定設定の PNG (generate_on_memory と同じ)
+    - "png-fast": 圧縮レベル1の PNG (CPU 時間を優先)
+    - "png-max": 圧縮レベル9・optimize を有効にした PNG (サイズを優先)
+    - "webp-lossless": 可逆圧縮の WebP
+    - "rgb" / "rgba": 無圧縮の画素値
+
+    Attributes:
+        PRESET_PNG (str): Pillow の既定設定の PNG のプリセット名
+        PRESET_PNG_FAST (str): 圧縮レベル1の PNG のプリセット名
+        PRESET_PNG_MAX (str): 最大圧縮の PNG のプリセット名
+        PRESET_WEBP_LOSSLESS (str): 可逆圧縮の WebP のプリセット名
+        PRESET_RGB (str): 無圧縮の RGB のプリセット名
+        PRESET_RGBA (str): 無圧縮の RGBA のプリセット名
+        BUILTIN_PRESETS (frozenset[str]): 置き換えできない既定のプリセット名
+        RESERVED_NAMES (frozenset[str]):
+            登録できない名前 (既定のプリセットと GitIconGenerator のフォーマット名)
+
+    Methods:
+        register(name: str, encoder: ImageEncoder) -> None:
+            エンコーダを名前付きで登録する。
+
+        get(name: str) -> ImageEncoder:
+            名前に対応するエンコーダを取得する。
+
+        names() -> tuple[str, ...]:
+            登録されているエンコーダの名前を返す。
+
+    """
+
+    PRESET_PNG = "png"
+    PRESET_PNG_FAST = "png-fast"
+    PRESET_PNG_MAX = "png-max"
+    PRESET_WEBP_LOSSLESS = "webp-lossless"
+    PRESET_RGB = "rgb"
+    PRESET_RGBA = "rgba"
+    BUILTIN_PRESETS: ClassVar[frozenset[str]] = frozenset(
+        {
+            PRESET_PNG,
+            PRESET_PNG_FAST,
+            PRESET_PNG_MAX,
+            PRESET_WEBP_LOSSLESS,
+            PRESET_RGB,
+            PRESET_RGBA,
+        },
+    )
+    # GitIconGenerator.FORMAT_SVG・FORMAT_INDEXED_PNG (エンコーダより先に解決される)
+    RESERVED_NAMES: ClassVar[frozenset[str]] = BUILTIN_PRESETS | {"svg", "png-indexed"}
+
+    _encoders: ClassVar[dict[str, ImageEncoder]] = {
+        PRESET_PNG: PillowEncoder("PNG", ".png", "image/png"),
+        PRESET_PNG_FAST: PillowEncoder(
+            "PNG",
+            ".png",
+            "image/png",
+            compress_level=1,
+        ),
+        PRESET_PNG_MAX: PillowEncoder(
+            "PNG",
+            ".png",
+            "image/png",
+            compress_level=9,
+            optimize=True,
+        ),
+        PRESET_WEBP_LOSSLESS: PillowEncoder(
+            "WEBP",
+            ".webp",
+            "image/webp",
+            lossless=True,
+            quality=100,
+        ),
+        PRESET_RGB: RawEncoder("RGB"),
+        PRESET_RGBA: RawEncoder("RGBA"),
+    }
+
+    @classmethod
+    def register(cls, name: str, encoder: ImageEncoder) -> None:
+        """エンコーダを名前付きで登録する (同じ名前が登録済みの場合は置き換える)
+
+        Args:
+            name (str): エンコーダの名前
+            encoder (ImageEncoder): 登録するエンコーダ
+
+        Raises:
+            ValueError: 既定のプリセット名、または GitIconGenerator の
+                フォーマット名を指定した場合に発生
+
+        """
+        if name in cls.RESERVED_NAMES:
+            message = ErrorMessages.RESERVED_ENCODER.format(name=name)
+            raise ValueError(message)
+        cls._encoders[name] = encoder
+
+    @classmethod
+    def get(cls, name: str) -> ImageEncoder:
+        """名前に対応するエンコーダを取得する。
+
+        Args:
+            name (str): エンコーダの名前
+
+        Raises:
+            ValueError: 登録されていない名前の場合に発生
+
+        Returns:
+            ImageEncoder: エンコーダ
+
+        """
+        encoder = cls._encoders.get(name)
+        if encoder is None:
+            message = ErrorMessages.UNSUPPORTED_ENCODER.format(name=name)
+            raise ValueError(message)
+        return encoder
+
+    @classmethod
+    def names(cls) -> tuple[str, ...]:
+        """登録されているエンコーダの名前を返す。
+
+        Returns:
+            tuple[str, ...]: エンコーダの名前
+
+        """
+        return tuple(cls._encoders)
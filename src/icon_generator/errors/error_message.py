@@ -21,6 +21,70 @@ class ErrorMessages(Enum):
     # GitIconGenerator.generate_on_memory but common?
     IDENTICON_GENERATION_FAILED = "Identicon image generation failed"
     APPLY_COLOR_FAILED = "aplpy color failed"
+    INVALID_IMAGE_SIZE = "image_size must be a positive integer."
+
+    UNSUPPORTED_IMAGE_FORMAT = "Unsupported image format: {image_format}"
+
+    # GitIconGenerator.generate_into
+    INVALID_RASTER_BUFFER = (
+        "buffer must be writable and hold a ({size}, {size}, 3) uint8 raster."
+    )
+
+    # GitIconGenerator.decode_many
+    INVALID_UUID_ARRAY = "uuids must be a sequence of UUID or an (N, 16) uint8 array."
+
+    # BatchRGBGenerator.from_patterns
+    COLOR_VALUE_RANGE = "Each color value must be an integer between 0 and {maximum}."
+
+    # ColorLUT.__init__
+    INVALID_COLOR_LUT = "color lookup table must be a uint8 array of shape {shape}."
+
+    # AsyncIconRenderer
+    INVALID_MAX_IN_FLIGHT = "max_in_flight must be a positive integer."
+
+    # ProcessIconRenderer / ThreadIconRenderer
+    INVALID_WORKERS = "workers must be a positive integer."
+    INVALID_CHUNK_SIZE = "chunk_size must be a positive integer."
+    INVALID_MAX_PENDING = "max_pending must be a positive integer."
+
+    # GitIconGenerator.iter_generate
+    INVALID_READ_AHEAD = "read_ahead must be a non-negative integer."
+
+    # IconAtlas.build
+    EMPTY_ATLAS = "atlas requires at least one icon."
+    INVALID_TILE_SIZE = "tile_size must be a positive integer."
+    ATLAS_LENGTH_MISMATCH = "keys, patterns and colors must have the same length."
+    INVALID_ATLAS_COLUMNS = "columns must be a positive integer."
+
+    # ICOWriter.encode
+    INVALID_ICO_SIZES = "ICO requires at least one size between 1 and {maximum}."
+    INVALID_ICO_IMAGE = "ICO image for size {size} is not PNG data."
+
+    # EncoderRegistry.get
+    UNSUPPORTED_ENCODER = "Unsupported encoder: {name}"
+    # EncoderRegistry.register
+    RESERVED_ENCODER = "Encoder name is reserved: {name}"
+    # PillowEncoder.write
+    UNAVAILABLE_PILLOW_FORMAT = "Pillow cannot encode {image_format} in this build."
+
+    # IconArchiveWriter
+    UNSUPPORTED_ARCHIVE_FORMAT = "Unsupported archive format: {archive_format}"
+
+    # AvatarApp
+    INVALID_SERVER_SIZES = "default_size must be between 1 and max_size."
+    UNSUPPORTED_ASGI_SCOPE = "Unsupported ASGI scope type: {scope_type}"
+
+    # icon-generator (cli.bulk_command)
+    INVALID_UUID_LINE = "line {line}: {value!r} is not a valid UUID."
+    PACK_REQUIRES_SINGLE_SIZE = "an icon pack holds a single image size."
+    # LatencyReservoir
+    INVALID_RESERVOIR_CAPACITY = "capacity must be a positive integer."
+
+    # IconPackBuilder / IconPackReader
+    DUPLICATE_PACK_ENTRY = "UUID {uuid} is already in the icon pack."
+    EMPTY_PACK_ENTRY = "icon data must not be empty."
+    INVALID_ICON_PACK = "{path} is not a valid icon pack file."
+    CORRUPT_PACK_ENTRY = "{path} has an entry for {uuid} outside the image data."
 
     # PatternGenerator.__init__
     INVALID_HEX_LENGTH = "hex_pattern must be exactly {length} characters long."
@@ -0,0 +1,10 @@
+"""Icon archive export package."""
+# __init__.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+from .archive_writer import IconArchiveWriter
+
+__all__ = ["IconArchiveWriter"]
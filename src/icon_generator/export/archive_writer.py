@@ -0,0 +1,149 @@
+"""IconArchiveWriterモジュール:
+
+生成したアイコン画像を中間ファイルを作らずに ZIP / TAR アーカイブとして
+任意の書き込み可能なストリームへ逐次書き出す機能を提供します。
+"""
+# archive_writer.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import tarfile
+import time
+import zipfile
+from io import BytesIO
+from types import TracebackType
+from typing import BinaryIO, Self
+
+from icon_generator.errors import ErrorMessages
+
+
+class IconArchiveWriter:
+    """アイコン画像を ZIP / TAR アーカイブとしてストリームに逐次書き出すクラス。
+
+    エントリは追加した時点でストリームに書き出し、アーカイブ全体を
+    メモリ上に保持しない。ストリームはシーク不可能なもの (ソケットや
+    標準出力など) でもよい。PNG は圧縮済みのため、ZIP は無圧縮 (STORED) で格納し、
+    TAR はストリーム形式 ("w|") で書き出す。
+    ZIP の場合、セントラルディレクトリのためにエントリごとのメタデータのみを保持する。
+    各エントリのパーミッションは FILE_MODE (0o644) とし、展開したファイルが
+    実行ファイルや所有者のみ読み込み可能なファイルにならないようにする。
+
+    Attributes:
+        FORMAT_ZIP (str): ZIP 形式のアーカイブ名
+        FORMAT_TAR (str): TAR 形式のアーカイブ名
+        FILE_MODE (int): 各エントリのパーミッション
+        archive_format (str): アーカイブ形式
+        count (int): 追加したエントリ数
+
+    Methods:
+        add(name: str, data: bytes) -> None:
+            エントリをアーカイブに追加し、ストリームに書き出す。
+
+        close() -> None:
+            アーカイブの終端を書き出す (ストリーム自体は閉じない)
+
+    """
+
+    FORMAT_ZIP = "zip"
+    FORMAT_TAR = "tar"
+    FILE_MODE = 0o644
+    # ZipInfo.create_system の UNIX (external_attr の上位16ビットを mode として扱う)
+    _ZIP_SYSTEM_UNIX = 3
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        archive_format: str = FORMAT_ZIP,
+        timestamp: float | None = None,
+    ) -> None:
+        """IconArchiveWriterのコンストラクタ。
+
+        Args:
+            stream (BinaryIO): 書き込み可能なバイナリストリーム
+            archive_format (str, optional): FORMAT_ZIP または FORMAT_TAR
+            timestamp (float | None, optional):
+                各エントリの更新日時 (UNIX 時間)。None の場合は現在時刻
+
+        Raises:
+            ValueError: 未対応のアーカイブ形式の場合に発生
+
+        """
+        if archive_format not in {self.FORMAT_ZIP, self.FORMAT_TAR}:
+            message = ErrorMessages.UNSUPPORTED_ARCHIVE_FORMAT.format(
+                archive_format=archive_format,
+            )
+            raise ValueError(message)
+
+        self.archive_format = archive_format
+        self.count = 0
+        self._timestamp = time.time() if timestamp is None else timestamp
+        self._zip: zipfile.ZipFile | None = None
+        self._tar: tarfile.TarFile | None = None
+        if archive_format == self.FORMAT_ZIP:
+            self._zip = zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_STORED)
+        else:
+            self._tar = tarfile.open(fileobj=stream, mode="w|")  # noqa: SIM115
+
+    def add(self, name: str, data: bytes) -> None:
+        """エントリをアーカイブに追加し、ストリームに書き出す。
+
+        Args:
+            name (str): アーカイブ内のファイル名
+            data (bytes): ファイルの内容
+
+        """
+        if self._zip is not None:
+            date_time = time.localtime(self._timestamp)[:6]
+            zip_info = zipfile.ZipInfo(name, date_time=date_time)
+            zip_info.compress_type = zipfile.ZIP_STORED
+            zip_info.create_system = self._ZIP_SYSTEM_UNIX
+            zip_info.external_attr = self.FILE_MODE << 16
+            self._zip.writestr(zip_info, data)
+        elif self._tar is not None:
+            tar_info = tarfile.TarInfo(name)
+            tar_info.size = len(data)
+            tar_info.mtime = int(self._timestamp)
+            tar_info.mode = self.FILE_MODE
+            self._tar.addfile(tar_info, BytesIO(data))
+        self.count += 1
+
+    def close(self) -> None:
+        """アーカイブの終端を書き出す。
+
+        ZIP はセントラルディレクトリ、TAR は終端ブロックを書き出し、
+        ストリーム自体は閉じない。
+        """
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+        if self._tar is not None:
+            self._tar.close()
+            self._tar = None
+
+    def __enter__(self) -> Self:
+        """コンテキストマネージャの開始。
+
+        Returns:
+            Self: IconArchiveWriter自身
+
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """アーカイブの終端を書き出す。
+
+        Args:
+            exc_type (type[BaseException] | None): 例外の型
+            exc_value (BaseException | None): 例外
+            traceback (TracebackType | None): トレースバック
+
+        """
+        self.close()
@@ -6,7 +6,28 @@
 #
 # Permission is hereby granted, free of charge, to any person obtaining a copy...
 
+from typing import TYPE_CHECKING
+
+from icon_generator.lazy_import import LazyAttributes
+
 from .generator import Generator
-from .git.git_icon_generator import GitIconGenerator
+
+if TYPE_CHECKING:
+    from .git.git_icon_generator import GitIconGenerator
 
 __all__ = ["Generator", "GitIconGenerator"]
+
+_lazy_attributes = LazyAttributes(
+    __name__,
+    {"GitIconGenerator": ".git.git_icon_generator"},
+)
+
+
+def __getattr__(name: str) -> object:
+    """遅延インポートの対象となる属性を初回参照時にインポートする"""
+    return _lazy_attributes.resolve(name)
+
+
+def __dir__() -> list[str]:
+    """遅延インポートの対象を含む属性名の一覧を返す"""
+    return _lazy_attributes.names(globals())
@@ -10,16 +10,27 @@
 
 from abc import ABC, abstractmethod
 from io import BytesIO
+from typing import TYPE_CHECKING
 from uuid import UUID
 
+if TYPE_CHECKING:
+    from PIL import Image
+
+    from icon_generator.encoder import ImageEncoder
+
 
 class Generator(ABC):
     """画像生成器の抽象基底クラス。
 
     このクラスを継承するサブクラスは、
     UUID に基づく画像生成ロジックを実装する必要があります。
+    generate_encoded は render_image の結果を任意のエンコーダで変換するため、
+    サブクラスは render_image をオーバーライドすることで、
+    PNG を経由せずに各エンコーダへ画像を渡せます。
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self, unique_uuid: UUID) -> None:
         """初期化メソッド。
@@ -43,3 +54,46 @@ class Generator(ABC):
 
         """
         ...
+
+    def render_image(self, image_size: int = 600) -> "Image.Image":
+        """エンコード前の画像を生成する。
+
+        既定では generate_on_memory の結果を読み込んで返す。
+
+        Args:
+            image_size (int, optional):
+                出力画像の一辺のサイズ(ピクセル)。デフォルトは600
+
+        Returns:
+            Image.Image: 描画済みの画像
+
+        """
+        # Pillow はサブクラスが使用するまで読み込まない
+        from PIL import Image  # noqa: PLC0415
+
+        image = Image.open(self.generate_on_memory(image_size))
+        image.load()
+        return image
+
+    def generate_encoded(
+        self,
+        image_size: int = 600,
+        encoder: "str | ImageEncoder" = "png",
+    ) -> BytesIO:
+        """render_image の画像を指定したエンコーダで変換し、BytesIO形式で返す。
+
+        Args:
+            image_size (int, optional):
+                出力画像の一辺のサイズ(ピクセル)。デフォルトは600
+            encoder (str | ImageEncoder, optional):
+                EncoderRegistry に登録されたプリセット名、またはエンコーダ
+
+        Returns:
+            BytesIO: エンコードした画像のバイナリデータ。
+
+        """
+        from icon_generator.encoder import EncoderRegistry  # noqa: PLC0415
+
+        if isinstance(encoder, str):
+            encoder = EncoderRegistry.get(encoder)
+        return BytesIO(encoder.encode(self.render_image(image_size)))
@@ -0,0 +1,220 @@
+"""IconAtlasモジュール:
+
+複数のアイデンティコンを1枚の PNG にタイル状に並べたアトラス (スプライトシート) と、
+各アイコンのタイル座標を表すインデックスを生成する機能を提供します。
+"""
+# icon_atlas.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import json
+import math
+from collections.abc import Sequence
+from io import BytesIO
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+from PIL import Image
+
+from icon_generator.errors import ErrorMessages
+from icon_generator.generator.git.core.pattern import PatternGenerator
+from icon_generator.generator.git.core.png import PalettePNGWriter
+
+
+class IconAtlas:
+    """複数のアイデンティコンを並べたアトラス画像とタイル座標のインデックス。
+
+    アトラスは個別にエンコードした PNG を貼り合わせるのではなく、
+    パターンのマスクを NEAREST と同じ割り当てでタイルサイズに拡大し、
+    アイコンごとのパレット番号を書き込んだ1枚のインデックス画像から生成する。
+    パレットは 0 番を背景の白、i + 1 番を i 番目のアイコンの色とし、
+    アイコン数が PALETTE_LIMIT 以下であれば8ビットのパレット形式、
+    超える場合は RGB 形式の PNG とする。
+    各タイルの画素は generate_on_memory で同じサイズの画像を生成した場合と一致する。
+
+    Attributes:
+        PALETTE_LIMIT (int): パレット形式で出力できるアイコン数の上限
+        image (bytes): アトラスの PNG 画像
+        tile_size (int): タイルの一辺のサイズ(ピクセル)
+        columns (int): 列数
+        rows (int): 行数
+        keys (tuple[str, ...]): 配置順のアイコンのキー (UUID 文字列など)
+
+    Methods:
+        build(keys, patterns, colors, tile_size, columns) -> IconAtlas:
+            パターンと RGB カラーの配列からアトラスを生成する。
+
+        position(key: str) -> tuple[int, int]:
+            キーに対応するタイルの左上の座標を返す。
+
+        index() -> dict[str, Any]:
+            画像サイズ・タイルサイズと各アイコンの座標からなるインデックスを返す。
+
+        to_json() -> str:
+            インデックスをコンパクトな JSON 文字列で返す。
+
+    """
+
+    PALETTE_LIMIT = 255
+
+    def __init__(
+        self,
+        image: bytes,
+        tile_size: int,
+        columns: int,
+        keys: Sequence[str],
+    ) -> None:
+        """IconAtlasのコンストラクタ。
+
+        Args:
+            image (bytes): アトラスの PNG 画像
+            tile_size (int): タイルの一辺のサイズ(ピクセル)
+            columns (int): 列数
+            keys (Sequence[str]): 配置順のアイコンのキー
+
+        """
+        self.image = image
+        self.tile_size = tile_size
+        self.columns = columns
+        self.rows = math.ceil(len(keys) / columns)
+        self.keys = tuple(keys)
+        self._positions = {key: i for i, key in enumerate(self.keys)}
+
+    @classmethod
+    def build(
+        cls,
+        keys: Sequence[str],
+        patterns: NDArray[np.integer],
+        colors: NDArray[np.uint8],
+        tile_size: int,
+        columns: int | None = None,
+    ) -> "IconAtlas":
+        """パターンと RGB カラーの配列から、アイコンを行優先で並べたアトラスを生成する。
+
+        Args:
+            keys (Sequence[str]): 各アイコンのキー (UUID 文字列など)
+            patterns (NDArray[np.integer]): shape=(N, 5, 5) のバイナリパターン
+            colors (NDArray[np.uint8]): shape=(N, 3) の RGB カラー
+            tile_size (int): タイルの一辺のサイズ(ピクセル)
+            columns (int | None, optional):
+                列数。None の場合はアトラスが正方形に近くなる列数
+
+        Raises:
+            ValueError: アイコンが空、件数の不一致、tile_size・columns が1未満の場合
+
+        Returns:
+            IconAtlas: 生成したアトラス
+
+        """
+        count = len(keys)
+        if count == 0:
+            message = ErrorMessages.EMPTY_ATLAS.value
+            raise ValueError(message)
+        if not count == len(patterns) == len(colors):
+            message = ErrorMessages.ATLAS_LENGTH_MISMATCH.value
+            raise ValueError(message)
+        if tile_size < 1:
+            message = ErrorMessages.INVALID_TILE_SIZE.value
+            raise ValueError(message)
+        if columns is None:
+            columns = math.ceil(math.sqrt(count))
+        if columns < 1:
+            message = ErrorMessages.INVALID_ATLAS_COLUMNS.value
+            raise ValueError(message)
+
+        indices = cls._palette_indices(patterns, tile_size, columns)
+        palette = np.vstack(
+            [np.array([PatternGenerator.WHITE_RGB], dtype=np.uint8), colors],
+        ).astype(np.uint8)
+
+        if count <= cls.PALETTE_LIMIT:
+            image = Image.fromarray(indices.astype(np.uint8))
+            image.putpalette(palette.tobytes())
+        else:
+            image = Image.fromarray(palette[indices])
+
+        buffer = BytesIO()
+        image.save(buffer, "PNG")
+        return cls(buffer.getvalue(), tile_size, columns, keys)
+
+    @classmethod
+    def _palette_indices(
+        cls,
+        patterns: NDArray[np.integer],
+        tile_size: int,
+        columns: int,
+    ) -> NDArray[np.int32]:
+        """各画素のパレット番号を並べたアトラスのインデックス画像を生成する。
+
+        Args:
+            patterns (NDArray[np.integer]): shape=(N, 5, 5) のバイナリパターン
+            tile_size (int): タイルの一辺のサイズ(ピクセル)
+            columns (int): 列数
+
+        Returns:
+            NDArray[np.int32]: shape=(行数 * tile_size, columns * tile_size) の配列
+
+        """
+        count, height, width = patterns.shape
+        rows = math.ceil(count / columns)
+        row_cells = PalettePNGWriter.cell_index(height, tile_size)
+        column_cells = PalettePNGWriter.cell_index(width, tile_size)
+
+        # パレット番号を書き込んだ 5x5 のマスクを NEAREST と同じ割り当てで拡大
+        numbers = np.arange(1, count + 1, dtype=np.int32)[:, None, None]
+        masks = np.zeros((rows * columns, height, width), dtype=np.int32)
+        masks[:count] = (patterns != 0) * numbers
+        tiles = masks[:, row_cells][:, :, column_cells]
+
+        return (
+            tiles.reshape(rows, columns, tile_size, tile_size)
+            .transpose(0, 2, 1, 3)
+            .reshape(rows * tile_size, columns * tile_size)
+        )
+
+    def position(self, key: str) -> tuple[int, int]:
+        """キーに対応するタイルの左上の座標 (x, y) をピクセル単位で返す。
+
+        Args:
+            key (str): アイコンのキー
+
+        Raises:
+            KeyError: キーがアトラスに含まれない場合に発生
+
+        Returns:
+            tuple[int, int]: タイルの左上の座標 (x, y)
+
+        """
+        row, column = divmod(self._positions[key], self.columns)
+        return column * self.tile_size, row * self.tile_size
+
+    def index(self) -> dict[str, Any]:
+        """画像サイズ・タイルサイズと各アイコンの座標からなるインデックスを返す。
+
+        Returns:
+            dict[str, Any]:
+                width・height・tile_size・columns・rows と、
+                キーから [x, y] への対応を持つ icons からなる辞書
+
+        """
+        return {
+            "width": self.columns * self.tile_size,
+            "height": self.rows * self.tile_size,
+            "tile_size": self.tile_size,
+            "columns": self.columns,
+            "rows": self.rows,
+            "icons": {key: list(self.position(key)) for key in self.keys},
+        }
+
+    def to_json(self) -> str:
+        """インデックスを区切り文字の空白を省いたコンパクトな JSON 文字列で返す。
+
+        Returns:
+            str: インデックスの JSON 文字列
+
+        """
+        return json.dumps(self.index(), separators=(",", ":"))
@@ -5,6 +5,8 @@
 # Copyright (c) 2025 kazuma tunomori
 #
 # Permission is hereby granted, free of charge, to any person obtaining a copy...
+from .batch_rgb_generator import BatchRGBGenerator
+from .color_lut import ColorLUT
 from .rgb_generator import RGBGenerator
 
-__all__ = ["RGBGenerator"]
+__all__ = ["BatchRGBGenerator", "ColorLUT", "RGBGenerator"]
@@ -0,0 +1,214 @@
+"""BatchRGBGeneratorモジュール:
+
+複数のカラーパターンから RGB カラー値をベクトル演算で一括生成するクラスを提供します。
+"""
+# batch_rgb_generator.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from icon_generator.errors import ErrorMessages
+
+from .hsl_converter import HSLConverter
+
+
+class BatchRGBGenerator:
+    """カラーパターンの配列から RGB カラーの配列を一括生成するクラス。
+
+    colorsys.hls_to_rgb と同一の演算を NumPy で行うため、
+    結果は RGBGenerator と完全に一致する。
+
+    Methods:
+        from_patterns(color_patterns) -> NDArray[np.uint8]:
+            16進数カラーパターン (文字列または整数値) の配列から RGB 配列を生成する。
+
+        from_values(color_values: NDArray[np.integer]) -> NDArray[np.uint8]:
+            7桁の16進数カラーパターンの整数値配列から RGB 配列を生成する。
+
+        from_hsl(hue, saturation, luminance) -> NDArray[np.uint8]:
+            HSL 値の配列から RGB 配列を生成する。
+
+    """
+
+    ONE_THIRD = 1.0 / 3.0
+    ONE_SIXTH = 1.0 / 6.0
+    TWO_THIRD = 2.0 / 3.0
+
+    PATTERN_LENGTH = 7
+    MAX_COLOR_VALUE = 0x0FFFFFFF
+    INVALID_DIGIT = 0xFF
+
+    # ASCII コードから16進数の各桁の値への変換表 (16進数以外は INVALID_DIGIT)
+    HEX_DIGITS = np.full(256, INVALID_DIGIT, dtype=np.uint8)
+    HEX_DIGITS[np.frombuffer(b"0123456789", dtype=np.uint8)] = np.arange(10)
+    HEX_DIGITS[np.frombuffer(b"abcdef", dtype=np.uint8)] = np.arange(10, 16)
+    HEX_DIGITS[np.frombuffer(b"ABCDEF", dtype=np.uint8)] = np.arange(10, 16)
+    DIGIT_WEIGHTS = 16 ** np.arange(PATTERN_LENGTH - 1, -1, -1, dtype=np.int64)
+
+    @classmethod
+    def from_patterns(
+        cls,
+        color_patterns: Sequence[str] | Sequence[int] | NDArray[Any],
+    ) -> NDArray[np.uint8]:
+        """カラーパターンの配列から RGB 配列を一括生成
+
+        RGBGenerator(color_pattern).rgb を各要素に適用した結果と完全に一致する。
+
+        Args:
+            color_patterns (Sequence[str] | Sequence[int] | NDArray[Any]):
+                7桁の16進数文字列、またはその整数値 (0x0000000-0xFFFFFFF) の配列
+
+        Raises:
+            ValueError: 文字列長が7でない、16進数以外の文字を含む、
+                もしくは整数値が範囲外の場合に発生
+
+        Returns:
+            NDArray[np.uint8]: shape=(N, 3) の RGB 配列
+
+        """
+        patterns = np.asarray(color_patterns)
+        if patterns.size == 0:
+            return np.empty((0, 3), dtype=np.uint8)
+
+        if patterns.dtype.kind in "iu":
+            values = patterns.astype(np.int64).reshape(-1)
+            if values.min() < 0 or values.max() > cls.MAX_COLOR_VALUE:
+                message = ErrorMessages.COLOR_VALUE_RANGE.format(
+                    maximum=cls.MAX_COLOR_VALUE,
+                )
+                raise ValueError(message)
+        elif patterns.dtype.kind in "US":
+            values = cls._parse_patterns(patterns)
+        else:
+            message = ErrorMessages.INVALID_HEX_PATTERN.value
+            raise ValueError(message)
+
+        return cls.from_values(values)
+
+    @classmethod
+    def _parse_patterns(cls, patterns: NDArray[Any]) -> NDArray[np.int64]:
+        """16進数文字列の配列を整数値の配列に一括変換
+
+        Args:
+            patterns (NDArray[Any]): 7桁の16進数文字列の配列
+
+        Raises:
+            ValueError: 文字列長が7でない、もしくは16進数以外の文字を含む場合に発生
+
+        Returns:
+            NDArray[np.int64]: カラーパターンの整数値の配列
+
+        """
+        try:
+            encoded = patterns.astype(np.bytes_).reshape(-1)
+        except UnicodeEncodeError as e:
+            message = ErrorMessages.INVALID_HEX_PATTERN.value
+            raise ValueError(message) from e
+
+        if np.any(np.strings.str_len(encoded) != cls.PATTERN_LENGTH):
+            message = ErrorMessages.INVALID_HEX_LENGTH.format(length=cls.PATTERN_LENGTH)
+            raise ValueError(message)
+
+        characters = encoded.view(np.uint8).reshape(len(encoded), -1)
+        digits = cls.HEX_DIGITS[characters[:, : cls.PATTERN_LENGTH]]
+        if np.any(digits == cls.INVALID_DIGIT):
+            message = ErrorMessages.INVALID_HEX_PATTERN.value
+            raise ValueError(message)
+
+        return digits.astype(np.int64) @ cls.DIGIT_WEIGHTS
+
+    @classmethod
+    def from_values(cls, color_values: NDArray[np.integer]) -> NDArray[np.uint8]:
+        """カラーパターンの整数値配列から RGB 配列を一括生成
+
+        Args:
+            color_values (NDArray[np.integer]):
+                7桁の16進数カラーパターンを整数化した値 (0x0000000-0xFFFFFFF) の配列
+
+        Returns:
+            NDArray[np.uint8]: shape=(N, 3) の RGB 配列
+
+        """
+        values = np.asarray(color_values, dtype=np.int64).reshape(-1)
+        hue, saturation, luminance = HSLConverter.from_arrays(
+            hue_values=values >> 16,
+            sat_values=(values >> 8) & 0xFF,
+            lum_values=values & 0xFF,
+        )
+        return cls.from_hsl(hue, saturation, luminance)
+
+    @classmethod
+    def from_hsl(
+        cls,
+        hue: NDArray[np.float64],
+        saturation: NDArray[np.float64],
+        luminance: NDArray[np.float64],
+    ) -> NDArray[np.uint8]:
+        """HSL 値の配列から RGB 配列を一括生成
+
+        Args:
+            hue (NDArray[np.float64]): 色相 (0-360) の配列
+            saturation (NDArray[np.float64]): 彩度 (0-100) の配列
+            luminance (NDArray[np.float64]): 輝度 (0-100) の配列
+
+        Returns:
+            NDArray[np.uint8]: shape=(N, 3) の RGB 配列
+
+        """
+        h = hue / 360
+        l = luminance / 100  # noqa: E741
+        s = saturation / 100
+
+        # colorsys.hls_to_rgb と同じ分岐・演算順序で計算
+        m2 = np.where(l <= 0.5, l * (1.0 + s), l + s - (l * s))  # noqa: PLR2004
+        m1 = 2.0 * l - m2
+
+        rgb = np.stack(
+            [
+                cls._value(m1, m2, h + cls.ONE_THIRD),
+                cls._value(m1, m2, h),
+                cls._value(m1, m2, h - cls.ONE_THIRD),
+            ],
+            axis=-1,
+        )
+        rgb = np.where((s == 0.0)[..., np.newaxis], l[..., np.newaxis], rgb)
+
+        # 0-1 -> 0-255 スケールに変換し整数化
+        return np.floor(rgb * 255).astype(np.uint8)
+
+    @classmethod
+    def _value(
+        cls,
+        m1: NDArray[np.float64],
+        m2: NDArray[np.float64],
+        hue: NDArray[np.float64],
+    ) -> NDArray[np.float64]:
+        """colorsys._v のベクトル版
+
+        Args:
+            m1 (NDArray[np.float64]): 下限値
+            m2 (NDArray[np.float64]): 上限値
+            hue (NDArray[np.float64]): 色相 (0-1 スケール)
+
+        Returns:
+            NDArray[np.float64]: 各チャンネルの値 (0-1 スケール)
+
+        """
+        hue = hue % 1.0
+        return np.select(
+            [hue < cls.ONE_SIXTH, hue < 0.5, hue < cls.TWO_THIRD],  # noqa: PLR2004
+            [
+                m1 + (m2 - m1) * hue * 6.0,
+                m2,
+                m1 + (m2 - m1) * (cls.TWO_THIRD - hue) * 6.0,
+            ],
+            default=m1,
+        )
@@ -0,0 +1,244 @@
+"""ColorLUTモジュール:
+
+カラーパターンから得られる全ての RGB カラーを事前計算した
+ルックアップテーブルを提供します。
+"""
+# color_lut.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import os
+from pathlib import Path
+from typing import ClassVar, Literal, Self
+
+import numpy as np
+from numpy.typing import NDArray
+
+from icon_generator.errors import ErrorMessages
+
+from .batch_rgb_generator import BatchRGBGenerator
+from .hsl_converter import HSLConverter
+
+
+class ColorLUT:
+    """丸め後の HSL 値ごとの RGB カラーを保持するルックアップテーブル。
+
+    HSLConverter が返す値は 色相361段階 x 彩度21段階 x 輝度21段階 に限られるため、
+    全ての RGB カラーを shape=(361, 21, 21, 3) の uint8 配列 (約470KB) に格納できる。
+    テーブルは .npy ファイルに保存でき、読み込み時にメモリマップすることで
+    複数のワーカープロセス間でページキャッシュを共有できる。
+
+    Attributes:
+        ENV_PATH (str): 既定のテーブルを読み込む .npy ファイルのパスを指定する環境変数名
+        SHAPE (tuple[int, int, int, int]): テーブルの形状
+        table (NDArray[np.uint8]): 色相・彩度・輝度のインデックスで引く RGB テーブル
+
+    Methods:
+        build() -> ColorLUT:
+            テーブルを計算して生成する。
+
+        load(path, mmap_mode="r") -> ColorLUT:
+            .npy ファイルからテーブルを読み込む。
+
+        save(path) -> None:
+            テーブルを .npy ファイルに保存する。
+
+        lookup(color_pattern: str) -> tuple[int, int, int]:
+            7桁の16進数カラーパターンから RGB カラーを取得する。
+
+        lookup_value(color_value: int) -> tuple[int, int, int]:
+            カラーパターンの整数値から RGB カラーを取得する。
+
+        from_values(color_values) -> NDArray[np.uint8]:
+            カラーパターンの整数値配列から RGB 配列を一括取得する。
+
+        get_default() -> ColorLUT:
+            プロセス内で共有する既定のテーブルを取得する。
+
+    """
+
+    ENV_PATH = "ICON_GENERATOR_COLOR_LUT"
+
+    HUE_LEVELS = HSLConverter.MAX_HUE + 1
+    SATURATION_LEVELS = round(HSLConverter.SATURATION_SCALE * 0xFF) + 1
+    LUMINANCE_LEVELS = round(HSLConverter.LUMINANCE_SCALE * 0xFF) + 1
+    SHAPE = (HUE_LEVELS, SATURATION_LEVELS, LUMINANCE_LEVELS, 3)
+
+    _default: ClassVar["ColorLUT | None"] = None
+
+    def __init__(self, table: NDArray[np.uint8]) -> None:
+        """ColorLUTのコンストラクタ。
+
+        Args:
+            table (NDArray[np.uint8]): shape=(361, 21, 21, 3) の uint8 配列
+
+        Raises:
+            ValueError: テーブルの形状・型が不正な場合に発生
+
+        """
+        if table.shape != self.SHAPE or table.dtype != np.uint8:
+            message = ErrorMessages.INVALID_COLOR_LUT.format(shape=str(self.SHAPE))
+            raise ValueError(message)
+
+        self.table = table
+        self._rgb = memoryview(np.ascontiguousarray(table)).cast("B")
+
+        # 16進数の各フィールド値からテーブルのインデックスへの変換表
+        fields = np.arange(0x1000)
+        hue, saturation, luminance = HSLConverter.from_arrays(
+            hue_values=fields,
+            sat_values=fields[:0x100],
+            lum_values=fields[:0x100],
+        )
+        self._hue_index = hue.astype(np.intp)
+        self._sat_index = (HSLConverter.MAX_SATURATION - saturation).astype(np.intp)
+        self._lum_index = (HSLConverter.MAX_LUMINANCE - luminance).astype(np.intp)
+
+        # スカラー参照用に平坦化したバイトオフセットを Python の list で保持
+        lum_stride = self.table.shape[3]
+        sat_stride = self.LUMINANCE_LEVELS * lum_stride
+        hue_stride = self.SATURATION_LEVELS * sat_stride
+        self._hue_offsets: list[int] = (self._hue_index * hue_stride).tolist()
+        self._sat_offsets: list[int] = (self._sat_index * sat_stride).tolist()
+        self._lum_offsets: list[int] = (self._lum_index * lum_stride).tolist()
+
+    @classmethod
+    def build(cls) -> Self:
+        """全ての HSL の組み合わせから RGB テーブルを計算して生成する。
+
+        Returns:
+            Self: 計算済みの ColorLUT
+
+        """
+        hue, saturation, luminance = np.meshgrid(
+            np.arange(cls.HUE_LEVELS, dtype=np.float64),
+            HSLConverter.MAX_SATURATION - np.arange(cls.SATURATION_LEVELS, dtype=float),
+            HSLConverter.MAX_LUMINANCE - np.arange(cls.LUMINANCE_LEVELS, dtype=float),
+            indexing="ij",
+        )
+        table = BatchRGBGenerator.from_hsl(hue, saturation, luminance)
+        return cls(table)
+
+    @classmethod
+    def load(
+        cls,
+        path: str | os.PathLike[str],
+        mmap_mode: Literal["r", "c"] | None = "r",
+    ) -> Self:
+        """.npy ファイルからテーブルを読み込む。
+
+        Args:
+            path (str | os.PathLike[str]): 読み込む .npy ファイルのパス
+            mmap_mode (Literal["r", "c"] | None, optional):
+                メモリマップのモード。None の場合はメモリに読み込む (デフォルトは "r")
+
+        Raises:
+            ValueError: テーブルの形状・型が不正な場合に発生
+
+        Returns:
+            Self: 読み込んだ ColorLUT
+
+        """
+        table = np.load(Path(path), mmap_mode=mmap_mode, allow_pickle=False)
+        return cls(table)
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """テーブルを .npy ファイルに保存する。
+
+        Args:
+            path (str | os.PathLike[str]): 保存先の .npy ファイルのパス
+
+        """
+        np.save(Path(path), np.ascontiguousarray(self.table), allow_pickle=False)
+
+    def lookup(self, color_pattern: str) -> tuple[int, int, int]:
+        """7桁の16進数カラーパターンから RGB カラーを取得する。
+
+        Args:
+            color_pattern (str): 有効な16進数文字列 (文字長7)
+
+        Raises:
+            ValueError: 16進数として解釈できない場合に発生
+
+        Returns:
+            tuple[int, int, int]: 0-255スケールの RGB カラー
+
+        """
+        hue = int(color_pattern[:3], 16)
+        saturation = int(color_pattern[3:5], 16)
+        luminance = int(color_pattern[5:7], 16)
+        if min(hue, saturation, luminance) < 0:
+            message = ErrorMessages.INVALID_HEX_PATTERN.value
+            raise ValueError(message)
+
+        offset = (
+            self._hue_offsets[hue]
+            + self._sat_offsets[saturation]
+            + self._lum_offsets[luminance]
+        )
+        return self._rgb[offset], self._rgb[offset + 1], self._rgb[offset + 2]
+
+    def lookup_value(self, color_value: int) -> tuple[int, int, int]:
+        """カラーパターンの整数値から RGB カラーを取得する。
+
+        Args:
+            color_value (int):
+                7桁の16進数カラーパターンを整数化した値 (0x0000000-0xFFFFFFF)
+
+        Returns:
+            tuple[int, int, int]: 0-255スケールの RGB カラー
+
+        """
+        offset = (
+            self._hue_offsets[color_value >> 16]
+            + self._sat_offsets[(color_value >> 8) & 0xFF]
+            + self._lum_offsets[color_value & 0xFF]
+        )
+        return self._rgb[offset], self._rgb[offset + 1], self._rgb[offset + 2]
+
+    def from_values(self, color_values: NDArray[np.integer]) -> NDArray[np.uint8]:
+        """カラーパターンの整数値配列から RGB 配列を一括取得する。
+
+        Args:
+            color_values (NDArray[np.integer]):
+                7桁の16進数カラーパターンを整数化した値 (0x0000000-0xFFFFFFF) の配列
+
+        Returns:
+            NDArray[np.uint8]: shape=(N, 3) の RGB 配列
+
+        """
+        values = np.asarray(color_values, dtype=np.int64).reshape(-1)
+        return self.table[
+            self._hue_index[values >> 16],
+            self._sat_index[(values >> 8) & 0xFF],
+            self._lum_index[values & 0xFF],
+        ]
+
+    @classmethod
+    def get_default(cls) -> "ColorLUT":
+        """プロセス内で共有する既定のテーブルを取得する。
+
+        初回呼び出し時、環境変数 ICON_GENERATOR_COLOR_LUT に .npy ファイルのパスが
+        設定されていればメモリマップで読み込み、なければ計算して生成する。
+
+        Returns:
+            ColorLUT: 既定の ColorLUT
+
+        """
+        if cls._default is None:
+            path = os.environ.get(cls.ENV_PATH)
+            cls._default = ColorLUT.load(path) if path else ColorLUT.build()
+        return cls._default
+
+    @classmethod
+    def set_default(cls, lut: "ColorLUT | None") -> None:
+        """プロセス内で共有する既定のテーブルを設定する。
+
+        Args:
+            lut (ColorLUT | None): 既定とする ColorLUT。None の場合は次回取得時に再生成
+
+        """
+        cls._default = lut
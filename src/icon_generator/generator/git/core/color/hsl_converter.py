@@ -10,6 +10,9 @@ Hue、Saturation、Luminance (HSL) の各値を算出する機能を提供しま
 #
 # Permission is hereby granted, free of charge, to any person obtaining a copy...
 
+import numpy as np
+from numpy.typing import NDArray
+
 
 class HSLConverter:
     """Color pattern から HSL (Hue, Saturation, Luminance) 値を生成するクラス。
@@ -29,6 +32,9 @@ class HSLConverter:
         from_pattern(color_pattern: str) -> tuple[float, float, float]:
             16進数カラーパターン文字列からHSL値を計算して返す。
 
+        from_arrays(hue_values, sat_values, lum_values) -> tuple[NDArray, ...]:
+            16進数の各フィールド値の配列からHSL値の配列を一括で計算して返す。
+
         _calculate_hue(hue_hex: str) -> float:
             色相を16進数からスケール変換して計算。
 
@@ -64,6 +70,33 @@ class HSLConverter:
         luminance = cls._calculate_luminance(color_pattern[5:7])
         return hue, saturation, luminance
 
+    @classmethod
+    def from_arrays(
+        cls,
+        hue_values: NDArray[np.integer],
+        sat_values: NDArray[np.integer],
+        lum_values: NDArray[np.integer],
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+        """16進数フィールド値の配列から H, S, L の配列を一括で取得
+
+        from_pattern と同一の演算順序・丸め方法 (偶数丸め) で計算するため、
+        各要素の結果は from_pattern と完全に一致する。
+
+        Args:
+            hue_values (NDArray[np.integer]): 色相フィールドの値 (0x000-0xFFF)
+            sat_values (NDArray[np.integer]): 彩度フィールドの値 (0x00-0xFF)
+            lum_values (NDArray[np.integer]): 輝度フィールドの値 (0x00-0xFF)
+
+        Returns:
+            tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+                色相・彩度・輝度の配列
+
+        """
+        hue = np.round(hue_values * cls.HUE_SCALE)
+        saturation = np.round(cls.MAX_SATURATION - sat_values * cls.SATURATION_SCALE)
+        luminance = np.round(cls.MAX_LUMINANCE - lum_values * cls.LUMINANCE_SCALE)
+        return hue, saturation, luminance
+
     @classmethod
     def _calculate_hue(cls, hue_hex: str) -> float:
         """16進数の hue を 0-360 に変換
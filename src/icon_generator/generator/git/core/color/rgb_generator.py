@@ -9,12 +9,9 @@ HSL形式で表現されたカラーパターン文字列からRGBカラー値
 #
 # Permission is hereby granted, free of charge, to any person obtaining a copy...
 
-import colorsys
-import math
-
 from icon_generator.errors import ErrorMessages
 
-from .hsl_converter import HSLConverter
+from .color_lut import ColorLUT
 
 
 class RGBGenerator:
@@ -40,8 +37,8 @@ class RGBGenerator:
     def __init__(self, color_pattern: str) -> None:
         """RGBGeneratorのコンストラクタ。
 
-        HSLConverterを用いてcolor_patternからHSLを算出し、
-        colorsysでRGBに変換後、0-255スケールで格納する。
+        color_patternの各フィールドから、HSLConverterとcolorsysによる変換結果を
+        事前計算したColorLUTを参照し、0-255スケールのRGBを格納する。
 
         Args:
             color_pattern (str): 16進数形式のカラーパターン文字列。(7文字固定)
@@ -52,19 +49,5 @@ class RGBGenerator:
             message = ErrorMessages.INVALID_HEX_LENGTH.format(length=len(color_pattern))
             raise ValueError(message)
 
-        hue, saturation, luminance = HSLConverter.from_pattern(color_pattern)
-
-        # HLS -> RGB変換 (colorsysはHLS順)
-        icon_rgb = colorsys.hls_to_rgb(
-            h=hue / 360,
-            l=luminance / 100,
-            s=saturation / 100,
-        )
-
-        # 0-1 -> 0-255 スケールに変換し整数化
-        self.rgb = (
-            math.floor(icon_rgb[0] * 255),
-            math.floor(icon_rgb[1] * 255),
-            math.floor(icon_rgb[2] * 255),
-        )
+        self.rgb = ColorLUT.get_default().lookup(color_pattern)
         self.red, self.green, self.blue = self.rgb
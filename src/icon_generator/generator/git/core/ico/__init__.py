@@ -0,0 +1,10 @@
+"""ICO writer package."""
+# __init__.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+from .ico_writer import ICOWriter
+
+__all__ = ["ICOWriter"]
@@ -0,0 +1,143 @@
+"""ICOWriterモジュール:
+
+複数サイズの PNG 画像を1つの ICO (favicon) コンテナにまとめる機能を提供します。
+"""
+# ico_writer.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import struct
+from collections.abc import Iterable, Mapping
+from typing import ClassVar
+
+from icon_generator.errors import ErrorMessages
+
+
+class ICOWriter:
+    """PNG 画像をそのまま格納した、複数サイズの ICO を生成するクラス。
+
+    各サイズの画像は PNG のまま埋め込むため再エンコードは行わない
+    (Windows Vista 以降および主要なブラウザが対応する形式)
+    ICONDIRENTRY の1画素あたりのビット数は、各 PNG の IHDR チャンクの
+    ビット深度とカラータイプから求める。
+
+    Attributes:
+        HEADER (struct.Struct): ICONDIR (予約領域, 種別, 画像数)
+        ENTRY (struct.Struct): ICONDIRENTRY (幅, 高さ, 色数, 予約領域, 面数, ...)
+        TYPE_ICON (int): ICONDIR の種別 (1: アイコン)
+        MAX_SIZE (int): ICO に格納できる画像の一辺の最大サイズ
+        PNG_SIGNATURE (bytes): PNG ファイルの先頭8バイト
+        IHDR (struct.Struct): IHDR チャンク (長さ, 種別, 幅, 高さ, ビット深度, ...)
+        CHANNELS (dict[int, int]): PNG のカラータイプと1画素あたりのチャンネル数
+
+    Methods:
+        validate_sizes(sizes: Iterable[int]) -> None:
+            ICO に格納できるサイズであるかを検証する。
+
+        bits_per_pixel(size: int, png: bytes) -> int:
+            PNG 画像の IHDR チャンクから1画素あたりのビット数を求める。
+
+        encode(images: Mapping[int, bytes]) -> bytes:
+            サイズごとの PNG 画像から ICO のバイナリデータを生成する。
+
+    """
+
+    HEADER = struct.Struct("<HHH")
+    ENTRY = struct.Struct("<BBBBHHII")
+    TYPE_ICON = 1
+    MAX_SIZE = 256
+    PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+    IHDR = struct.Struct(">I4sIIBB")
+    # グレースケール・RGB・パレット・グレースケール+アルファ・RGBA
+    CHANNELS: ClassVar[dict[int, int]] = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+    @classmethod
+    def validate_sizes(cls, sizes: Iterable[int]) -> None:
+        """ICO に格納できるサイズであるかを、画像を生成する前に検証する。
+
+        Args:
+            sizes (Iterable[int]): 一辺のサイズ
+
+        Raises:
+            ValueError: サイズが空、もしくは 1〜MAX_SIZE の範囲外の場合に発生
+
+        """
+        sizes = list(sizes)
+        if not sizes or not all(1 <= size <= cls.MAX_SIZE for size in sizes):
+            message = ErrorMessages.INVALID_ICO_SIZES.format(maximum=cls.MAX_SIZE)
+            raise ValueError(message)
+
+    @classmethod
+    def bits_per_pixel(cls, size: int, png: bytes) -> int:
+        """PNG 画像の IHDR チャンクから1画素あたりのビット数を求める。
+
+        Args:
+            size (int): 一辺のサイズ (エラーメッセージに使用)
+            png (bytes): PNG 画像
+
+        Raises:
+            ValueError: PNG 画像でない場合に発生
+
+        Returns:
+            int: 1画素あたりのビット数 (例: 8ビットの RGB は 24)
+
+        """
+        signature_size = len(cls.PNG_SIGNATURE)
+        channels = None
+        if (
+            png.startswith(cls.PNG_SIGNATURE)
+            and len(png) >= signature_size + cls.IHDR.size
+        ):
+            _, chunk_type, _, _, bit_depth, color_type = cls.IHDR.unpack_from(
+                png,
+                signature_size,
+            )
+            if chunk_type == b"IHDR":
+                channels = cls.CHANNELS.get(color_type)
+        if channels is None:
+            message = ErrorMessages.INVALID_ICO_IMAGE.format(size=size)
+            raise ValueError(message)
+        return bit_depth * channels
+
+    @classmethod
+    def encode(cls, images: Mapping[int, bytes]) -> bytes:
+        """サイズごとの PNG 画像から、サイズの昇順に並べた ICO を生成する。
+
+        Args:
+            images (Mapping[int, bytes]): 一辺のサイズから PNG 画像への対応
+
+        Raises:
+            ValueError: 画像が空、もしくはサイズが 1〜MAX_SIZE の範囲外の場合に発生
+            ValueError: PNG 画像でないデータが含まれる場合に発生
+
+        Returns:
+            bytes: ICO のバイナリデータ
+
+        """
+        cls.validate_sizes(images)
+
+        sizes = sorted(images)
+        offset = cls.HEADER.size + cls.ENTRY.size * len(sizes)
+        entries = []
+        for size in sizes:
+            # 幅・高さの 0 は 256 を表す
+            dimension = size % cls.MAX_SIZE
+            entries.append(
+                cls.ENTRY.pack(
+                    dimension,
+                    dimension,
+                    0,  # パレットの色数 (パレットなし)
+                    0,  # 予約領域
+                    1,  # 面数
+                    cls.bits_per_pixel(size, images[size]),
+                    len(images[size]),
+                    offset,
+                ),
+            )
+            offset += len(images[size])
+
+        header = cls.HEADER.pack(0, cls.TYPE_ICON, len(sizes))
+        return b"".join([header, *entries, *(images[size] for size in sizes)])
@@ -5,6 +5,7 @@
 # Copyright (c) 2025 kazuma tunomori
 #
 # Permission is hereby granted, free of charge, to any person obtaining a copy...
+from .batch_pattern_generator import BatchPatternGenerator
 from .pattern_generator import PatternGenerator
 
-__all__ = ["PatternGenerator"]
+__all__ = ["BatchPatternGenerator", "PatternGenerator"]
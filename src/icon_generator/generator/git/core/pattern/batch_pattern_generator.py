@@ -0,0 +1,51 @@
+"""BatchPatternGeneratorモジュール:
+
+複数のUUIDから得た16進数の各桁(ニブル)配列を元に、
+アイデンティコン用の左右対称パターンを一括で生成するクラスを提供します。
+"""
+# batch_pattern_generator.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .pattern_generator import PatternGenerator
+
+
+class BatchPatternGenerator:
+    """ニブル配列からアイデンティコンのパターンをベクトル演算で一括生成するクラス。
+
+    PatternGenerator と同一のパターンを、行ごとの Python オブジェクトを
+    生成せずに NumPy の配列演算のみで算出する。
+
+    Methods:
+        from_nibbles(nibbles: NDArray[np.uint8]) -> NDArray[np.uint8]:
+            shape=(N, 15) のニブル配列から shape=(N, 5, 5) のパターン配列を生成する。
+
+    """
+
+    MIRROR_ROWS = (2, 1, 0, 1, 2)
+
+    @classmethod
+    def from_nibbles(cls, nibbles: NDArray[np.uint8]) -> NDArray[np.uint8]:
+        """ニブル配列からパターン配列を一括生成
+
+        Args:
+            nibbles (NDArray[np.uint8]): shape=(N, 15) の 0-15 の値を持つ配列
+
+        Returns:
+            NDArray[np.uint8]: shape=(N, 5, 5) のパターン配列。1は色付き部分、0は白背景
+
+        """
+        shape = (-1, PatternGenerator.PATTERN_HEIGHT, PatternGenerator.PATTERN_WIDTH)
+        binary_pattern = (nibbles % 2 == 0).astype(np.uint8).reshape(shape)
+
+        # 左右対称にミラーリング
+        mirrored_pattern = binary_pattern[:, cls.MIRROR_ROWS]
+
+        # 90度回転して最終パターンを作成
+        return np.ascontiguousarray(np.rot90(m=mirrored_pattern, k=3, axes=(1, 2)))
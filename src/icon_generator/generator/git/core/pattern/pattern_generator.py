@@ -32,6 +32,12 @@ class PatternGenerator:
         apply_color(rgb_pattern: list[int]) -> NDArray[np.int_]:
             バイナリパターンにRGBカラーを適用し、カラー画像用の3次元配列を返す。
 
+        to_bits(pattern: NDArray[np.integer]) -> int:
+            左右対称パターンを15ビットの整数に変換する。
+
+        from_bits(bits: int) -> PatternGenerator:
+            15ビットの整数からパターンを復元する。
+
     """
 
     PATTERN_WIDTH = 5
@@ -41,6 +47,10 @@ class PatternGenerator:
     RGB_VALUE_MIN = 0
     RGB_VALUE_MAX = 255
 
+    # 16進数文字列の各桁が to_bits のビット列で何番目 (上位から) に対応するか
+    # (i 桁目は回転後の (i % 5) 行・(2 - i // 5) 列のセル)
+    BIT_ORDER = (2, 5, 8, 11, 14, 1, 4, 7, 10, 13, 0, 3, 6, 9, 12)
+
     def __init__(self, hex_pattern: str) -> None:
         """16進数の文字列からパターンを生成"""
         expected_len = self.PATTERN_WIDTH * self.PATTERN_HEIGHT
@@ -86,6 +96,46 @@ class PatternGenerator:
         """
         return pattern[[2, 1, 0, 1, 2]]
 
+    @property
+    def bits(self) -> int:
+        """パターンを表す15ビットの整数 (to_bits を参照)"""
+        return self.to_bits(self.pattern)
+
+    @classmethod
+    def to_bits(cls, pattern: NDArray[np.integer]) -> int:
+        """左右対称パターンを15ビットの整数に変換
+
+        パターンは左右対称のため、左3列 (5行x3列=15セル) で一意に定まる。
+
+        Args:
+            pattern (NDArray[np.integer]): shape=(5, 5) のバイナリパターン
+
+        Returns:
+            int: 左3列のセルを行優先で並べた15ビットの整数
+
+        """
+        cells = (pattern[:, : cls.PATTERN_HEIGHT] != 0).ravel()
+        packed = np.packbits(cells).tobytes()
+        return int.from_bytes(packed, "big") >> (len(packed) * 8 - cells.size)
+
+    @classmethod
+    def from_bits(cls, bits: int) -> "PatternGenerator":
+        """15ビットの整数からパターンを復元 (to_bits の逆変換)
+
+        Args:
+            bits (int): to_bits で得た15ビットの整数
+
+        Returns:
+            PatternGenerator: 同じパターンを持つ PatternGenerator
+
+        """
+        cells = cls.PATTERN_WIDTH * cls.PATTERN_HEIGHT
+        hex_pattern = "".join(
+            "0" if bits >> (cells - 1 - cls.BIT_ORDER[i]) & 1 else "1"
+            for i in range(cells)
+        )
+        return cls(hex_pattern)
+
     def apply_color(self, rgb_pattern: tuple[int, int, int]) -> NDArray[np.int_]:
         """バイナリパターンに指定されたRGBカラーを適用したカラー配列を返す
 
@@ -0,0 +1,11 @@
+"""Palette PNG writer package."""
+# __init__.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+from .palette_png_writer import PalettePNGWriter
+from .png_template_cache import PNGTemplateCache
+
+__all__ = ["PNGTemplateCache", "PalettePNGWriter"]
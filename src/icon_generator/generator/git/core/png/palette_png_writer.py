@@ -0,0 +1,302 @@
+"""PalettePNGWriterモジュール:
+
+アイデンティコンのパターンとRGBカラーから、Pillow を介さずに
+1ビットのパレット形式 (インデックスカラー) の PNG を生成する機能を提供します。
+"""
+# palette_png_writer.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import struct
+import zlib
+from collections.abc import Iterator
+from typing import BinaryIO
+
+import numpy as np
+from numpy.typing import NDArray
+
+from icon_generator.errors import ErrorMessages
+from icon_generator.generator.git.core.pattern import PatternGenerator
+
+
+class PalettePNGWriter:
+    """2色のアイデンティコンを1ビットのパレット形式 PNG として書き出すクラス。
+
+    パレットは 0 番を背景の白、1 番をアイコンの色とし、
+    5x5 のパターンから各走査線を直接組み立てて zlib で圧縮する。
+    フルサイズの RGB 画像は生成しない。
+    画素の割り当ては Pillow の NEAREST リサイズと一致する。
+    圧縮データは IDAT_CHUNK_SIZE ごとの IDAT チャンクに分割して逐次出力するため、
+    ストリームへの書き出し時のメモリ使用量は画像の幅にのみ比例する。
+
+    Attributes:
+        SIGNATURE (bytes): PNG シグネチャ
+        BIT_DEPTH (int): ビット深度 (1ビット)
+        COLOR_TYPE (int): カラータイプ (3: パレット)
+        DEFAULT_COMPRESS_LEVEL (int): zlib の圧縮レベルの既定値
+        IDAT_CHUNK_SIZE (int): 1つの IDAT チャンクに格納する圧縮データの目安サイズ
+
+    Methods:
+        encode(pattern, rgb, image_size, compress_level) -> bytes:
+            パターンとRGBカラーから PNG のバイナリデータを生成する。
+
+        write(stream, pattern, rgb, image_size, compress_level) -> int:
+            PNG をチャンク単位でストリームに逐次書き出す。
+
+        header(image_size: int) -> bytes:
+            PNG シグネチャと IHDR チャンクを生成する。
+
+        palette(rgb: tuple[int, int, int]) -> bytes:
+            PLTE チャンクを生成する。
+
+        body(pattern, image_size, compress_level) -> bytes:
+            IDAT チャンクと IEND チャンクを生成する。
+
+        cell_index(cells: int, image_size: int) -> NDArray[np.intp]:
+            各画素が参照するパターンのセル番号を返す。
+
+    """
+
+    SIGNATURE = b"\x89PNG\r\n\x1a\n"
+    BIT_DEPTH = 1
+    COLOR_TYPE = 3
+    DEFAULT_COMPRESS_LEVEL = 6
+    IDAT_CHUNK_SIZE = 1 << 16
+
+    @classmethod
+    def encode(
+        cls,
+        pattern: NDArray[np.integer],
+        rgb: tuple[int, int, int],
+        image_size: int = 600,
+        compress_level: int = DEFAULT_COMPRESS_LEVEL,
+    ) -> bytes:
+        """パターンとRGBカラーから PNG のバイナリデータを生成する。
+
+        Args:
+            pattern (NDArray[np.integer]): shape=(5, 5) のバイナリパターン
+            rgb (tuple[int, int, int]): アイコンの色 (0〜255の整数値x3)
+            image_size (int, optional):
+                出力画像の一辺のサイズ(ピクセル)。デフォルトは600
+            compress_level (int, optional): zlib の圧縮レベル (0-9)
+
+        Raises:
+            ValueError: image_size が1未満の場合に発生
+
+        Returns:
+            bytes: PNG 画像のバイナリデータ
+
+        """
+        return (
+            cls.header(image_size)
+            + cls.palette(rgb)
+            + cls.body(pattern, image_size, compress_level)
+        )
+
+    @classmethod
+    def write(
+        cls,
+        stream: BinaryIO,
+        pattern: NDArray[np.integer],
+        rgb: tuple[int, int, int],
+        image_size: int = 600,
+        compress_level: int = DEFAULT_COMPRESS_LEVEL,
+    ) -> int:
+        """PNG をチャンク単位でストリームに逐次書き出す。
+
+        画像全体や PNG 全体をメモリ上に保持しないため、
+        巨大なサイズでもメモリ使用量は画像の幅に比例する程度に抑えられる。
+        書き出す内容は encode の結果と同一となる。
+
+        Args:
+            stream (BinaryIO): 書き込み可能なバイナリストリーム
+            pattern (NDArray[np.integer]): shape=(5, 5) のバイナリパターン
+            rgb (tuple[int, int, int]): アイコンの色 (0〜255の整数値x3)
+            image_size (int, optional):
+                出力画像の一辺のサイズ(ピクセル)。デフォルトは600
+            compress_level (int, optional): zlib の圧縮レベル (0-9)
+
+        Raises:
+            ValueError: image_size が1未満の場合に発生
+
+        Returns:
+            int: 書き出したバイト数
+
+        """
+        written = stream.write(cls.header(image_size) + cls.palette(rgb))
+        for chunk in cls._idat_chunks(pattern, image_size, compress_level):
+            written += stream.write(chunk)
+        written += stream.write(cls._chunk(b"IEND", b""))
+        return written
+
+    @classmethod
+    def header(cls, image_size: int) -> bytes:
+        """PNG シグネチャと IHDR チャンクを生成する。
+
+        Args:
+            image_size (int): 出力画像の一辺のサイズ(ピクセル)
+
+        Raises:
+            ValueError: image_size が1未満の場合に発生
+
+        Returns:
+            bytes: PNG シグネチャと IHDR チャンク
+
+        """
+        cls._validate_size(image_size)
+        ihdr = struct.pack(
+            ">IIBBBBB",
+            image_size,
+            image_size,
+            cls.BIT_DEPTH,
+            cls.COLOR_TYPE,
+            0,  # 圧縮方式 (deflate)
+            0,  # フィルタ方式
+            0,  # インターレースなし
+        )
+        return cls.SIGNATURE + cls._chunk(b"IHDR", ihdr)
+
+    @classmethod
+    def palette(cls, rgb: tuple[int, int, int]) -> bytes:
+        """背景の白とアイコンの色からなる PLTE チャンクを生成する。
+
+        Args:
+            rgb (tuple[int, int, int]): アイコンの色 (0〜255の整数値x3)
+
+        Returns:
+            bytes: PLTE チャンク
+
+        """
+        return cls._chunk(b"PLTE", bytes(PatternGenerator.WHITE_RGB) + bytes(rgb))
+
+    @classmethod
+    def body(
+        cls,
+        pattern: NDArray[np.integer],
+        image_size: int,
+        compress_level: int = DEFAULT_COMPRESS_LEVEL,
+    ) -> bytes:
+        """パターンから走査線を組み立てて圧縮し、IDAT・IEND チャンクを生成する。
+
+        Args:
+            pattern (NDArray[np.integer]): shape=(5, 5) のバイナリパターン
+            image_size (int): 出力画像の一辺のサイズ(ピクセル)
+            compress_level (int, optional): zlib の圧縮レベル (0-9)
+
+        Raises:
+            ValueError: image_size が1未満の場合に発生
+
+        Returns:
+            bytes: IDAT チャンクと IEND チャンク
+
+        """
+        cls._validate_size(image_size)
+        chunks = cls._idat_chunks(pattern, image_size, compress_level)
+        return b"".join(chunks) + cls._chunk(b"IEND", b"")
+
+    @classmethod
+    def _idat_chunks(
+        cls,
+        pattern: NDArray[np.integer],
+        image_size: int,
+        compress_level: int,
+    ) -> Iterator[bytes]:
+        """走査線を圧縮し、IDAT_CHUNK_SIZE ごとの IDAT チャンクを順に返す。
+
+        同じ走査線を IDAT_CHUNK_SIZE 程度にまとめて圧縮器に渡すため、
+        一度に保持する非圧縮データは走査線1本分か IDAT_CHUNK_SIZE の大きい方に収まる。
+
+        Args:
+            pattern (NDArray[np.integer]): shape=(5, 5) のバイナリパターン
+            image_size (int): 出力画像の一辺のサイズ(ピクセル)
+            compress_level (int): zlib の圧縮レベル (0-9)
+
+        Yields:
+            Iterator[bytes]: IDAT チャンク
+
+        """
+        compressor = zlib.compressobj(compress_level)
+        pending = bytearray()
+        for scanline, repeat in cls._scanlines(pattern, image_size):
+            batch = max(1, cls.IDAT_CHUNK_SIZE // len(scanline))
+            for start in range(0, repeat, batch):
+                pending += compressor.compress(scanline * min(batch, repeat - start))
+                if len(pending) >= cls.IDAT_CHUNK_SIZE:
+                    yield cls._chunk(b"IDAT", bytes(pending))
+                    pending.clear()
+        pending += compressor.flush()
+        yield cls._chunk(b"IDAT", bytes(pending))
+
+    @classmethod
+    def _scanlines(
+        cls,
+        pattern: NDArray[np.integer],
+        image_size: int,
+    ) -> list[tuple[bytes, int]]:
+        """パターンの各行に対応する走査線と、その行が繰り返される回数を返す。
+
+        Args:
+            pattern (NDArray[np.integer]): shape=(5, 5) のバイナリパターン
+            image_size (int): 出力画像の一辺のサイズ(ピクセル)
+
+        Returns:
+            list[tuple[bytes, int]]: (フィルタ種別を含む走査線, 繰り返し回数) のリスト
+
+        """
+        cells = cls.cell_index(pattern.shape[1], image_size)
+        rows = np.packbits(pattern[:, cells] != 0, axis=1)
+        repeats = np.bincount(cls.cell_index(pattern.shape[0], image_size))
+
+        # 各走査線の先頭はフィルタ種別 (0: None)
+        return [
+            (b"\x00" + row.tobytes(), int(repeat))
+            for row, repeat in zip(rows, repeats, strict=False)
+            if repeat
+        ]
+
+    @classmethod
+    def cell_index(cls, cells: int, image_size: int) -> NDArray[np.intp]:
+        """各画素が参照するパターンのセル番号を返す (Pillow の NEAREST と同じ割り当て)
+
+        Args:
+            cells (int): パターンのセル数
+            image_size (int): 出力画像の一辺のサイズ(ピクセル)
+
+        Returns:
+            NDArray[np.intp]: shape=(image_size,) のセル番号の配列
+
+        """
+        return ((np.arange(image_size) + 0.5) * (cells / image_size)).astype(np.intp)
+
+    @classmethod
+    def _chunk(cls, chunk_type: bytes, data: bytes) -> bytes:
+        """長さと CRC を付与した PNG チャンクを生成する。
+
+        Args:
+            chunk_type (bytes): チャンク種別 (4バイト)
+            data (bytes): チャンクデータ
+
+        Returns:
+            bytes: PNG チャンク
+
+        """
+        crc = zlib.crc32(data, zlib.crc32(chunk_type))
+        return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", crc)
+
+    @classmethod
+    def _validate_size(cls, image_size: int) -> None:
+        """画像サイズが1以上であることを検証する。
+
+        Args:
+            image_size (int): 出力画像の一辺のサイズ(ピクセル)
+
+        Raises:
+            ValueError: image_size が1未満の場合に発生
+
+        """
+        if image_size < 1:
+            message = ErrorMessages.INVALID_IMAGE_SIZE.value
+            raise ValueError(message)
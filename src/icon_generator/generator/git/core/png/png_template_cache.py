@@ -0,0 +1,181 @@
+"""PNGTemplateCacheモジュール:
+
+パターンと画像サイズごとに圧縮済みの PNG データをキャッシュし、
+PLTE チャンクの差し替えのみでアイデンティコンの PNG を生成する機能を提供します。
+"""
+# png_template_cache.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import threading
+from collections import OrderedDict
+from typing import ClassVar
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .palette_png_writer import PalettePNGWriter
+
+# (パターンの形状, 全セルを packbits したバイト列, 画像サイズ, 圧縮レベル)
+TemplateKey = tuple[tuple[int, ...], bytes, int, int]
+
+
+class PNGTemplateCache:
+    """パレット形式 PNG のテンプレートをパターン・画像サイズごとに保持するキャッシュ。
+
+    パレット形式の PNG では色の情報は PLTE チャンクにのみ含まれるため、
+    シグネチャ・IHDR と IDAT・IEND をキャッシュしておけば、
+    新しい色の PLTE チャンクを挟み込むだけで圧縮処理なしに PNG を生成できる。
+    保持するデータ (シグネチャ・IHDR と IDAT・IEND) の合計バイト数が上限を
+    超えた場合は、IconMemoryCache と同じく最も長く使われていないエントリから
+    破棄する。上限を超える単一のテンプレートは保持しない。
+    キーにはパターンの形状と全セルを用いるため、左右対称でないパターンも
+    互いに区別される (PatternGenerator.to_bits は左3列のみを表す)
+
+    Attributes:
+        DEFAULT_MAX_BYTES (int): 合計バイト数の上限の既定値 (8MiB)
+        max_bytes (int): 保持するデータの合計バイト数の上限 (0 の場合はキャッシュしない)
+        current_bytes (int): 保持しているデータの合計バイト数
+        hits (int): キャッシュヒット数
+        misses (int): キャッシュミス数
+
+    Methods:
+        render(pattern, rgb, image_size) -> bytes:
+            キャッシュを利用してパレット形式 PNG を生成する。
+
+        clear() -> None:
+            全てのエントリとカウンタを破棄する。
+
+        get_default() -> PNGTemplateCache:
+            プロセス内で共有する既定のキャッシュを取得する。
+
+    """
+
+    DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+
+    _default: ClassVar["PNGTemplateCache | None"] = None
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """PNGTemplateCacheのコンストラクタ。
+
+        Args:
+            max_bytes (int, optional): 保持するデータの合計バイト数の上限 (既定は8MiB)
+
+        """
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[TemplateKey, tuple[bytes, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """保持しているエントリ数を返す。
+
+        Returns:
+            int: エントリ数
+
+        """
+        return len(self._entries)
+
+    def render(
+        self,
+        pattern: NDArray[np.integer],
+        rgb: tuple[int, int, int],
+        image_size: int = 600,
+        compress_level: int = PalettePNGWriter.DEFAULT_COMPRESS_LEVEL,
+    ) -> bytes:
+        """キャッシュを利用してパレット形式 PNG のバイナリデータを生成する。
+
+        Args:
+            pattern (NDArray[np.integer]): shape=(5, 5) のバイナリパターン
+            rgb (tuple[int, int, int]): アイコンの色 (0〜255の整数値x3)
+            image_size (int, optional):
+                出力画像の一辺のサイズ(ピクセル)。デフォルトは600
+            compress_level (int, optional): zlib の圧縮レベル (0-9)
+
+        Raises:
+            ValueError: image_size が1未満の場合に発生
+
+        Returns:
+            bytes: PalettePNGWriter.encode と同一の PNG 画像のバイナリデータ
+
+        """
+        cells = np.asarray(pattern) != 0
+        key = (cells.shape, np.packbits(cells).tobytes(), image_size, compress_level)
+
+        with self._lock:
+            template = self._entries.get(key)
+            if template is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if template is None:
+            template = (
+                PalettePNGWriter.header(image_size),
+                PalettePNGWriter.body(pattern, image_size, compress_level),
+            )
+            self._store(key, template)
+
+        header, body = template
+        return header + PalettePNGWriter.palette(rgb) + body
+
+    def clear(self) -> None:
+        """全てのエントリとカウンタを破棄する。"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def _store(self, key: TemplateKey, template: tuple[bytes, bytes]) -> None:
+        """エントリを追加し、上限を超えた古いエントリを破棄する。
+
+        Args:
+            key (TemplateKey):
+                (パターンの形状, 全セルのビット列, 画像サイズ, 圧縮レベル)
+            template (tuple[bytes, bytes]): (シグネチャ・IHDR, IDAT・IEND)
+
+        """
+        size = sum(map(len, template))
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= sum(map(len, previous))
+
+            self._entries[key] = template
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= sum(map(len, evicted))
+
+    @classmethod
+    def get_default(cls) -> "PNGTemplateCache":
+        """プロセス内で共有する既定のキャッシュを取得する。
+
+        Returns:
+            PNGTemplateCache: 既定の PNGTemplateCache
+
+        """
+        if cls._default is None:
+            cls._default = PNGTemplateCache()
+        return cls._default
+
+    @classmethod
+    def set_default(cls, cache: "PNGTemplateCache | None") -> None:
+        """プロセス内で共有する既定のキャッシュを設定する。
+
+        Args:
+            cache (PNGTemplateCache | None):
+                既定とする PNGTemplateCache。None の場合は次回取得時に再生成
+
+        """
+        cls._default = cache
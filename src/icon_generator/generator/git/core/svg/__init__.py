@@ -0,0 +1,10 @@
+"""SVG writer package."""
+# __init__.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+from .svg_writer import SVGWriter
+
+__all__ = ["SVGWriter"]
@@ -0,0 +1,153 @@
+"""SVGWriterモジュール:
+
+アイデンティコンのパターンとRGBカラーから、隣接するセルを矩形にまとめた
+SVG 画像を生成する機能を提供します。
+"""
+# svg_writer.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import numpy as np
+from numpy.typing import NDArray
+
+from icon_generator.errors import ErrorMessages
+from icon_generator.generator.git.core.pattern import PatternGenerator
+
+
+class SVGWriter:
+    """2色のアイデンティコンを SVG として書き出すクラス。
+
+    座標系はパターンのセル単位 (viewBox="0 0 5 5") とし、
+    背景の白の矩形と、塗るセルを矩形にまとめた1つの path のみを出力する。
+    矩形は各行で横に連続するセルをまとめ、さらに同じ位置・幅の矩形が
+    縦に連続する場合はまとめるため、出力は数百バイトに収まり、
+    生成コストは表示サイズによらず一定となる。
+    shape-rendering="crispEdges" により、拡大してもセルの境界はぼやけない。
+
+    Attributes:
+        NAMESPACE (str): SVG の名前空間
+
+    Methods:
+        encode(pattern, rgb, image_size) -> bytes:
+            パターンとRGBカラーから SVG のバイナリデータを生成する。
+
+        rectangles(pattern) -> list[tuple[int, int, int, int]]:
+            塗るセルをまとめた矩形 (x, y, 幅, 高さ) のリストを返す。
+
+    """
+
+    NAMESPACE = "http://www.w3.org/2000/svg"
+
+    @classmethod
+    def encode(
+        cls,
+        pattern: NDArray[np.integer],
+        rgb: tuple[int, int, int],
+        image_size: int | None = None,
+    ) -> bytes:
+        """パターンとRGBカラーから SVG のバイナリデータ (UTF-8) を生成する。
+
+        Args:
+            pattern (NDArray[np.integer]): shape=(5, 5) のバイナリパターン
+            rgb (tuple[int, int, int]): アイコンの色 (0〜255の整数値x3)
+            image_size (int | None, optional):
+                width・height 属性に指定する表示サイズ(ピクセル)。
+                None の場合は属性を省略し、表示先の大きさに合わせて拡大縮小する
+
+        Raises:
+            ValueError: image_size が1未満の場合に発生
+
+        Returns:
+            bytes: SVG のバイナリデータ
+
+        """
+        height, width = pattern.shape
+        size = ""
+        if image_size is not None:
+            if image_size < 1:
+                message = ErrorMessages.INVALID_IMAGE_SIZE.value
+                raise ValueError(message)
+            size = f' width="{image_size}" height="{image_size}"'
+
+        path = "".join(
+            f"M{x} {y}h{w}v{h}h-{w}z" for x, y, w, h in cls.rectangles(pattern)
+        )
+        svg = (
+            f'<svg xmlns="{cls.NAMESPACE}" viewBox="0 0 {width} {height}"{size}'
+            ' shape-rendering="crispEdges">'
+            f'<rect width="{width}" height="{height}"'
+            f' fill="{cls._hex(PatternGenerator.WHITE_RGB)}"/>'
+        )
+        if path:
+            svg += f'<path fill="{cls._hex(rgb)}" d="{path}"/>'
+        return (svg + "</svg>").encode()
+
+    @classmethod
+    def rectangles(
+        cls,
+        pattern: NDArray[np.integer],
+    ) -> list[tuple[int, int, int, int]]:
+        """塗るセルを矩形にまとめ、(x, y, 幅, 高さ) のリストを返す。
+
+        Args:
+            pattern (NDArray[np.integer]): shape=(5, 5) のバイナリパターン
+
+        Returns:
+            list[tuple[int, int, int, int]]: セル単位の矩形 (x, y, 幅, 高さ) のリスト
+
+        """
+        # 上の行から続く矩形を (x, 幅) をキーとして保持し、同じ位置に続けば高さを伸ばす
+        open_rectangles: dict[tuple[int, int], list[int]] = {}
+        rectangles: list[list[int]] = []
+        for y, row in enumerate(pattern.tolist()):
+            runs = set(cls._runs(row))
+            for run in list(open_rectangles):
+                if run not in runs:
+                    del open_rectangles[run]
+            for x, w in sorted(runs):
+                if (x, w) in open_rectangles:
+                    open_rectangles[x, w][3] += 1
+                else:
+                    rectangle = [x, y, w, 1]
+                    open_rectangles[x, w] = rectangle
+                    rectangles.append(rectangle)
+
+        return [(x, y, w, h) for x, y, w, h in rectangles]
+
+    @classmethod
+    def _runs(cls, row: list[int]) -> list[tuple[int, int]]:
+        """1行のうち横に連続して塗るセルを (開始位置, 長さ) のリストで返す。
+
+        Args:
+            row (list[int]): パターンの1行
+
+        Returns:
+            list[tuple[int, int]]: (開始位置, 長さ) のリスト
+
+        """
+        runs = []
+        start = None
+        for x, cell in enumerate([*row, 0]):
+            if cell and start is None:
+                start = x
+            elif not cell and start is not None:
+                runs.append((start, x - start))
+                start = None
+        return runs
+
+    @classmethod
+    def _hex(cls, rgb: tuple[int, int, int]) -> str:
+        """RGB カラーを #rrggbb 形式の文字列に変換する。
+
+        Args:
+            rgb (tuple[int, int, int]): RGB カラー
+
+        Returns:
+            str: #rrggbb 形式の文字列
+
+        """
+        red, green, blue = rgb
+        return f"#{red:02x}{green:02x}{blue:02x}"
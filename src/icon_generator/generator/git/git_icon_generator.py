@@ -9,42 +9,683 @@ UUIDを元にアイデンティコン画像を生成する機能を提供しま
 #
 # Permission is hereby granted, free of charge, to any person obtaining a copy...
 
+import mmap
+import socket
 import uuid
-from io import BytesIO
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from functools import partial
+from io import BytesIO, RawIOBase
+from typing import TYPE_CHECKING, BinaryIO, ClassVar
 
+import numpy as np
+from numpy.typing import NDArray
 from PIL import Image, UnidentifiedImageError
 from PIL.Image import Resampling
 
 from icon_generator.errors import ErrorMessages
 from icon_generator.generator import Generator
 
-from .core.color import RGBGenerator
-from .core.pattern import PatternGenerator
+from .core.atlas import IconAtlas
+from .core.color import ColorLUT
+from .core.ico import ICOWriter
+from .core.pattern import BatchPatternGenerator, PatternGenerator
+from .core.png import PalettePNGWriter, PNGTemplateCache
+from .core.svg import SVGWriter
+
+if TYPE_CHECKING:
+    from icon_generator.bulk import AsyncIconRenderer
+    from icon_generator.encoder import ImageEncoder
+
+# 並列処理 (asyncio・multiprocessing)・キャッシュ・エンコーダ・アーカイブの
+# 各モジュールは、インポート時間を抑えるため使用するメソッド内でインポートする
 
 
 class GitIconGenerator(Generator):
     """UUIDを元にアイデンティコンを生成するクラス。
 
+    IconMemoryCache が有効な場合、generate_on_memory と
+    generate_indexed_on_memory は (パターンと RGB カラー, 画像サイズ,
+    画像フォーマット) をキーとして生成結果をキャッシュから返す。
+    IconDiskCache が有効な場合は、描画内容と RENDER_SPEC_VERSION から算出した
+    キーでディスク上のキャッシュも参照する。
+
+    インスタンスは __slots__ により15ビットのパターンと3バイトの RGB カラーのみを
+    保持し、PatternGenerator と色を適用したパターンは描画時に初めて生成して保持する。
+    色を適用したパターンのスロットは描画前は None (参照1つ分) のみを占め、描画後は
+    約200バイトの配列を保持する代わりに、generate_sizes・generate_ico などで
+    サイズごとに apply_color を再計算しない。
+    pickle 化した場合も両者を1つの整数として保存する。
+
     Attributes:
-        _identicon_pattern (PatternGenerator):
-            UUIDの一部から生成したパターンジェネレータ。
-        _color (RGBGenerator): UUIDの一部から生成したRGBカラー。
+        RENDER_SPEC_VERSION (int):
+            描画仕様のバージョン (描画結果が変わる変更を行った場合は値を上げる)
+        FORMAT_PNG (str): generate_on_memory の画像フォーマット名
+        FORMAT_INDEXED_PNG (str): generate_indexed_on_memory の画像フォーマット名
+        FORMAT_SVG (str): generate_svg の画像フォーマット名
+        ICO_SIZES (tuple[int, ...]): generate_ico で格納するイメージサイズの既定値
+        FILE_EXTENSIONS (dict[str, str]): 画像フォーマット名とファイル拡張子の対応
+        PATTERN_BITS (tuple[tuple[int, int], ...]):
+            UUID の整数値で各桁の偶奇を表すビットの位置と、パターンのビットの組
+        bits (int): UUIDの一部から生成した15ビットのパターン (PatternGenerator.to_bits)
+        rgb (tuple[int, int, int]): UUIDの一部から生成したRGBカラー
+        pattern (NDArray[np.int_]): shape=(5, 5) のバイナリパターン
 
     Methods:
         generate_on_memory() -> BytesIO:
             メモリ上にPNG形式のアイデンティコン画像を生成し、BytesIOオブジェクトで返す。
 
+        render_image(image_size: int) -> Image.Image:
+            色を適用したパターンを拡大した、エンコード前の画像を生成する。
+
+        generate_encoded(image_size, encoder) -> BytesIO:
+            アイデンティコン画像を指定したエンコーダ (プリセット) で変換する。
+
+        generate_indexed_on_memory() -> BytesIO:
+            Pillowを介さずに1ビットのパレット形式PNGを生成し、BytesIOオブジェクトで返す。
+
+        generate_sizes(image_sizes, image_format) -> dict[int, BytesIO]:
+            1つのアイデンティコンを複数のサイズで生成する。
+
+        generate_to(stream, image_size, image_format) -> int:
+            アイデンティコン画像をファイルやソケットに直接書き出す。
+
+        generate_buffer(image_size, image_format) -> memoryview:
+            アイデンティコン画像のバイナリデータをコピーせずに参照として返す。
+
+        generate_ico(image_sizes) -> BytesIO:
+            複数サイズの PNG 画像をまとめた ICO (favicon) を生成する。
+
+        generate_array(image_size: int) -> NDArray[np.uint8]:
+            アイデンティコン画像を RGB の画素配列として返す。
+
+        generate_into(buffer, image_size) -> int:
+            アイデンティコン画像の画素値を確保済みのバッファに直接書き込む。
+
+        generate_svg(image_size: int | None) -> BytesIO:
+            隣接するセルを矩形にまとめたSVG画像を生成し、BytesIOオブジェクトで返す。
+
+        generate_indexed_to_stream(stream: BinaryIO) -> int:
+            1ビットのパレット形式PNGを走査線単位で生成し、ストリームに逐次書き出す。
+
+        decode_many(uuids) -> tuple[NDArray[np.uint8], NDArray[np.uint8]]:
+            複数のUUIDからパターンとRGBカラーを一括で算出する。
+
+        generate_atlas(uuids, tile_size, columns) -> IconAtlas:
+            複数のUUIDのアイコンを1枚の PNG に並べたアトラスを生成する。
+
+        generate_bytes(unique_uuid, image_size, image_format) -> bytes:
+            UUIDから指定した画像フォーマットのバイナリデータを生成する。
+
+        agenerate_on_memory() -> BytesIO:
+            イベントループをブロックせずに generate_on_memory を実行する。
+
+        agenerate_many(uuids, image_size, image_format) -> AsyncGenerator:
+            複数のUUIDの画像を同時実行数を制限して非同期に生成する。
+
+        iter_generate(uuids, image_size, image_format, read_ahead) -> Iterator:
+            複数のUUIDの画像を1件ずつ遅延生成し、(UUID, 画像) を順に返す。
+
+        file_extension(image_format: str) -> str:
+            画像フォーマット名に対応するファイル拡張子を返す。
+
+        export_archive(uuids, stream, archive_format, image_size, ...) -> int:
+            複数のUUIDの画像を ZIP / TAR アーカイブとしてストリームに書き出す。
+
+        render_many(uuids, image_size, workers) -> list[bytes]:
+            複数のUUIDの画像をプロセスプールで並列に生成する。
+
+        render_many_threaded(uuids, image_size, workers) -> list[bytes]:
+            複数のUUIDの画像をスレッドプールで並列に生成する。
+
     """
 
+    RENDER_SPEC_VERSION = 1
+
+    FORMAT_PNG = "png"
+    FORMAT_INDEXED_PNG = "png-indexed"
+    FORMAT_SVG = "svg"
+    ICO_SIZES = (16, 32, 48, 64, 128, 256)
+    FILE_EXTENSIONS: ClassVar[dict[str, str]] = {
+        FORMAT_PNG: ".png",
+        FORMAT_INDEXED_PNG: ".png",
+        FORMAT_SVG: ".svg",
+    }
+
+    UUID_BYTES = 16
+    PATTERN_NIBBLES = slice(0, 15)
+    COLOR_BYTES = slice(12, 16)
+    COLOR_VALUE_MASK = 0x0FFFFFFF
+    COLOR_STATE_BITS = 24
+
+    # UUID.hex の i 桁目は UUID.int の上位から 4*i ビット目からのニブルで、
+    # その最下位ビットが 0 (偶数) のとき対応するパターンのセルを塗る
+    PATTERN_BITS = tuple(
+        ((31 - i) * 4, 1 << (14 - PatternGenerator.BIT_ORDER[i])) for i in range(15)
+    )
+
+    __slots__ = ("_bits", "_colored_pattern", "_pattern_generator", "_rgb")
+
     def __init__(self, unique_uuid: uuid.UUID) -> None:
         """GitIconGeneratorのコンストラクタ。
 
+        UUID.hex[:15] から PatternGenerator と同じパターンを15ビットの整数として、
+        UUID.hex[25:] から RGBGenerator と同じ RGB カラーを3バイトとして算出する。
+
         Args:
             unique_uuid (uuid.UUID): アイデンティコン生成の元となるUUID。
 
         """
-        self._identicon_pattern = PatternGenerator(unique_uuid.hex[:15])
-        self._color = RGBGenerator(unique_uuid.hex[25:])
+        value = unique_uuid.int
+        bits = 0
+        for shift, bit in self.PATTERN_BITS:
+            if not value >> shift & 1:
+                bits |= bit
+
+        self._bits = bits
+        self._rgb = bytes(
+            ColorLUT.get_default().lookup_value(value & self.COLOR_VALUE_MASK),
+        )
+        self._pattern_generator: PatternGenerator | None = None
+        self._colored_pattern: NDArray[np.uint8] | None = None
+
+    def __getstate__(self) -> int:
+        """パターンと RGB カラーを1つの整数にまとめ、pickle 化する状態として返す。
+
+        Returns:
+            int: パターンの15ビットと RGB カラーの24ビットを連結した整数
+
+        """
+        return self._bits << self.COLOR_STATE_BITS | int.from_bytes(self._rgb, "big")
+
+    def __setstate__(self, state: int) -> None:
+        """__getstate__ で得た整数から状態を復元する。
+
+        Args:
+            state (int): パターンと RGB カラーを連結した整数
+
+        """
+        color_mask = (1 << self.COLOR_STATE_BITS) - 1
+        self._bits = state >> self.COLOR_STATE_BITS
+        self._rgb = (state & color_mask).to_bytes(3, "big")
+        self._pattern_generator = None
+        self._colored_pattern = None
+
+    @property
+    def bits(self) -> int:
+        """パターンを表す15ビットの整数 (PatternGenerator.to_bits を参照)"""
+        return self._bits
+
+    @property
+    def rgb(self) -> tuple[int, int, int]:
+        """アイコンの RGB カラー (0〜255の整数値x3)"""
+        red, green, blue = self._rgb
+        return red, green, blue
+
+    @property
+    def pattern(self) -> NDArray[np.int_]:
+        """shape=(5, 5) のバイナリパターン"""
+        return self._identicon_pattern.pattern
+
+    @property
+    def _identicon_pattern(self) -> PatternGenerator:
+        """初回参照時に生成し、以降は保持する PatternGenerator"""
+        if self._pattern_generator is None:
+            self._pattern_generator = PatternGenerator.from_bits(self._bits)
+        return self._pattern_generator
+
+    @property
+    def _identicon_colors(self) -> NDArray[np.uint8]:
+        """初回参照時に apply_color で生成し、以降は保持する (5, 5, 3) のカラー配列
+
+        Raises:
+            RuntimeError: RGBの適用に失敗した際に発生
+
+        """
+        if self._colored_pattern is None:
+            try:
+                colored_pattern = self._identicon_pattern.apply_color(
+                    rgb_pattern=self.rgb,
+                )
+            except ValueError as e:
+                message = ErrorMessages.APPLY_COLOR_FAILED.value
+                raise RuntimeError(message) from e
+            self._colored_pattern = colored_pattern.astype(np.uint8)
+        return self._colored_pattern
+
+    @classmethod
+    def decode_many(
+        cls,
+        uuids: Sequence[uuid.UUID] | NDArray[np.uint8],
+    ) -> tuple[NDArray[np.uint8], NDArray[np.uint8]]:
+        """複数のUUIDからパターンとRGBカラーをベクトル演算で一括算出する。
+
+        行ごとに PatternGenerator や RGBGenerator を生成せず、
+        結果は個別に GitIconGenerator を生成した場合と一致する。
+        UUID のシーケンスを渡した場合は各 UUID のバイト列の連結のみ Python で行う。
+
+        Args:
+            uuids (Sequence[uuid.UUID] | NDArray[np.uint8]):
+                UUID のシーケンス、または shape=(N, 16) の uint8 配列 (UUID.bytes 相当)
+
+        Raises:
+            ValueError: 配列の形状・型が不正な場合に発生
+
+        Returns:
+            tuple[NDArray[np.uint8], NDArray[np.uint8]]:
+                shape=(N, 5, 5) のパターン配列と shape=(N, 3) の RGB 配列
+
+        """
+        uuid_bytes = cls._to_uuid_array(uuids)
+
+        # 1バイトを上位・下位のニブルに分解 (UUID.hex の各桁に相当)
+        nibbles = np.stack([uuid_bytes >> 4, uuid_bytes & 0x0F], axis=-1).reshape(
+            -1,
+            cls.UUID_BYTES * 2,
+        )
+        patterns = BatchPatternGenerator.from_nibbles(nibbles[:, cls.PATTERN_NIBBLES])
+
+        # UUID.hex[25:] (7桁) は末尾4バイトの下位28ビットに相当
+        color_values = (
+            np.ascontiguousarray(uuid_bytes[:, cls.COLOR_BYTES]).view(">u4")[:, 0]
+            & cls.COLOR_VALUE_MASK
+        )
+        colors = ColorLUT.get_default().from_values(color_values)
+        return patterns, colors
+
+    @classmethod
+    def _to_uuid_array(
+        cls,
+        uuids: Sequence[uuid.UUID] | NDArray[np.uint8],
+    ) -> NDArray[np.uint8]:
+        """UUID のシーケンスまたは配列を shape=(N, 16) の uint8 配列に正規化する。
+
+        Args:
+            uuids (Sequence[uuid.UUID] | NDArray[np.uint8]): UUID のシーケンスまたは配列
+
+        Raises:
+            ValueError: 配列の形状・型が不正な場合に発生
+
+        Returns:
+            NDArray[np.uint8]: shape=(N, 16) の uint8 配列
+
+        """
+        if isinstance(uuids, np.ndarray):
+            if (
+                uuids.dtype != np.uint8
+                or uuids.ndim != 2  # noqa: PLR2004
+                or uuids.shape[1] != cls.UUID_BYTES
+            ):
+                message = ErrorMessages.INVALID_UUID_ARRAY.value
+                raise ValueError(message)
+            return uuids
+
+        try:
+            joined = b"".join(unique_uuid.bytes for unique_uuid in uuids)
+        except (AttributeError, TypeError) as e:
+            message = ErrorMessages.INVALID_UUID_ARRAY.value
+            raise ValueError(message) from e
+        return np.frombuffer(joined, dtype=np.uint8).reshape(-1, cls.UUID_BYTES)
+
+    @classmethod
+    def generate_atlas(
+        cls,
+        uuids: Sequence[uuid.UUID],
+        tile_size: int = 64,
+        columns: int | None = None,
+    ) -> IconAtlas:
+        """複数のUUIDのアイコンを1枚の PNG にタイル状に並べたアトラスを生成する。
+
+        decode_many で一括算出したパターンのマスクから直接アトラスを組み立てるため、
+        アイコンごとに PNG をエンコードしない。各アイコンの座標は
+        IconAtlas.position や IconAtlas.to_json で UUID 文字列をキーに参照する。
+
+        Args:
+            uuids (Sequence[uuid.UUID]): UUID のシーケンス (この順に行優先で配置)
+            tile_size (int, optional): タイルの一辺のサイズ (デフォルトは64)
+            columns (int | None, optional):
+                列数。None の場合はアトラスが正方形に近くなる列数
+
+        Raises:
+            ValueError: UUID が空、もしくは tile_size・columns が1未満の場合に発生
+
+        Returns:
+            IconAtlas: アトラス画像とタイル座標のインデックス
+
+        """
+        patterns, colors = cls.decode_many(uuids)
+        return IconAtlas.build(
+            keys=[str(unique_uuid) for unique_uuid in uuids],
+            patterns=patterns,
+            colors=colors,
+            tile_size=tile_size,
+            columns=columns,
+        )
+
+    @classmethod
+    def generate_bytes(
+        cls,
+        unique_uuid: uuid.UUID,
+        image_size: int = 600,
+        image_format: str = FORMAT_PNG,
+    ) -> bytes:
+        """UUIDから指定した画像フォーマットのアイデンティコン画像を生成する。
+
+        スレッドやプロセスに渡しやすいよう、UUIDを受け取りバイナリデータを返す。
+
+        Args:
+            unique_uuid (uuid.UUID): アイデンティコン生成の元となるUUID
+            image_size (int, optional): イメージサイズ (デフォルトは600)
+            image_format (str, optional):
+                FORMAT_PNG・FORMAT_INDEXED_PNG・FORMAT_SVG、または
+                EncoderRegistry のプリセット名 (デフォルトは FORMAT_PNG)
+
+        Raises:
+            ValueError: 未対応の画像フォーマットの場合に発生
+            RuntimeError: 画像作成に失敗した際に発生
+
+        Returns:
+            bytes: 画像のバイナリデータ
+
+        """
+        images = cls(unique_uuid).generate_sizes([image_size], image_format)
+        return images[image_size].getvalue()
+
+    def _generate_method(self, image_format: str) -> Callable[[int], BytesIO]:
+        """画像フォーマットに対応する生成メソッドを返す。
+
+        Args:
+            image_format (str): 画像フォーマット名
+
+        Raises:
+            ValueError: 未対応の画像フォーマットの場合に発生
+
+        Returns:
+            Callable[[int], BytesIO]: イメージサイズを受け取る生成メソッド
+
+        """
+        if image_format == self.FORMAT_PNG:
+            return self.generate_on_memory
+        if image_format == self.FORMAT_INDEXED_PNG:
+            return self.generate_indexed_on_memory
+        if image_format == self.FORMAT_SVG:
+            return self.generate_svg
+        from icon_generator.encoder import EncoderRegistry  # noqa: PLC0415
+
+        if image_format in EncoderRegistry.names():
+            return partial(self.generate_encoded, encoder=image_format)
+
+        message = ErrorMessages.UNSUPPORTED_IMAGE_FORMAT.format(
+            image_format=image_format,
+        )
+        raise ValueError(message)
+
+    async def agenerate_on_memory(
+        self,
+        image_size: int = 600,
+        renderer: "AsyncIconRenderer | None" = None,
+    ) -> BytesIO:
+        """generate_on_memory を Executor で実行し、イベントループをブロックせずに待つ。
+
+        Args:
+            image_size (int, optional): イメージサイズ (デフォルトは600)
+            renderer (AsyncIconRenderer | None, optional):
+                Executor と同時実行数の上限を持つレンダラ。None の場合は既定のレンダラ
+
+        Raises:
+            RuntimeError: 画像作成に失敗した際に発生
+
+        Returns:
+            BytesIO: PNG画像のバイナリデータを保持したメモリオブジェクト
+
+        """
+        from icon_generator.bulk import AsyncIconRenderer  # noqa: PLC0415
+
+        renderer = renderer or AsyncIconRenderer.get_default()
+        result: BytesIO = await renderer.run(self.generate_on_memory, image_size)
+        return result
+
+    @classmethod
+    def agenerate_many(
+        cls,
+        uuids: Iterable[uuid.UUID] | AsyncIterable[uuid.UUID],
+        image_size: int = 600,
+        image_format: str = FORMAT_PNG,
+        renderer: "AsyncIconRenderer | None" = None,
+    ) -> AsyncGenerator[tuple[uuid.UUID, bytes]]:
+        """複数のUUIDの画像を同時実行数を制限して非同期に生成し、入力順に返す。
+
+        UUID はレンダラの同時実行数の上限までしか先読みしないため、
+        非同期イテレータで UUID を供給する側には背圧がかかる。
+
+        Args:
+            uuids (Iterable[uuid.UUID] | AsyncIterable[uuid.UUID]):
+                UUIDの反復可能オブジェクト
+            image_size (int, optional): イメージサイズ (デフォルトは600)
+            image_format (str, optional):
+                FORMAT_PNG・FORMAT_INDEXED_PNG・FORMAT_SVG、または
+                EncoderRegistry のプリセット名 (デフォルトは FORMAT_PNG)
+            renderer (AsyncIconRenderer | None, optional):
+                Executor と同時実行数の上限を持つレンダラ。None の場合は既定のレンダラ
+
+        Returns:
+            AsyncGenerator[tuple[uuid.UUID, bytes]]: (UUID, 画像のバイナリデータ)
+
+        """
+        from icon_generator.bulk import AsyncIconRenderer  # noqa: PLC0415
+
+        renderer = renderer or AsyncIconRenderer.get_default()
+        return renderer.map(cls.generate_bytes, uuids, image_size, image_format)
+
+    @classmethod
+    def iter_generate(
+        cls,
+        uuids: Iterable[uuid.UUID],
+        image_size: int = 600,
+        image_format: str = FORMAT_PNG,
+        read_ahead: int = 0,
+    ) -> Iterator[tuple[uuid.UUID, bytes]]:
+        """複数のUUIDの画像を消費されるたびに生成し、入力順に (UUID, 画像) を返す。
+
+        UUID は必要になった時点で1件ずつ取得し、結果も保持しないため、
+        データベースのカーソルのように件数が膨大な入力でもメモリ使用量は一定となる。
+        read_ahead を指定すると、消費側より最大 read_ahead 件先までの画像を
+        同数のワーカースレッドで並行して生成する (ThreadIconRenderer を参照)
+
+        Args:
+            uuids (Iterable[uuid.UUID]): UUIDの反復可能オブジェクト
+            image_size (int, optional): イメージサイズ (デフォルトは600)
+            image_format (str, optional):
+                FORMAT_PNG・FORMAT_INDEXED_PNG・FORMAT_SVG、または
+                EncoderRegistry のプリセット名 (デフォルトは FORMAT_PNG)
+            read_ahead (int, optional): 先読みする件数 (デフォルトは0で先読みしない)
+
+        Raises:
+            ValueError: read_ahead が負、もしくは未対応の画像フォーマットの場合に発生
+            RuntimeError: 画像作成に失敗した際に発生
+
+        Returns:
+            Iterator[tuple[uuid.UUID, bytes]]: (UUID, 画像のバイナリデータ)
+
+        """
+        if read_ahead < 0:
+            message = ErrorMessages.INVALID_READ_AHEAD.value
+            raise ValueError(message)
+
+        if read_ahead == 0:
+            return (
+                (unique_uuid, cls.generate_bytes(unique_uuid, image_size, image_format))
+                for unique_uuid in uuids
+            )
+
+        from icon_generator.bulk import ThreadIconRenderer  # noqa: PLC0415
+
+        renderer = ThreadIconRenderer(
+            cls.generate_bytes,
+            workers=read_ahead,
+            chunk_size=1,
+            max_pending=read_ahead + 1,
+        )
+        return renderer.imap(uuids, image_size, image_format)
+
+    @classmethod
+    def file_extension(cls, image_format: str) -> str:
+        """画像フォーマット名に対応するファイル拡張子を返す。
+
+        Args:
+            image_format (str):
+                FORMAT_PNG・FORMAT_INDEXED_PNG・FORMAT_SVG、または
+                EncoderRegistry のプリセット名
+
+        Raises:
+            ValueError: 未対応の画像フォーマットの場合に発生
+
+        Returns:
+            str: ファイル拡張子 (例: ".png")
+
+        """
+        from icon_generator.encoder import EncoderRegistry  # noqa: PLC0415
+
+        if image_format in cls.FILE_EXTENSIONS:
+            return cls.FILE_EXTENSIONS[image_format]
+        if image_format in EncoderRegistry.names():
+            return EncoderRegistry.get(image_format).extension
+
+        message = ErrorMessages.UNSUPPORTED_IMAGE_FORMAT.format(
+            image_format=image_format,
+        )
+        raise ValueError(message)
+
+    @classmethod
+    def export_archive(  # noqa: PLR0913
+        cls,
+        uuids: Iterable[uuid.UUID],
+        stream: BinaryIO,
+        archive_format: str = "zip",
+        image_size: int = 600,
+        image_format: str = FORMAT_PNG,
+        *,
+        read_ahead: int = 0,
+    ) -> int:
+        """複数のUUIDの画像を ZIP / TAR アーカイブとしてストリームに逐次書き出す。
+
+        画像は iter_generate で1件ずつ生成してすぐにアーカイブへ追加するため、
+        中間ファイルを作らず、メモリ使用量も UUID の件数によらない。
+        各エントリ名は「UUID + 拡張子」で、PNG は再圧縮せずに格納する。
+
+        Args:
+            uuids (Iterable[uuid.UUID]): UUIDの反復可能オブジェクト
+            stream (BinaryIO): 書き込み可能なバイナリストリーム (シーク不可でもよい)
+            archive_format (str, optional):
+                IconArchiveWriter.FORMAT_ZIP または FORMAT_TAR (デフォルトは ZIP)
+            image_size (int, optional): イメージサイズ (デフォルトは600)
+            image_format (str, optional):
+                FORMAT_PNG・FORMAT_INDEXED_PNG・FORMAT_SVG、または
+                EncoderRegistry のプリセット名 (デフォルトは FORMAT_PNG)
+            read_ahead (int, optional): 先読みして並行に生成する件数 (デフォルトは0)
+
+        Raises:
+            ValueError: 未対応のアーカイブ形式・画像フォーマットの場合に発生
+            RuntimeError: 画像作成に失敗した際に発生
+
+        Returns:
+            int: 書き出した画像の件数
+
+        """
+        from icon_generator.export import IconArchiveWriter  # noqa: PLC0415
+
+        extension = cls.file_extension(image_format)
+        icons = cls.iter_generate(uuids, image_size, image_format, read_ahead)
+        with IconArchiveWriter(stream, archive_format) as writer:
+            for unique_uuid, data in icons:
+                writer.add(f"{unique_uuid}{extension}", data)
+        return writer.count
+
+    @classmethod
+    def render_many(
+        cls,
+        uuids: Iterable[uuid.UUID],
+        image_size: int = 600,
+        image_format: str = FORMAT_PNG,
+        workers: int | None = None,
+        chunk_size: int = 256,
+    ) -> list[bytes]:
+        """複数のUUIDの画像をプロセスプールで並列に生成し、入力順のリストで返す。
+
+        UUID は chunk_size 件ずつワーカープロセスに渡し、生成結果は
+        共有メモリ経由で受け取る (ProcessIconRenderer を参照)
+
+        Args:
+            uuids (Iterable[uuid.UUID]): UUIDの反復可能オブジェクト
+            image_size (int, optional): イメージサイズ (デフォルトは600)
+            image_format (str, optional):
+                FORMAT_PNG・FORMAT_INDEXED_PNG・FORMAT_SVG、または
+                EncoderRegistry のプリセット名 (デフォルトは FORMAT_PNG)
+            workers (int | None, optional): ワーカープロセス数 (None の場合はCPU数)
+            chunk_size (int, optional): 1チャンクあたりの UUID 数 (既定は256)
+
+        Raises:
+            ValueError: workers・chunk_size・画像フォーマットが不正な場合に発生
+            RuntimeError: 画像作成に失敗した際に発生
+
+        Returns:
+            list[bytes]: 画像のバイナリデータのリスト
+
+        """
+        from icon_generator.bulk import ProcessIconRenderer  # noqa: PLC0415
+
+        renderer = ProcessIconRenderer(
+            cls.generate_bytes,
+            workers=workers,
+            chunk_size=chunk_size,
+        )
+        return [data for _, data in renderer.imap(uuids, image_size, image_format)]
+
+    @classmethod
+    def render_many_threaded(
+        cls,
+        uuids: Iterable[uuid.UUID],
+        image_size: int = 600,
+        image_format: str = FORMAT_PNG,
+        workers: int | None = None,
+        chunk_size: int = 32,
+    ) -> list[bytes]:
+        """複数のUUIDの画像をスレッドプールで並列に生成し、入力順のリストで返す。
+
+        zlib による圧縮や Pillow のリサイズは GIL を解放するため、
+        プロセス間の転送コストをかけずに並列化できる (ThreadIconRenderer を参照)
+
+        Args:
+            uuids (Iterable[uuid.UUID]): UUIDの反復可能オブジェクト
+            image_size (int, optional): イメージサイズ (デフォルトは600)
+            image_format (str, optional):
+                FORMAT_PNG・FORMAT_INDEXED_PNG・FORMAT_SVG、または
+                EncoderRegistry のプリセット名 (デフォルトは FORMAT_PNG)
+            workers (int | None, optional): ワーカースレッド数 (None の場合はCPU数)
+            chunk_size (int, optional): 1チャンクあたりの UUID 数 (既定は32)
+
+        Raises:
+            ValueError: workers・chunk_size・画像フォーマットが不正な場合に発生
+            RuntimeError: 画像作成に失敗した際に発生
+
+        Returns:
+            list[bytes]: 画像のバイナリデータのリスト
+
+        """
+        from icon_generator.bulk import ThreadIconRenderer  # noqa: PLC0415
+
+        renderer = ThreadIconRenderer(
+            cls.generate_bytes,
+            workers=workers,
+            chunk_size=chunk_size,
+        )
+        return [data for _, data in renderer.imap(uuids, image_size, image_format)]
 
     def generate_on_memory(self, image_size: int = 600) -> BytesIO:
         """UUIDに基づくパターンとカラーを適用したアイデンティコン画像を生成し、メモリ上にPNG形式で保持したBytesIOオブジェクトを返す。
@@ -61,22 +702,109 @@ class GitIconGenerator(Generator):
             BytesIO: PNG画像のバイナリデータを保持したメモリオブジェクト
 
         """
+        return self._generate_cached(self.FORMAT_PNG, image_size, self._render_png)
+
+    def _render_png(self, image_size: int) -> BytesIO:
+        """Pillow を用いて PNG 画像を生成する (generate_on_memory の実処理)
+
+        Args:
+            image_size (int): イメージサイズ
+
+        Raises:
+            RuntimeError: RGBの適用に失敗した際に発生
+            RuntimeError: 画像作成、もしくはメモリ保存に失敗した際に発生
+
+        Returns:
+            BytesIO: PNG画像のバイナリデータを保持したメモリオブジェクト
+
+        """
+        from icon_generator.encoder import EncoderRegistry  # noqa: PLC0415
+
+        return self._render_encoded(
+            image_size,
+            EncoderRegistry.get(EncoderRegistry.PRESET_PNG),
+        )
+
+    def render_image(self, image_size: int = 600) -> Image.Image:
+        """色を適用したパターンを NEAREST で拡大した、エンコード前の画像を生成する。
+
+        Args:
+            image_size (int, optional): イメージサイズ (デフォルトは600)
+
+        Raises:
+            RuntimeError: RGBの適用に失敗した際に発生
+            RuntimeError: 画像作成に失敗した際に発生
+
+        Returns:
+            Image.Image: RGB 形式の画像
+
+        """
+        colored_pattern = self._identicon_colors
+
         try:
-            colored_pattern = self._identicon_pattern.apply_color(
-                rgb_pattern=self._color.rgb,
-            )
-        except ValueError as e:
-            message = ErrorMessages.APPLY_COLOR_FAILED.value
+            img = Image.fromarray(colored_pattern)
+            return img.resize((image_size, image_size), resample=Resampling.NEAREST)
+        except (ValueError, OSError) as e:
+            message = ErrorMessages.IDENTICON_GENERATION_FAILED.value
             raise RuntimeError(message) from e
 
-        try:
-            # 画像作成
-            img = Image.fromarray(colored_pattern.astype("uint8"))
-            img = img.resize((image_size, image_size), resample=Resampling.NEAREST)
+    def generate_encoded(
+        self,
+        image_size: int = 600,
+        encoder: "str | ImageEncoder" = "png",
+    ) -> BytesIO:
+        """アイデンティコン画像を指定したエンコーダで変換し、BytesIOで返す。
+
+        プリセット名で指定した場合は、プリセット名とエンコーダの cache_token を
+        画像フォーマット名として有効なキャッシュを参照する
+        (同じ名前で設定の異なるエンコーダを登録し直しても古い結果を返さない)。
+
+        Args:
+            image_size (int, optional): イメージサイズ (デフォルトは600)
+            encoder (str | ImageEncoder, optional):
+                EncoderRegistry に登録されたプリセット名、またはエンコーダ
+
+        Raises:
+            ValueError: 登録されていないプリセット名の場合に発生
+            RuntimeError: 画像作成、もしくはエンコードに失敗した際に発生
 
+        Returns:
+            BytesIO: エンコードした画像のバイナリデータを保持したメモリオブジェクト
+
+        """
+        if not isinstance(encoder, str):
+            return self._render_encoded(image_size, encoder)
+
+        from icon_generator.encoder import EncoderRegistry  # noqa: PLC0415
+
+        image_encoder = EncoderRegistry.get(encoder)
+        return self._generate_cached(
+            f"{encoder}:{image_encoder.cache_token}",
+            image_size,
+            lambda size: self._render_encoded(size, image_encoder),
+        )
+
+    def _render_encoded(self, image_size: int, encoder: "ImageEncoder") -> BytesIO:
+        """render_image の画像をエンコーダで変換する (generate_encoded の実処理)
+
+        Args:
+            image_size (int): イメージサイズ
+            encoder (ImageEncoder): エンコーダ
+
+        Raises:
+            RuntimeError: RGBの適用に失敗した際に発生
+            RuntimeError: 画像作成、もしくはメモリ保存に失敗した際に発生
+
+        Returns:
+            BytesIO: エンコードした画像のバイナリデータを保持したメモリオブジェクト
+
+        """
+        img = self.render_image(image_size)
+
+        try:
             # メモリに保存
             img_io = BytesIO()
-            img.save(img_io, "PNG")
+            encoder.write(img, img_io)
             img_io.seek(0)
 
         except (ValueError, OSError, UnidentifiedImageError) as e:
@@ -85,3 +813,409 @@ class GitIconGenerator(Generator):
 
         else:
             return img_io
+
+    def generate_sizes(
+        self,
+        image_sizes: Iterable[int],
+        image_format: str = FORMAT_PNG,
+    ) -> dict[int, BytesIO]:
+        """1つのアイデンティコンを複数のサイズで生成し、サイズごとの画像を返す。
+
+        UUID の解析と色の適用は最初の1回のみ行い、各サイズでは
+        保持したカラー配列のリサイズとエンコードのみを行う。
+
+        Args:
+            image_sizes (Iterable[int]): イメージサイズの反復可能オブジェクト
+            image_format (str, optional):
+                FORMAT_PNG・FORMAT_INDEXED_PNG・FORMAT_SVG、または
+                EncoderRegistry のプリセット名 (デフォルトは FORMAT_PNG)
+
+        Raises:
+            ValueError: 未対応の画像フォーマットの場合に発生
+            RuntimeError: 画像作成に失敗した際に発生
+
+        Returns:
+            dict[int, BytesIO]: イメージサイズから画像のメモリオブジェクトへの対応
+
+        """
+        generate = self._generate_method(image_format)
+        return {image_size: generate(image_size) for image_size in image_sizes}
+
+    def generate_to(
+        self,
+        stream: BinaryIO | socket.socket,
+        image_size: int = 600,
+        image_format: str = FORMAT_PNG,
+    ) -> int:
+        """アイデンティコン画像を書き込み可能なストリーム、またはソケットに書き出す。
+
+        エンコード済みのデータを getvalue() で複製せず、memoryview のまま書き出す。
+        write が一部のみを書き込んだ場合 (FileIO などのバッファなしのストリーム) は、
+        残りを書き終えるまで write を繰り返す。
+
+        Args:
+            stream (BinaryIO | socket.socket):
+                書き込み可能なバイナリストリーム、もしくは接続済みのソケット
+            image_size (int, optional): イメージサイズ (デフォルトは600)
+            image_format (str, optional):
+                FORMAT_PNG・FORMAT_INDEXED_PNG・FORMAT_SVG、または
+                EncoderRegistry のプリセット名 (デフォルトは FORMAT_PNG)
+
+        Raises:
+            ValueError: 未対応の画像フォーマットの場合に発生
+            RuntimeError: 画像作成、もしくはストリームへの書き込みに失敗した際に発生
+
+        Returns:
+            int: 書き出したバイト数
+
+        """
+        with self.generate_buffer(image_size, image_format) as data:
+            try:
+                if isinstance(stream, socket.socket):
+                    stream.sendall(data)
+                else:
+                    self._write_all(stream, data)
+            except OSError as e:
+                message = ErrorMessages.IDENTICON_GENERATION_FAILED.value
+                raise RuntimeError(message) from e
+
+            return data.nbytes
+
+    @staticmethod
+    def _write_all(stream: BinaryIO, data: memoryview) -> None:
+        """データをすべて書き込むまで stream.write を繰り返す。
+
+        Args:
+            stream (BinaryIO): 書き込み可能なバイナリストリーム
+            data (memoryview): 書き込むデータ
+
+        Raises:
+            OSError: ノンブロッキングのストリームが書き込めない、
+                もしくは1バイトも書き込めなかった場合に発生
+
+        """
+        while data:
+            written = stream.write(data)
+            if written is None:
+                # RawIOBase の None は書き込み待ちを表す。それ以外の独自の
+                # ストリームが None を返した場合は全体を書き込んだとみなす
+                if isinstance(stream, RawIOBase):
+                    raise BlockingIOError
+                return
+            if written <= 0:
+                raise OSError
+            data = data[written:]
+
+    def generate_buffer(
+        self,
+        image_size: int = 600,
+        image_format: str = FORMAT_PNG,
+    ) -> memoryview:
+        """アイデンティコン画像のバイナリデータを、コピーせずに memoryview で返す。
+
+        生成した BytesIO の getbuffer() をそのまま返すため、新たに描画した場合は
+        bytes への変換に伴う複製が発生しない (キャッシュから返す場合は、キャッシュの
+        bytes を共有しないよう getbuffer() の際に1回複製される)。
+        返り値は bytes と同様に write や sendall に渡せる。
+
+        Args:
+            image_size (int, optional): イメージサイズ (デフォルトは600)
+            image_format (str, optional):
+                FORMAT_PNG・FORMAT_INDEXED_PNG・FORMAT_SVG、または
+                EncoderRegistry のプリセット名 (デフォルトは FORMAT_PNG)
+
+        Raises:
+            ValueError: 未対応の画像フォーマットの場合に発生
+            RuntimeError: 画像作成に失敗した際に発生
+
+        Returns:
+            memoryview: 画像のバイナリデータへの参照
+
+        """
+        return self._generate_method(image_format)(image_size).getbuffer()
+
+    def generate_ico(self, image_sizes: Iterable[int] = ICO_SIZES) -> BytesIO:
+        """複数サイズの PNG 画像を1つにまとめた ICO (favicon) を生成する。
+
+        Args:
+            image_sizes (Iterable[int], optional):
+                格納するイメージサイズ (1〜256、デフォルトは ICO_SIZES)
+
+        Raises:
+            ValueError: サイズが空、もしくは 1〜256 の範囲外の場合に発生
+            RuntimeError: 画像作成に失敗した際に発生
+
+        Returns:
+            BytesIO: ICO のバイナリデータを保持したメモリオブジェクト
+
+        """
+        # 範囲外のサイズが含まれる場合は、画像を生成する前にエラーとする
+        image_sizes = list(image_sizes)
+        ICOWriter.validate_sizes(image_sizes)
+        images = self.generate_sizes(image_sizes, self.FORMAT_PNG)
+        ico = ICOWriter.encode({size: png.getvalue() for size, png in images.items()})
+        return BytesIO(ico)
+
+    def generate_indexed_on_memory(self, image_size: int = 600) -> BytesIO:
+        """アイデンティコン画像を1ビットのパレット形式PNGとして生成し、BytesIOで返す。
+
+        Pillow によるリサイズ・エンコードを行わず、5x5 のパターンから走査線を
+        直接組み立てるため、generate_on_memory と同じ画素の画像を
+        より高速かつ小さいファイルサイズで生成する。
+        圧縮済みのデータは PNGTemplateCache の既定キャッシュに保持され、
+        同じパターン・サイズの2回目以降は PLTE チャンクの差し替えのみで生成する。
+
+        Args:
+            image_size (int, optional):
+                イメージサイズ (デフォルトは600)
+
+        Raises:
+            RuntimeError: 画像作成に失敗した際に発生
+
+        Returns:
+            BytesIO: PNG画像のバイナリデータを保持したメモリオブジェクト
+
+        """
+        return self._generate_cached(
+            self.FORMAT_INDEXED_PNG,
+            image_size,
+            self._render_indexed,
+        )
+
+    def _render_indexed(self, image_size: int) -> BytesIO:
+        """パレット形式 PNG を生成する (generate_indexed_on_memory の実処理)
+
+        Args:
+            image_size (int): イメージサイズ
+
+        Raises:
+            RuntimeError: 画像作成に失敗した際に発生
+
+        Returns:
+            BytesIO: PNG画像のバイナリデータを保持したメモリオブジェクト
+
+        """
+        try:
+            png = PNGTemplateCache.get_default().render(
+                pattern=self.pattern,
+                rgb=self.rgb,
+                image_size=image_size,
+            )
+        except ValueError as e:
+            message = ErrorMessages.IDENTICON_GENERATION_FAILED.value
+            raise RuntimeError(message) from e
+
+        return BytesIO(png)
+
+    def _generate_cached(
+        self,
+        image_format: str,
+        image_size: int,
+        render: Callable[[int], BytesIO],
+    ) -> BytesIO:
+        """有効なキャッシュがあれば参照し、なければ render で画像を生成する。
+
+        プロセス内の IconMemoryCache、ディスク上の IconDiskCache の順に参照し、
+        ディスクから読み込んだ結果や新たに生成した結果は有効な各キャッシュに格納する。
+
+        Args:
+            image_format (str): 画像フォーマット名
+            image_size (int): イメージサイズ
+            render (Callable[[int], BytesIO]): 画像を生成する関数
+
+        Returns:
+            BytesIO: 画像のバイナリデータを保持したメモリオブジェクト
+
+        """
+        from icon_generator.cache import IconDiskCache, IconMemoryCache  # noqa: PLC0415
+
+        memory_cache = IconMemoryCache.get_active()
+        disk_cache = IconDiskCache.get_active()
+        if memory_cache is None and disk_cache is None:
+            return render(image_size)
+
+        memory_key = (self.__getstate__(), image_size, image_format)
+        if memory_cache is not None:
+            data = memory_cache.get(memory_key)
+            if data is not None:
+                return BytesIO(data)
+
+        disk_key = None
+        data = None
+        if disk_cache is not None:
+            disk_key = IconDiskCache.make_key(
+                pattern_bits=self._bits,
+                rgb=self.rgb,
+                image_size=image_size,
+                image_format=image_format,
+                render_spec_version=self.RENDER_SPEC_VERSION,
+            )
+            data = disk_cache.get(disk_key)
+
+        if data is None:
+            data = render(image_size).getvalue()
+            if disk_cache is not None and disk_key is not None:
+                disk_cache.put(disk_key, data)
+
+        if memory_cache is not None:
+            memory_cache.put(memory_key, data)
+        return BytesIO(data)
+
+    def generate_array(self, image_size: int = 600) -> NDArray[np.uint8]:
+        """アイデンティコン画像を PNG にエンコードせず、RGB の画素配列として返す。
+
+        Args:
+            image_size (int, optional): イメージサイズ (デフォルトは600)
+
+        Raises:
+            ValueError: image_size が1未満の場合に発生
+            RuntimeError: RGBの適用に失敗した際に発生
+
+        Returns:
+            NDArray[np.uint8]: shape=(image_size, image_size, 3) の画素配列
+
+        """
+        raster = np.empty((image_size, image_size, 3), dtype=np.uint8)
+        self.generate_into(raster, image_size)
+        return raster
+
+    def generate_into(
+        self,
+        buffer: NDArray[np.uint8] | bytearray | memoryview | mmap.mmap,
+        image_size: int = 600,
+    ) -> int:
+        """アイデンティコン画像の RGB の画素値を、確保済みのバッファに直接書き込む。
+
+        PNG のエンコード・デコードや画像全体の一時配列を経由せず、
+        色を適用した 5x5 のパターンを NEAREST と同じ割り当てで拡大しながら書き込む。
+        NumPy 配列を渡す場合は shape=(image_size, image_size, 3) であればよく、
+        合成先の大きな画像の一部 (canvas[y:y + s, x:x + s]) のような
+        連続していないビューにもそのまま描画できる。
+        それ以外のバッファは先頭から image_size * image_size * 3 バイトに
+        行優先の RGB で書き込む。
+
+        Args:
+            buffer (NDArray[np.uint8] | bytearray | memoryview | mmap.mmap):
+                書き込み可能なバッファ
+            image_size (int, optional): イメージサイズ (デフォルトは600)
+
+        Raises:
+            ValueError: image_size が1未満、もしくはバッファが書き込み不可・不足の場合
+            RuntimeError: RGBの適用に失敗した際に発生
+
+        Returns:
+            int: 書き込んだバイト数
+
+        """
+        if image_size < 1:
+            message = ErrorMessages.INVALID_IMAGE_SIZE.value
+            raise ValueError(message)
+
+        target = self._raster_view(buffer, image_size)
+        colored_pattern = self._identicon_colors
+        height, width = colored_pattern.shape[:2]
+        rows = PalettePNGWriter.cell_index(height, image_size)
+        columns = PalettePNGWriter.cell_index(width, image_size)
+        np.take(colored_pattern[rows], columns, axis=1, out=target)
+        return target.nbytes
+
+    @classmethod
+    def _raster_view(
+        cls,
+        buffer: NDArray[np.uint8] | bytearray | memoryview | mmap.mmap,
+        image_size: int,
+    ) -> NDArray[np.uint8]:
+        """バッファを shape=(image_size, image_size, 3) の配列として参照する。
+
+        Args:
+            buffer (NDArray[np.uint8] | bytearray | memoryview | mmap.mmap):
+                書き込み可能なバッファ
+            image_size (int): イメージサイズ
+
+        Raises:
+            ValueError: バッファが書き込み不可、もしくは形状・大きさが不足する場合に発生
+
+        Returns:
+            NDArray[np.uint8]: バッファを参照する配列 (コピーではない)
+
+        """
+        shape = (image_size, image_size, 3)
+        message = ErrorMessages.INVALID_RASTER_BUFFER.format(size=image_size)
+        if isinstance(buffer, np.ndarray):
+            if (
+                buffer.dtype != np.uint8
+                or buffer.shape != shape
+                or not buffer.flags.writeable
+            ):
+                raise ValueError(message)
+            return buffer
+
+        try:
+            view = np.frombuffer(buffer, dtype=np.uint8, count=int(np.prod(shape)))
+        except (TypeError, ValueError) as e:
+            raise ValueError(message) from e
+        if not view.flags.writeable:
+            raise ValueError(message)
+        return view.reshape(shape)
+
+    def generate_svg(self, image_size: int | None = None) -> BytesIO:
+        """アイデンティコン画像を、隣接するセルを矩形にまとめたSVGとして生成する。
+
+        パターンから直接 SVG を組み立てるため、出力は数百バイトに収まり、
+        生成コストは表示サイズによらず一定となる (SVGWriter を参照)
+
+        Args:
+            image_size (int | None, optional):
+                width・height 属性に指定する表示サイズ。None の場合は省略する
+
+        Raises:
+            RuntimeError: 画像作成に失敗した際に発生
+
+        Returns:
+            BytesIO: SVG画像のバイナリデータ (UTF-8) を保持したメモリオブジェクト
+
+        """
+        try:
+            svg = SVGWriter.encode(
+                pattern=self.pattern,
+                rgb=self.rgb,
+                image_size=image_size,
+            )
+        except ValueError as e:
+            message = ErrorMessages.IDENTICON_GENERATION_FAILED.value
+            raise RuntimeError(message) from e
+
+        return BytesIO(svg)
+
+    def generate_indexed_to_stream(
+        self,
+        stream: BinaryIO,
+        image_size: int = 600,
+    ) -> int:
+        """アイデンティコン画像を1ビットのパレット形式PNGとしてストリームに書き出す。
+
+        画像や PNG 全体をメモリ上に構築せず、圧縮したチャンクを逐次書き出すため、
+        印刷用の巨大なサイズでもメモリ使用量は画像の幅に比例する程度に抑えられる。
+
+        Args:
+            stream (BinaryIO): 書き込み可能なバイナリストリーム
+            image_size (int, optional):
+                イメージサイズ (デフォルトは600)
+
+        Raises:
+            RuntimeError: 画像作成、もしくはストリームへの書き込みに失敗した際に発生
+
+        Returns:
+            int: 書き出したバイト数
+
+        """
+        try:
+            return PalettePNGWriter.write(
+                stream=stream,
+                pattern=self.pattern,
+                rgb=self.rgb,
+                image_size=image_size,
+            )
+        except (ValueError, OSError) as e:
+            message = ErrorMessages.IDENTICON_GENERATION_FAILED.value
+            raise RuntimeError(message) from e
@@ -0,0 +1,82 @@
+"""LazyAttributesモジュール:
+
+パッケージの属性を初回参照時にインポートし、NumPy や Pillow などの
+重いモジュールの読み込みを実際に使用されるまで遅延させる機能を提供します。
+"""
+# lazy_import.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import importlib
+import sys
+from collections.abc import Mapping
+
+
+class LazyAttributes:
+    """パッケージのモジュール __getattr__ から属性を遅延インポートするクラス。
+
+    パッケージの __init__.py で生成し、モジュールの __getattr__ と __dir__ から
+    呼び出す。解決した属性はパッケージの名前空間に格納するため、
+    2回目以降の参照では __getattr__ を経由しない。
+
+    Attributes:
+        package (str): 属性を公開するパッケージ名
+        attributes (Mapping[str, str]):
+            属性名と、その属性を定義するモジュール名 (相対インポート可) の対応
+
+    Methods:
+        resolve(name: str) -> object:
+            属性をインポートして返す。
+
+        names(namespace: Mapping[str, object]) -> list[str]:
+            パッケージの名前空間と遅延属性の名前を合わせて返す。
+
+    """
+
+    def __init__(self, package: str, attributes: Mapping[str, str]) -> None:
+        """LazyAttributesのコンストラクタ。
+
+        Args:
+            package (str): 属性を公開するパッケージ名 (__name__)
+            attributes (Mapping[str, str]): 属性名とモジュール名の対応
+
+        """
+        self.package = package
+        self.attributes = attributes
+
+    def resolve(self, name: str) -> object:
+        """属性を定義するモジュールをインポートし、属性を返す。
+
+        Args:
+            name (str): 属性名
+
+        Raises:
+            AttributeError: 遅延インポートの対象ではない属性の場合に発生
+
+        Returns:
+            object: 属性の値
+
+        """
+        module_name = self.attributes.get(name)
+        if module_name is None:
+            message = f"module {self.package!r} has no attribute {name!r}"
+            raise AttributeError(message)
+
+        value = getattr(importlib.import_module(module_name, self.package), name)
+        setattr(sys.modules[self.package], name, value)
+        return value
+
+    def names(self, namespace: Mapping[str, object]) -> list[str]:
+        """パッケージの名前空間と遅延属性の名前を合わせて返す (__dir__ 用)
+
+        Args:
+            namespace (Mapping[str, object]): パッケージの globals()
+
+        Returns:
+            list[str]: ソート済みの属性名のリスト
+
+        """
+        return sorted({*namespace, *self.attributes})
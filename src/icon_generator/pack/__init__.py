@@ -0,0 +1,10 @@
+"""Icon pack package."""
+# __init__.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+from .icon_pack import IconPackBuilder, IconPackFormat, IconPackReader
+
+__all__ = ["IconPackBuilder", "IconPackFormat", "IconPackReader"]
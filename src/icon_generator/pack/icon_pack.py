@@ -0,0 +1,506 @@
+"""IconPackモジュール:
+
+多数の生成済みアイコン画像を1つのファイルにまとめたアイコンパックの
+作成と、メモリマップによる読み込みの機能を提供します。
+"""
+# icon_pack.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import contextlib
+import mmap
+import os
+import struct
+import uuid
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO, Self
+
+from icon_generator.errors import ErrorMessages
+
+
+class IconPackFormat:
+    """アイコンパックのファイル形式を定義するクラス。
+
+    ファイルはヘッダ・画像データ・インデックスの順に並ぶ (数値は全てリトルエンディアン)
+
+    - ヘッダ: マジック (8バイト)・バージョン・予約・エントリ数・スロット数・
+      インデックスの開始位置
+    - 画像データ: 各アイコンのバイナリデータを連結したもの
+    - インデックス: UUID をキーとするオープンアドレス法のハッシュテーブル。
+      各スロットは (UUID 16バイト, 開始位置, 長さ) で、長さ0は空きスロットを表す
+
+    スロット数はエントリ数の2倍以上の2のべき乗とし、線形探査で衝突を解決するため、
+    検索は平均して定数回のスロット参照で完了する。
+
+    Attributes:
+        MAGIC (bytes): ファイル先頭のマジックナンバー
+        VERSION (int): ファイル形式のバージョン
+        HEADER (struct.Struct): ヘッダの構造
+        SLOT (struct.Struct): インデックスの各スロットの構造
+
+    Methods:
+        slot_count(entries: int) -> int:
+            エントリ数からハッシュテーブルのスロット数を算出する。
+
+        home_slot(key: bytes, mask: int) -> int:
+            UUID のバイト列から探査を開始するスロット番号を算出する。
+
+    """
+
+    MAGIC = b"ICONPACK"
+    VERSION = 1
+    HEADER = struct.Struct("<8sHHIQQ")
+    SLOT = struct.Struct("<16sQQ")
+
+    @classmethod
+    def slot_count(cls, entries: int) -> int:
+        """エントリ数からハッシュテーブルのスロット数を算出する。
+
+        Args:
+            entries (int): エントリ数
+
+        Returns:
+            int: エントリ数の2倍以上の2のべき乗
+
+        """
+        return 1 << max(1, (entries * 2 - 1).bit_length())
+
+    @classmethod
+    def home_slot(cls, key: bytes, mask: int) -> int:
+        """UUID のバイト列から探査を開始するスロット番号を算出する。
+
+        Args:
+            key (bytes): UUID のバイト列 (16バイト)
+            mask (int): スロット数 - 1
+
+        Returns:
+            int: スロット番号
+
+        """
+        return (
+            int.from_bytes(key[:8], "little") ^ int.from_bytes(key[8:], "little")
+        ) & mask
+
+
+class IconPackBuilder:
+    """アイコンパックを作成するクラス。
+
+    画像データは追加するたびに出力先と同じディレクトリの一時ファイルへ書き出し、
+    メモリ上にはインデックスのみを保持する。close 時にインデックスとヘッダを
+    書き込んで fsync してから os.replace で出力先に配置するため、読み込み側が
+    作成途中のファイルを開くことはなく、電源断の後も不完全なファイルが残らない。
+    一時ファイルは open と同じく umask に従うパーミッション (0o666 & ~umask) で
+    作成する (tempfile.mkstemp の 0o600 では他のユーザーが読み込めないため)
+
+    Attributes:
+        path (Path): 出力先のパス
+
+    Methods:
+        add(unique_uuid: uuid.UUID, data: bytes) -> None:
+            アイコン画像を追加する。
+
+        add_many(icons: Iterable[tuple[uuid.UUID, bytes]]) -> None:
+            複数のアイコン画像を追加する。
+
+        close() -> None:
+            インデックスを書き込み、アイコンパックを出力先に配置する。
+
+        abort() -> None:
+            作成を中止し、一時ファイルを削除する。
+
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """IconPackBuilderのコンストラクタ。
+
+        Args:
+            path (str | os.PathLike[str]): 出力先のパス
+
+        """
+        self.path = Path(path)
+        self._entries: dict[bytes, tuple[int, int]] = {}
+
+        self._temp_path = self.path.parent / f".tmp-{uuid.uuid4().hex}"
+        fd = os.open(
+            self._temp_path,
+            os.O_RDWR | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0),
+            0o666,
+        )
+        self._file: BinaryIO = os.fdopen(fd, "w+b")
+        self._file.write(bytes(IconPackFormat.HEADER.size))
+
+    def __enter__(self) -> Self:
+        """コンテキストマネージャの開始。
+
+        Returns:
+            Self: IconPackBuilder自身
+
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """例外がなければアイコンパックを配置し、例外があれば作成を中止する。
+
+        Args:
+            exc_type (type[BaseException] | None): 例外の型
+            exc_value (BaseException | None): 例外
+            traceback (TracebackType | None): トレースバック
+
+        """
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def __len__(self) -> int:
+        """追加したアイコン数を返す。
+
+        Returns:
+            int: アイコン数
+
+        """
+        return len(self._entries)
+
+    def add(self, unique_uuid: uuid.UUID, data: bytes) -> None:
+        """アイコン画像を追加する。
+
+        Args:
+            unique_uuid (uuid.UUID): アイコンの UUID
+            data (bytes): アイコン画像のバイナリデータ
+
+        Raises:
+            ValueError: UUID が追加済み、もしくはデータが空の場合に発生
+
+        """
+        key = unique_uuid.bytes
+        if key in self._entries:
+            message = ErrorMessages.DUPLICATE_PACK_ENTRY.format(uuid=str(unique_uuid))
+            raise ValueError(message)
+        if not data:
+            message = ErrorMessages.EMPTY_PACK_ENTRY.value
+            raise ValueError(message)
+
+        offset = self._file.tell()
+        self._file.write(data)
+        self._entries[key] = (offset, len(data))
+
+    def add_many(self, icons: Iterable[tuple[uuid.UUID, bytes]]) -> None:
+        """複数のアイコン画像を追加する。
+
+        Args:
+            icons (Iterable[tuple[uuid.UUID, bytes]]):
+                (UUID, バイナリデータ) の反復可能オブジェクト
+
+        Raises:
+            ValueError: UUID が追加済み、もしくはデータが空の場合に発生
+
+        """
+        for unique_uuid, data in icons:
+            self.add(unique_uuid, data)
+
+    def close(self) -> None:
+        """インデックスとヘッダを書き込み、アイコンパックを出力先に配置する。
+
+        書き込みや配置に失敗した場合 (ディスクの空き不足など) は作成を中止し、
+        一時ファイルを削除してから例外を送出する。
+
+        Raises:
+            OSError: 書き込みや配置に失敗した場合に発生
+
+        """
+        if self._file.closed:
+            return
+
+        try:
+            self._commit()
+        except BaseException:
+            self.abort()
+            raise
+
+    def _commit(self) -> None:
+        """インデックスとヘッダを書き込んで fsync し、os.replace で配置する。"""
+        slots = IconPackFormat.slot_count(len(self._entries))
+        mask = slots - 1
+        table = bytearray(slots * IconPackFormat.SLOT.size)
+        occupied = [False] * slots
+        for key, (offset, length) in self._entries.items():
+            slot = IconPackFormat.home_slot(key, mask)
+            while occupied[slot]:
+                slot = (slot + 1) & mask
+            occupied[slot] = True
+            IconPackFormat.SLOT.pack_into(
+                table,
+                slot * IconPackFormat.SLOT.size,
+                key,
+                offset,
+                length,
+            )
+
+        index_offset = self._file.tell()
+        self._file.write(table)
+        self._file.seek(0)
+        self._file.write(
+            IconPackFormat.HEADER.pack(
+                IconPackFormat.MAGIC,
+                IconPackFormat.VERSION,
+                0,
+                len(self._entries),
+                slots,
+                index_offset,
+            ),
+        )
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._temp_path.replace(self.path)
+
+    def abort(self) -> None:
+        """作成を中止し、一時ファイルを削除する。"""
+        self._file.close()
+        with contextlib.suppress(OSError):
+            self._temp_path.unlink()
+
+
+class IconPackReader:
+    """アイコンパックをメモリマップで読み込むクラス。
+
+    get で返すデータはメモリマップの memoryview スライスでコピーを伴わず、
+    同じファイルを開いた複数のプロセスはページキャッシュを共有する。
+    close の前に、取得した memoryview を全て解放する必要がある。
+
+    Attributes:
+        path (Path): アイコンパックのパス
+
+    Methods:
+        get(unique_uuid: uuid.UUID) -> memoryview | None:
+            UUID に対応するアイコン画像を取得する。
+
+        keys() -> Iterator[uuid.UUID]:
+            格納されている UUID を順に返す。
+
+        close() -> None:
+            メモリマップを閉じる。
+
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """IconPackReaderのコンストラクタ。
+
+        Args:
+            path (str | os.PathLike[str]): アイコンパックのパス
+
+        Raises:
+            ValueError: アイコンパックの形式ではない場合に発生
+
+        """
+        self.path = Path(path)
+        with self.path.open("rb") as file:
+            try:
+                self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                message = ErrorMessages.INVALID_ICON_PACK.format(path=str(path))
+                raise ValueError(message) from e
+        self._view = memoryview(self._mmap)
+
+        if not self._is_valid_header():
+            self.close()
+            message = ErrorMessages.INVALID_ICON_PACK.format(path=str(path))
+            raise ValueError(message)
+
+        _, _, _, count, slots, index_offset = IconPackFormat.HEADER.unpack_from(
+            self._view,
+        )
+        self._count = count
+        self._slots = slots
+        self._mask = slots - 1
+        self._index_offset = index_offset
+
+    def __enter__(self) -> Self:
+        """コンテキストマネージャの開始。
+
+        Returns:
+            Self: IconPackReader自身
+
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """メモリマップを閉じる。
+
+        Args:
+            exc_type (type[BaseException] | None): 例外の型
+            exc_value (BaseException | None): 例外
+            traceback (TracebackType | None): トレースバック
+
+        """
+        self.close()
+
+    def __len__(self) -> int:
+        """格納されているアイコン数を返す。
+
+        Returns:
+            int: アイコン数
+
+        """
+        return self._count
+
+    def __contains__(self, unique_uuid: object) -> bool:
+        """UUID に対応するアイコン画像が格納されているかを返す。
+
+        Args:
+            unique_uuid (object): UUID
+
+        Returns:
+            bool: 格納されている場合は True
+
+        """
+        return (
+            isinstance(unique_uuid, uuid.UUID) and self._find(unique_uuid) is not None
+        )
+
+    def __getitem__(self, unique_uuid: uuid.UUID) -> memoryview:
+        """UUID に対応するアイコン画像を取得する。
+
+        Args:
+            unique_uuid (uuid.UUID): UUID
+
+        Raises:
+            KeyError: UUID が格納されていない場合に発生
+
+        Returns:
+            memoryview: アイコン画像のバイナリデータ
+
+        """
+        data = self.get(unique_uuid)
+        if data is None:
+            raise KeyError(unique_uuid)
+        return data
+
+    def get(self, unique_uuid: uuid.UUID) -> memoryview | None:
+        """UUID に対応するアイコン画像をメモリマップのスライスとして取得する。
+
+        Args:
+            unique_uuid (uuid.UUID): UUID
+
+        Raises:
+            ValueError: インデックスが画像データの範囲外を指している場合に発生
+
+        Returns:
+            memoryview | None: アイコン画像のバイナリデータ。存在しない場合は None
+
+        """
+        location = self._find(unique_uuid)
+        if location is None:
+            return None
+
+        offset, length = location
+        return self._view[offset : offset + length]
+
+    def keys(self) -> Iterator[uuid.UUID]:
+        """格納されている UUID をインデックスの順に返す。
+
+        Yields:
+            Iterator[uuid.UUID]: UUID
+
+        """
+        for slot in range(self._slots):
+            key, _, length = self._slot(slot)
+            if length:
+                yield uuid.UUID(bytes=key)
+
+    def close(self) -> None:
+        """メモリマップを閉じる。
+
+        Raises:
+            BufferError: get で取得した memoryview が解放されていない場合に発生
+
+        """
+        self._view.release()
+        self._mmap.close()
+
+    def _is_valid_header(self) -> bool:
+        """ヘッダのマジックナンバー・バージョンとインデックスの範囲を検証する。
+
+        Returns:
+            bool: 有効なアイコンパックの場合は True
+
+        """
+        if len(self._view) < IconPackFormat.HEADER.size:
+            return False
+
+        magic, version, _, count, slots, index_offset = (
+            IconPackFormat.HEADER.unpack_from(self._view)
+        )
+        return (
+            magic == IconPackFormat.MAGIC
+            and version == IconPackFormat.VERSION
+            and slots == IconPackFormat.slot_count(count)
+            and index_offset >= IconPackFormat.HEADER.size
+            and index_offset + slots * IconPackFormat.SLOT.size <= len(self._view)
+        )
+
+    def _find(self, unique_uuid: uuid.UUID) -> tuple[int, int] | None:
+        """ハッシュテーブルを線形探査し、画像データの位置を返す。
+
+        破損したファイルで空きスロットがない場合も終了するよう、
+        探査はスロット数までに限る。
+
+        Args:
+            unique_uuid (uuid.UUID): UUID
+
+        Raises:
+            ValueError: インデックスが画像データの範囲外を指している場合に発生
+
+        Returns:
+            tuple[int, int] | None: (開始位置, 長さ)。存在しない場合は None
+
+        """
+        target = unique_uuid.bytes
+        slot = IconPackFormat.home_slot(target, self._mask)
+        for _ in range(self._slots):
+            key, offset, length = self._slot(slot)
+            if not length:
+                return None
+            if key == target:
+                if (
+                    offset < IconPackFormat.HEADER.size
+                    or offset + length > self._index_offset
+                ):
+                    message = ErrorMessages.CORRUPT_PACK_ENTRY.format(
+                        path=str(self.path),
+                        uuid=str(unique_uuid),
+                    )
+                    raise ValueError(message)
+                return offset, length
+            slot = (slot + 1) & self._mask
+        return None
+
+    def _slot(self, slot: int) -> tuple[bytes, int, int]:
+        """スロットの内容を読み込む。
+
+        Args:
+            slot (int): スロット番号
+
+        Returns:
+            tuple[bytes, int, int]: (UUID のバイト列, 開始位置, 長さ)
+
+        """
+        return IconPackFormat.SLOT.unpack_from(
+            self._view,
+            self._index_offset + slot * IconPackFormat.SLOT.size,
+        )
@@ -0,0 +1,65 @@
+"""python -m icon_generator.serve でアバター配信サーバーを起動するモジュール。"""
+# __main__.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import argparse
+from collections.abc import Sequence
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import WSGIServer, make_server
+
+from icon_generator.cache import enable_memory_cache
+
+from .avatar_app import AvatarApp
+
+
+class ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    """リクエストごとにスレッドを割り当てる WSGI サーバー。"""
+
+    daemon_threads = True
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """コマンドライン引数に従ってアバター配信サーバーを起動する。
+
+    Args:
+        argv (Sequence[str] | None, optional):
+            コマンドライン引数。None の場合は sys.argv を使用する
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m icon_generator.serve",
+        description="Serve identicons at /<uuid>.png?size=N with ETag support.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--default-size", type=int, default=AvatarApp.DEFAULT_SIZE)
+    parser.add_argument("--max-size", type=int, default=AvatarApp.MAX_SIZE)
+    parser.add_argument(
+        "--memory-cache",
+        type=int,
+        default=0,
+        metavar="BYTES",
+        help="enable the in-process icon cache with the given capacity",
+    )
+    args = parser.parse_args(argv)
+
+    app = AvatarApp(default_size=args.default_size, max_size=args.max_size)
+    if args.memory_cache > 0:
+        enable_memory_cache(max_bytes=args.memory_cache)
+
+    with make_server(
+        args.host,
+        args.port,
+        app,
+        server_class=ThreadingWSGIServer,
+    ) as server:
+        print(f"Serving identicons on http://{args.host}:{args.port}/")
+        server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
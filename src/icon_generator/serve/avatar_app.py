@@ -0,0 +1,362 @@
+"""AvatarAppモジュール:
+
+UUID ごとのアイデンティコン画像を HTTP で配信する、外部依存のない
+WSGI / ASGI アプリケーションを提供します。
+"""
+# avatar_app.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import asyncio
+import hashlib
+import uuid
+import zlib
+from collections.abc import Awaitable, Callable, Iterable, MutableMapping
+from http import HTTPStatus
+from typing import Any, ClassVar, NamedTuple
+from urllib.parse import parse_qs
+
+from PIL import features
+
+from icon_generator.cache import IconDiskCache
+from icon_generator.encoder import EncoderRegistry
+from icon_generator.errors import ErrorMessages
+from icon_generator.generator.git import GitIconGenerator
+
+StartResponse = Callable[[str, list[tuple[str, str]]], Any]
+ASGIReceive = Callable[[], Awaitable[MutableMapping[str, Any]]]
+ASGISend = Callable[[MutableMapping[str, Any]], Awaitable[None]]
+
+
+class AvatarResponse(NamedTuple):
+    """AvatarApp.respond が返す HTTP レスポンス。
+
+    Attributes:
+        status (int): ステータスコード
+        headers (list[tuple[str, str]]): レスポンスヘッダ
+        body (bytes): レスポンスボディ
+
+    """
+
+    status: int
+    headers: list[tuple[str, str]]
+    body: bytes
+
+
+class AvatarApp:
+    """/<uuid>.png?size=N 形式のリクエストにアイデンティコン画像を返すアプリケーション。
+
+    インスタンスはそのまま WSGI アプリケーションとして、asgi メソッドは
+    ASGI アプリケーションとして利用できる。
+    ETag は UUID から求めたパターン・色とサイズ・フォーマット・
+    RENDER_SPEC_VERSION・Pillow のバージョン (IconDiskCache.make_key と同じキー) に、
+    zlib・libwebp のバージョンとエンコーダの設定を加えて算出するため、If-None-Match が
+    一致した場合は画像を描画せずに 304 を返す。ライブラリの更新で出力の
+    バイト列が変わる場合は ETag も変わる。
+    同じ URL の内容は変わらないため、長期間の immutable なキャッシュを指示する。
+
+    Attributes:
+        DEFAULT_SIZE (int): size を省略した場合のイメージサイズの既定値
+        MAX_SIZE (int): 受け付けるイメージサイズの上限の既定値
+        CACHE_CONTROL (str): 画像と 304 に付与する Cache-Control ヘッダ
+        ROUTES (dict[str, tuple[str, str]]):
+            拡張子と (画像フォーマット名, Content-Type) の対応
+        default_size (int): size を省略した場合のイメージサイズ
+        max_size (int): 受け付けるイメージサイズの上限
+
+    Methods:
+        respond(method, path, query, if_none_match) -> AvatarResponse:
+            リクエストの内容から HTTP レスポンスを組み立てる。
+
+        etag(unique_uuid, image_size, image_format) -> str:
+            描画せずに画像の内容から ETag を算出する。
+
+        asgi(scope, receive, send) -> None:
+            ASGI アプリケーションとしてリクエストを処理する。
+
+    """
+
+    DEFAULT_SIZE = 128
+    MAX_SIZE = 1024
+    CACHE_CONTROL = "public, max-age=31536000, immutable"
+    ROUTES: ClassVar[dict[str, tuple[str, str]]] = {
+        ".png": (GitIconGenerator.FORMAT_PNG, "image/png"),
+        ".svg": (GitIconGenerator.FORMAT_SVG, "image/svg+xml"),
+        ".webp": ("webp-lossless", "image/webp"),
+    }
+
+    def __init__(
+        self,
+        default_size: int = DEFAULT_SIZE,
+        max_size: int = MAX_SIZE,
+    ) -> None:
+        """AvatarAppのコンストラクタ。
+
+        Args:
+            default_size (int, optional): size を省略した場合のイメージサイズ
+            max_size (int, optional): 受け付けるイメージサイズの上限
+
+        Raises:
+            ValueError: default_size が1〜max_size の範囲外の場合に発生
+
+        """
+        if not 1 <= default_size <= max_size:
+            message = ErrorMessages.INVALID_SERVER_SIZES.value
+            raise ValueError(message)
+
+        self.default_size = default_size
+        self.max_size = max_size
+
+    def __call__(
+        self,
+        environ: dict[str, Any],
+        start_response: StartResponse,
+    ) -> Iterable[bytes]:
+        """WSGI アプリケーションとしてリクエストを処理する。
+
+        Args:
+            environ (dict[str, Any]): WSGI の環境変数
+            start_response (StartResponse): WSGI の start_response
+
+        Returns:
+            Iterable[bytes]: レスポンスボディ
+
+        """
+        response = self.respond(
+            method=environ.get("REQUEST_METHOD", "GET"),
+            path=environ.get("PATH_INFO", "/"),
+            query=environ.get("QUERY_STRING", ""),
+            if_none_match=environ.get("HTTP_IF_NONE_MATCH"),
+        )
+        status = HTTPStatus(response.status)
+        start_response(f"{status.value} {status.phrase}", response.headers)
+        return [response.body]
+
+    async def asgi(
+        self,
+        scope: MutableMapping[str, Any],
+        receive: ASGIReceive,
+        send: ASGISend,
+    ) -> None:
+        """ASGI アプリケーションとしてリクエストを処理する。
+
+        画像の描画はイベントループを妨げないよう別スレッドで行う。
+        lifespan イベントには即座に完了を返す。
+
+        Args:
+            scope (MutableMapping[str, Any]): ASGI のスコープ
+            receive (ASGIReceive): ASGI の receive
+            send (ASGISend): ASGI の send
+
+        Raises:
+            ValueError: http・lifespan 以外 (websocket など) のスコープの場合に発生
+
+        """
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            message = ErrorMessages.UNSUPPORTED_ASGI_SCOPE.format(
+                scope_type=scope["type"],
+            )
+            raise ValueError(message)
+
+        headers = dict(scope.get("headers", []))
+        if_none_match = headers.get(b"if-none-match")
+        response = await asyncio.to_thread(
+            self.respond,
+            method=scope.get("method", "GET"),
+            path=scope.get("path", "/"),
+            query=scope.get("query_string", b"").decode("latin-1"),
+            if_none_match=None if if_none_match is None else if_none_match.decode(),
+        )
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status,
+                "headers": [
+                    (name.lower().encode(), value.encode())
+                    for name, value in response.headers
+                ],
+            },
+        )
+        await send({"type": "http.response.body", "body": response.body})
+
+    def respond(
+        self,
+        method: str,
+        path: str,
+        query: str = "",
+        if_none_match: str | None = None,
+    ) -> AvatarResponse:
+        """リクエストの内容から HTTP レスポンスを組み立てる。
+
+        Args:
+            method (str): リクエストメソッド (GET・HEAD のみ受け付ける)
+            path (str): リクエストパス (/<uuid>.<拡張子>)
+            query (str, optional): クエリ文字列 (size にイメージサイズを指定)
+            if_none_match (str | None, optional): If-None-Match ヘッダの値
+
+        Returns:
+            AvatarResponse: HTTP レスポンス
+
+        """
+        if method not in {"GET", "HEAD"}:
+            return self._error(method, 405, [("Allow", "GET, HEAD")])
+
+        name, dot, extension = path.lstrip("/").rpartition(".")
+        route = self.ROUTES.get(f"{dot}{extension}")
+        try:
+            unique_uuid = uuid.UUID(name)
+        except ValueError:
+            route = None
+        if route is None:
+            return self._error(method, 404)
+
+        image_size = self._image_size(query)
+        if image_size is None:
+            return self._error(method, 400)
+
+        image_format, content_type = route
+        etag = self.etag(unique_uuid, image_size, image_format)
+        headers = [("ETag", etag), ("Cache-Control", self.CACHE_CONTROL)]
+        if if_none_match is not None and self._matches(if_none_match, etag):
+            return AvatarResponse(304, headers, b"")
+
+        body = GitIconGenerator.generate_bytes(unique_uuid, image_size, image_format)
+        headers += [
+            ("Content-Type", content_type),
+            ("Content-Length", str(len(body))),
+        ]
+        return AvatarResponse(200, headers, b"" if method == "HEAD" else body)
+
+    @staticmethod
+    async def _lifespan(receive: ASGIReceive, send: ASGISend) -> None:
+        """ASGI の lifespan イベントに完了を返し、shutdown を受け取ったら終了する。
+
+        起動・終了時に必要な処理はないため、startup・shutdown には即座に完了を返す。
+
+        Args:
+            receive (ASGIReceive): ASGI の receive
+            send (ASGISend): ASGI の send
+
+        """
+        while True:
+            event = await receive()
+            if event["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif event["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    @classmethod
+    def etag(cls, unique_uuid: uuid.UUID, image_size: int, image_format: str) -> str:
+        """画像を描画せずに、描画内容と描画に使うライブラリから強い ETag を算出する。
+
+        Args:
+            unique_uuid (uuid.UUID): UUID
+            image_size (int): イメージサイズ
+            image_format (str): 画像フォーマット名
+
+        Returns:
+            str: ダブルクォートで囲んだ ETag
+                (見た目が同じ UUID は同じ値となる)
+
+        """
+        generator = GitIconGenerator(unique_uuid)
+        key = IconDiskCache.make_key(
+            pattern_bits=generator.bits,
+            rgb=generator.rgb,
+            image_size=image_size,
+            image_format=image_format,
+            render_spec_version=GitIconGenerator.RENDER_SPEC_VERSION,
+        )
+        versions = f"{key}:{cls._library_versions(image_format)}"
+        return f'"{hashlib.sha256(versions.encode()).hexdigest()[:32]}"'
+
+    @staticmethod
+    def _library_versions(image_format: str) -> str:
+        """make_key に含まれない、出力を左右するライブラリとエンコーダの設定を返す。
+
+        Args:
+            image_format (str): 画像フォーマット名
+
+        Returns:
+            str: zlib・libwebp のバージョンと、エンコーダの cache_token
+                (EncoderRegistry のプリセットでないフォーマットは空文字列)
+
+        """
+        token = ""
+        if image_format in EncoderRegistry.names():
+            token = EncoderRegistry.get(image_format).cache_token
+        webp = features.version("webp") or ""
+        return f"{zlib.ZLIB_RUNTIME_VERSION}:{webp}:{token}"
+
+    def _image_size(self, query: str) -> int | None:
+        """クエリ文字列からイメージサイズを取り出す。
+
+        Args:
+            query (str): クエリ文字列
+
+        Returns:
+            int | None: イメージサイズ。不正な値や範囲外の場合は None
+
+        """
+        values = parse_qs(query).get("size")
+        if not values:
+            return self.default_size
+        # isdigit は "²" など int で変換できない文字も受け付けるため isdecimal を使う
+        if not values[-1].isdecimal():
+            return None
+
+        try:
+            image_size = int(values[-1])
+        except ValueError:
+            return None
+        return image_size if 1 <= image_size <= self.max_size else None
+
+    @staticmethod
+    def _matches(if_none_match: str, etag: str) -> bool:
+        """If-None-Match の値が ETag に一致するかを弱い比較で判定する。
+
+        Args:
+            if_none_match (str): If-None-Match ヘッダの値
+            etag (str): 画像の ETag
+
+        Returns:
+            bool: "*" もしくはいずれかの ETag が一致する場合は True
+
+        """
+        candidates = (tag.strip() for tag in if_none_match.split(","))
+        return any(tag == "*" or tag.removeprefix("W/") == etag for tag in candidates)
+
+    @staticmethod
+    def _error(
+        method: str,
+        status: int,
+        headers: list[tuple[str, str]] | None = None,
+    ) -> AvatarResponse:
+        """本文に理由を記したエラーレスポンスを組み立てる (HEAD の場合は本文なし)
+
+        Args:
+            method (str): リクエストメソッド
+            status (int): ステータスコード
+            headers (list[tuple[str, str]] | None, optional): 追加するヘッダ
+
+        Returns:
+            AvatarResponse: エラーレスポンス
+
+        """
+        body = f"{status} {HTTPStatus(status).phrase}\n".encode()
+        return AvatarResponse(
+            status,
+            [
+                *(headers or []),
+                ("Content-Type", "text/plain; charset=utf-8"),
+                ("Content-Length", str(len(body))),
+            ],
+            b"" if method == "HEAD" else body,
+        )
@@ -0,0 +1,51 @@
+"""AsyncIconRenderer の異常系テストケースを定義するモジュール。"""
+# test_async_renderer_negative.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import asyncio
+import re
+
+import pytest
+
+from icon_generator.bulk import AsyncIconRenderer
+from icon_generator.errors import ErrorMessages
+
+
+class TestAsyncIconRendererNegativeCases:
+    """AsyncIconRendererにおける異常系の動作を検証するテストクラス。"""
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize("max_in_flight", [0, -1])
+    def test_invalid_max_in_flight(self, max_in_flight: int) -> None:
+        """max_in_flight が1未満の場合に ValueError が発生すること
+
+        Args:
+            max_in_flight (int): 同時実行数の上限
+
+        """
+        expected = ErrorMessages.INVALID_MAX_IN_FLIGHT.value
+
+        with pytest.raises(ValueError, match=re.escape(expected)):
+            AsyncIconRenderer(max_in_flight=max_in_flight)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_map_propagates_exception(self) -> None:
+        """処理で発生した例外が map の呼び出し元に伝播すること"""
+        renderer = AsyncIconRenderer(max_in_flight=2)
+
+        def render(value: int) -> int:
+            if value == 3:  # noqa: PLR2004
+                raise RuntimeError
+            return value
+
+        async def collect() -> list[tuple[int, int]]:
+            return [item async for item in renderer.map(render, range(10))]
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(collect())
@@ -0,0 +1,166 @@
+"""AsyncIconRenderer の正常系テストケースを定義するモジュール。"""
+# test_async_renderer_positive.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from icon_generator.bulk import AsyncIconRenderer
+
+
+class TestAsyncIconRendererPositiveCases:
+    """AsyncIconRendererにおける正常系の動作を検証するテストクラス。"""
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_run_returns_result(self) -> None:
+        """Run が Executor で実行した処理の戻り値を返すこと"""
+        renderer = AsyncIconRenderer(max_in_flight=2)
+
+        assert asyncio.run(renderer.run(pow, 2, 10)) == 1024  # noqa: PLR2004
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_map_returns_results_in_input_order(self) -> None:
+        """Map が同期・非同期の入力に対して入力順に (入力, 結果) を返すこと"""
+        renderer = AsyncIconRenderer(max_in_flight=3)
+
+        def slow_square(value: int) -> int:
+            time.sleep(0.001 * (10 - value))
+            return value * value
+
+        async def numbers() -> AsyncIterator[int]:
+            for value in range(10):
+                yield value
+
+        async def collect() -> tuple[list[tuple[int, int]], list[tuple[int, int]]]:
+            from_sync = [item async for item in renderer.map(slow_square, range(10))]
+            from_async = [item async for item in renderer.map(slow_square, numbers())]
+            return from_sync, from_async
+
+        expected = [(value, value * value) for value in range(10)]
+        assert asyncio.run(collect()) == (expected, expected)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_run_limits_renders_in_flight(self) -> None:
+        """同時に実行される処理が max_in_flight 件を超えないこと"""
+        renderer = AsyncIconRenderer(ThreadPoolExecutor(max_workers=8), max_in_flight=2)
+        lock = threading.Lock()
+        counts = {"current": 0, "peak": 0}
+
+        def render(_: int) -> None:
+            with lock:
+                counts["current"] += 1
+                counts["peak"] = max(counts["peak"], counts["current"])
+            time.sleep(0.01)
+            with lock:
+                counts["current"] -= 1
+
+        async def run_all() -> None:
+            await asyncio.gather(*(renderer.run(render, n) for n in range(10)))
+
+        asyncio.run(run_all())
+
+        assert counts["peak"] == 2  # noqa: PLR2004
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_map_applies_backpressure_to_producer(self) -> None:
+        """結果を消費するまで、入力は max_in_flight 件を超えて取得されないこと"""
+        renderer = AsyncIconRenderer(max_in_flight=2)
+        produced: list[int] = []
+
+        async def producer() -> AsyncIterator[int]:
+            for value in range(100):
+                produced.append(value)
+                yield value
+
+        async def take_first() -> tuple[int, int]:
+            results = renderer.map(abs, producer())
+            first = await anext(results)
+            await asyncio.sleep(0.05)
+            await results.aclose()
+            return first
+
+        assert asyncio.run(take_first()) == (0, 0)
+        assert len(produced) <= renderer.max_in_flight + 1
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_cancel_skips_work_not_started(self) -> None:
+        """待機中のタスクをキャンセルすると、開始前の処理が実行されないこと"""
+        renderer = AsyncIconRenderer(ThreadPoolExecutor(max_workers=1), max_in_flight=4)
+        release = threading.Event()
+        started: list[int] = []
+
+        def render(value: int) -> int:
+            started.append(value)
+            release.wait(timeout=5)
+            return value
+
+        async def cancel_batch() -> None:
+            async def consume() -> None:
+                async for _ in renderer.map(render, range(4)):
+                    pass
+
+            task = asyncio.create_task(consume())
+            await asyncio.sleep(0.05)
+            task.cancel()
+            asyncio.get_running_loop().call_later(0.05, release.set)
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancel_batch())
+        renderer.executor.shutdown(wait=True)  # type: ignore[union-attr]
+
+        assert started == [0]
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_aclose_waits_for_renders_in_flight(self) -> None:
+        """Aclose が実行中の処理の終了を待ち、同時実行数が上限を超えないこと"""
+        renderer = AsyncIconRenderer(ThreadPoolExecutor(max_workers=8), max_in_flight=2)
+        lock = threading.Lock()
+        counts = {"current": 0, "peak": 0}
+
+        def render(value: int) -> int:
+            with lock:
+                counts["current"] += 1
+                counts["peak"] = max(counts["peak"], counts["current"])
+            time.sleep(0.02)
+            with lock:
+                counts["current"] -= 1
+            return value
+
+        async def restart_after_aclose() -> int:
+            for _ in range(3):
+                results = renderer.map(render, range(10))
+                await anext(results)
+                await results.aclose()
+                assert counts["current"] == 0
+            return sum([value async for value, _ in renderer.map(render, range(4))])
+
+        assert asyncio.run(restart_after_aclose()) == 6  # noqa: PLR2004
+        assert counts["peak"] <= renderer.max_in_flight
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_get_default_is_shared(self) -> None:
+        """get_default が同じレンダラを返し、set_default で置き換えられること"""
+        renderer = AsyncIconRenderer(max_in_flight=1)
+        previous = AsyncIconRenderer.get_default()
+        try:
+            AsyncIconRenderer.set_default(renderer)
+            assert AsyncIconRenderer.get_default() is renderer
+        finally:
+            AsyncIconRenderer.set_default(previous)
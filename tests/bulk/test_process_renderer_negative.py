@@ -0,0 +1,64 @@
+"""ProcessIconRenderer の異常系テストケースを定義するモジュール。"""
+# test_process_renderer_negative.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import re
+import uuid
+
+import pytest
+
+from icon_generator.bulk import ProcessIconRenderer
+from icon_generator.errors import ErrorMessages
+
+
+def render_or_fail(unique_uuid: uuid.UUID, image_size: int, image_format: str) -> bytes:
+    """画像フォーマットが "fail" の場合に例外を送出するテスト用の描画関数
+
+    Args:
+        unique_uuid (uuid.UUID): UUID
+        image_size (int): イメージサイズ
+        image_format (str): 画像フォーマット名
+
+    Raises:
+        ValueError: 画像フォーマットが "fail" の場合に発生
+
+    Returns:
+        bytes: UUID のバイト列
+
+    """
+    if image_format == "fail":
+        raise ValueError(image_format)
+    return unique_uuid.bytes
+
+
+class TestProcessIconRendererNegativeCases:
+    """ProcessIconRendererにおける異常系の動作を検証するテストクラス。"""
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_invalid_workers(self) -> None:
+        """ワーカー数 (workers) が1未満の場合に ValueError が発生すること"""
+        error = ErrorMessages.INVALID_WORKERS.value
+        with pytest.raises(ValueError, match=re.escape(error)):
+            ProcessIconRenderer(render_or_fail, workers=0)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_invalid_chunk_size(self) -> None:
+        """チャンクサイズ (chunk_size) が1未満の場合に ValueError が発生すること"""
+        error = ErrorMessages.INVALID_CHUNK_SIZE.value
+        with pytest.raises(ValueError, match=re.escape(error)):
+            ProcessIconRenderer(render_or_fail, chunk_size=0)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_worker_exception_propagates(self) -> None:
+        """ワーカーで発生した例外が呼び出し元に伝播すること"""
+        renderer = ProcessIconRenderer(render_or_fail, workers=1, chunk_size=2)
+
+        with pytest.raises(ValueError, match="fail"):
+            list(renderer.imap([uuid.uuid4() for _ in range(4)], 3, "fail"))
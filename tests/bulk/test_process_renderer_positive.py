@@ -0,0 +1,135 @@
+"""ProcessIconRenderer の正常系テストケースを定義するモジュール。"""
+# test_process_renderer_positive.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import multiprocessing
+import os
+import uuid
+from pathlib import Path
+
+import pytest
+
+from icon_generator.bulk import ProcessIconRenderer, process_renderer
+
+SHARED_MEMORY_DIRECTORY = Path("/dev/shm")  # noqa: S108
+
+
+def render_hex(unique_uuid: uuid.UUID, image_size: int, image_format: str) -> bytes:
+    """UUID と引数から決まるバイト列を返すテスト用の描画関数
+
+    Args:
+        unique_uuid (uuid.UUID): UUID
+        image_size (int): イメージサイズ
+        image_format (str): 画像フォーマット名
+
+    Returns:
+        bytes: 画像の代わりとなるバイト列
+
+    """
+    return f"{image_format}:{image_size}:{unique_uuid.hex}".encode() * image_size
+
+
+class TestProcessIconRendererPositiveCases:
+    """ProcessIconRendererにおける正常系の動作を検証するテストクラス。"""
+
+    @pytest.fixture
+    def uuids(self) -> list[uuid.UUID]:
+        """UUID のリスト"""
+        return [uuid.uuid4() for _ in range(25)]
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize("chunk_size", [1, 4, 100])
+    def test_imap_returns_results_in_input_order(
+        self,
+        uuids: list[uuid.UUID],
+        chunk_size: int,
+    ) -> None:
+        """Imap がチャンクサイズによらず入力順に (UUID, 画像) を返すこと
+
+        Args:
+            uuids (list[uuid.UUID]): UUID のリスト
+            chunk_size (int): 1チャンクあたりの UUID 数
+
+        """
+        renderer = ProcessIconRenderer(render_hex, workers=2, chunk_size=chunk_size)
+
+        results = list(renderer.imap(iter(uuids), 3, "png"))
+
+        assert results == [(u, render_hex(u, 3, "png")) for u in uuids]
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(
+        "shared_memory",
+        [
+            pytest.param(
+                True,
+                marks=pytest.mark.skipif(
+                    os.name != "posix",
+                    reason="POSIX 共有メモリが必要",
+                ),
+            ),
+            False,
+        ],
+    )
+    def test_imap_with_spawn_start_method(
+        self,
+        uuids: list[uuid.UUID],
+        shared_memory: bool,  # noqa: FBT001
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Spawn 方式で起動したワーカーからも、共有メモリの有無によらず結果を返すこと
+
+        Args:
+            uuids (list[uuid.UUID]): UUID のリスト
+            shared_memory (bool): 共有メモリで受け渡すか (False は Windows と同じ方式)
+            monkeypatch (pytest.MonkeyPatch): MonkeyPatchインスタンス
+
+        """
+        monkeypatch.setattr(process_renderer, "SHARED_MEMORY_HANDOFF", shared_memory)
+        renderer = ProcessIconRenderer(
+            render_hex,
+            workers=2,
+            chunk_size=4,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+        results = list(renderer.imap(uuids, 3, "png"))
+
+        assert results == [(u, render_hex(u, 3, "png")) for u in uuids]
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_imap_with_empty_input(self) -> None:
+        """入力が空の場合は何も返さないこと"""
+        renderer = ProcessIconRenderer(render_hex, workers=1)
+
+        assert list(renderer.imap([], 3, "png")) == []
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.skipif(
+        not SHARED_MEMORY_DIRECTORY.is_dir(),
+        reason="POSIX 共有メモリが必要",
+    )
+    def test_shared_memory_is_released(self, uuids: list[uuid.UUID]) -> None:
+        """途中で反復を中断した場合も含め、共有メモリが全て解放されること
+
+        Args:
+            uuids (list[uuid.UUID]): UUID のリスト
+
+        """
+        before = set(SHARED_MEMORY_DIRECTORY.iterdir())
+        renderer = ProcessIconRenderer(render_hex, workers=2, chunk_size=2)
+
+        list(renderer.imap(uuids, 3, "png"))
+        results = renderer.imap(uuids, 3, "png")
+        next(results)
+        results.close()  # type: ignore[attr-defined]
+
+        assert set(SHARED_MEMORY_DIRECTORY.iterdir()) - before == set()
@@ -0,0 +1,92 @@
+"""ThreadIconRenderer の正常系テストケースを定義するモジュール。"""
+# test_thread_renderer_positive.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import threading
+import uuid
+
+import pytest
+
+from icon_generator.bulk import ThreadIconRenderer
+
+
+def render_hex(unique_uuid: uuid.UUID, image_size: int, image_format: str) -> bytes:
+    """UUID と引数から決まるバイト列を返すテスト用の描画関数
+
+    Args:
+        unique_uuid (uuid.UUID): UUID
+        image_size (int): イメージサイズ
+        image_format (str): 画像フォーマット名
+
+    Returns:
+        bytes: 画像の代わりとなるバイト列
+
+    """
+    return f"{image_format}:{image_size}:{unique_uuid.hex}".encode() * image_size
+
+
+class TestThreadIconRendererPositiveCases:
+    """ThreadIconRendererにおける正常系の動作を検証するテストクラス。"""
+
+    @pytest.fixture
+    def uuids(self) -> list[uuid.UUID]:
+        """UUID のリスト"""
+        return [uuid.uuid4() for _ in range(25)]
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize("chunk_size", [1, 4, 100])
+    def test_imap_returns_results_in_input_order(
+        self,
+        uuids: list[uuid.UUID],
+        chunk_size: int,
+    ) -> None:
+        """Imap がチャンクサイズによらず入力順に (UUID, 画像) を返すこと
+
+        Args:
+            uuids (list[uuid.UUID]): UUID のリスト
+            chunk_size (int): 1チャンクあたりの UUID 数
+
+        """
+        renderer = ThreadIconRenderer(render_hex, workers=2, chunk_size=chunk_size)
+
+        results = list(renderer.imap(iter(uuids), 3, "png"))
+
+        assert results == [(u, render_hex(u, 3, "png")) for u in uuids]
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_imap_with_empty_input(self) -> None:
+        """入力が空の場合は何も返さないこと"""
+        renderer = ThreadIconRenderer(render_hex, workers=1)
+
+        assert list(renderer.imap([], 3, "png")) == []
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_imap_runs_chunks_on_multiple_threads(
+        self,
+        uuids: list[uuid.UUID],
+    ) -> None:
+        """チャンクが複数のワーカースレッドで同時に実行されること
+
+        Args:
+            uuids (list[uuid.UUID]): UUID のリスト
+
+        """
+        barrier = threading.Barrier(2, timeout=5)
+        thread_names: set[str] = set()
+
+        def render(unique_uuid: uuid.UUID, image_size: int, image_format: str) -> bytes:
+            thread_names.add(threading.current_thread().name)
+            barrier.wait()
+            return render_hex(unique_uuid, image_size, image_format)
+
+        renderer = ThreadIconRenderer(render, workers=2, chunk_size=1)
+        list(renderer.imap(uuids[:2], 3, "png"))
+
+        assert len(thread_names) == 2  # noqa: PLR2004
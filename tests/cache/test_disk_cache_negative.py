@@ -0,0 +1,57 @@
+"""IconDiskCache の異常系テストケースを定義するモジュール。"""
+# test_disk_cache_negative.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+from pathlib import Path
+
+import pytest
+
+from icon_generator.cache import IconDiskCache
+
+
+class TestIconDiskCacheNegativeCases:
+    """IconDiskCacheにおける異常系の動作を検証するテストクラス。"""
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_put_returns_false_when_write_fails(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """書き込みに失敗した場合は False を返し、一時ファイルを残さないこと
+
+        Args:
+            tmp_path (Path): 一時ディレクトリ
+            monkeypatch (pytest.MonkeyPatch): pytestのモンキーパッチ用フィクスチャ
+
+        """
+        cache = IconDiskCache(tmp_path)
+
+        def fail_replace(self: Path, target: Path) -> Path:
+            raise OSError
+
+        monkeypatch.setattr(Path, "replace", fail_replace)
+
+        assert not cache.put("abcdef", b"png-data")
+        assert [path for path in tmp_path.rglob("*") if path.is_file()] == []
+        assert cache.get("abcdef") is None
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_get_returns_none_for_unreadable_entry(self, tmp_path: Path) -> None:
+        """エントリのパスがファイルとして読み込めない場合は None を返すこと
+
+        Args:
+            tmp_path (Path): 一時ディレクトリ
+
+        """
+        cache = IconDiskCache(tmp_path)
+        (tmp_path / "ab" / f"abcdef{IconDiskCache.SUFFIX}").mkdir(parents=True)
+
+        assert cache.get("abcdef") is None
+        assert cache.misses == 1
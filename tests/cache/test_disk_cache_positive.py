@@ -0,0 +1,232 @@
+"""IconDiskCache の正常系テストケースを定義するモジュール。"""
+# test_disk_cache_positive.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import os
+import stat
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import PIL
+import pytest
+
+import icon_generator
+from icon_generator.cache import IconDiskCache
+
+
+class TestIconDiskCachePositiveCases:
+    """IconDiskCacheにおける正常系の動作を検証するテストクラス。"""
+
+    @pytest.fixture
+    def cache(self, tmp_path: Path) -> IconDiskCache:
+        """一時ディレクトリを使用する IconDiskCache インスタンス"""
+        return IconDiskCache(tmp_path / "icons")
+
+    @pytest.fixture
+    def key(self) -> str:
+        """描画内容から算出したキー"""
+        return IconDiskCache.make_key(
+            pattern_bits=0x1234,
+            rgb=(10, 20, 30),
+            image_size=64,
+            image_format="png",
+            render_spec_version=1,
+        )
+
+    @pytest.fixture
+    def reset_active(self) -> Iterator[None]:
+        """パッケージ全体のキャッシュをテスト後に無効化する"""
+        yield
+        IconDiskCache.disable()
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_make_key_depends_on_every_field(self, key: str) -> None:
+        """キーが同じ描画内容で一致し、いずれかの要素が異なると変わること
+
+        Args:
+            key (str): 描画内容から算出したキー
+
+        """
+        fields = {
+            "pattern_bits": 0x1234,
+            "rgb": (10, 20, 30),
+            "image_size": 64,
+            "image_format": "png",
+            "render_spec_version": 1,
+            "library_version": PIL.__version__,
+        }
+        variants = {
+            "pattern_bits": 0x1235,
+            "rgb": (10, 20, 31),
+            "image_size": 65,
+            "image_format": "png-indexed",
+            "render_spec_version": 2,
+            "library_version": "0.0.0",
+        }
+
+        assert IconDiskCache.make_key(**fields) == key  # type: ignore[arg-type]
+        for name, value in variants.items():
+            changed = {**fields, name: value}
+            assert IconDiskCache.make_key(**changed) != key  # type: ignore[arg-type]
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_get_returns_put_data(self, cache: IconDiskCache, key: str) -> None:
+        """Put したデータを get で取得でき、ヒット・ミス数が記録されること
+
+        Args:
+            cache (IconDiskCache): IconDiskCacheインスタンス
+            key (str): 描画内容から算出したキー
+
+        """
+        assert cache.get(key) is None
+        assert cache.put(key, b"png-data")
+
+        assert cache.get(key) == b"png-data"
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_entries_are_shared_between_instances(
+        self,
+        cache: IconDiskCache,
+        key: str,
+    ) -> None:
+        """同じディレクトリを使用する別のインスタンスからエントリを読み込めること
+
+        Args:
+            cache (IconDiskCache): IconDiskCacheインスタンス
+            key (str): 描画内容から算出したキー
+
+        """
+        cache.put(key, b"png-data")
+
+        assert IconDiskCache(cache.directory).get(key) == b"png-data"
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_put_leaves_no_temporary_files(
+        self,
+        cache: IconDiskCache,
+        key: str,
+    ) -> None:
+        """書き込み後に一時ファイルが残らないこと
+
+        Args:
+            cache (IconDiskCache): IconDiskCacheインスタンス
+            key (str): 描画内容から算出したキー
+
+        """
+        cache.put(key, b"first")
+        cache.put(key, b"second")
+
+        files = [path for path in cache.directory.rglob("*") if path.is_file()]
+        assert [path.name for path in files] == [f"{key}{IconDiskCache.SUFFIX}"]
+        assert cache.get(key) == b"second"
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_put_syncs_and_applies_umask(
+        self,
+        cache: IconDiskCache,
+        key: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """エントリを fsync してから配置し、umask に従うパーミッションとなること
+
+        Args:
+            cache (IconDiskCache): IconDiskCacheインスタンス
+            key (str): 描画内容から算出したキー
+            monkeypatch (pytest.MonkeyPatch): pytestのモンキーパッチ用フィクスチャ
+
+        """
+        synced: list[int] = []
+        fsync = os.fsync
+
+        def record_fsync(fd: int) -> None:
+            synced.append(fd)
+            fsync(fd)
+
+        monkeypatch.setattr(os, "fsync", record_fsync)
+        umask = os.umask(0)
+        os.umask(umask)
+
+        assert cache.put(key, b"png-data")
+
+        entry = cache.directory / key[:2] / f"{key}{IconDiskCache.SUFFIX}"
+        assert len(synced) == 1
+        assert stat.S_IMODE(entry.stat().st_mode) == 0o666 & ~umask
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_concurrent_writers_never_expose_partial_data(
+        self,
+        cache: IconDiskCache,
+        key: str,
+    ) -> None:
+        """同じキーへの同時書き込み中も、読み込み結果は常に完全なデータであること
+
+        Args:
+            cache (IconDiskCache): IconDiskCacheインスタンス
+            key (str): 描画内容から算出したキー
+
+        """
+        payloads = [bytes([n]) * 65536 for n in range(4)]
+        cache.put(key, payloads[0])
+        results: list[bytes | None] = []
+
+        def writer(payload: bytes) -> None:
+            for _ in range(20):
+                cache.put(key, payload)
+
+        def reader() -> None:
+            results.extend(cache.get(key) for _ in range(100))
+
+        threads = [threading.Thread(target=writer, args=(p,)) for p in payloads]
+        threads.append(threading.Thread(target=reader))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(result in payloads for result in results)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_clear_removes_entries(self, cache: IconDiskCache, key: str) -> None:
+        """Clear で全てのエントリが削除されること
+
+        Args:
+            cache (IconDiskCache): IconDiskCacheインスタンス
+            key (str): 描画内容から算出したキー
+
+        """
+        cache.put(key, b"png-data")
+        cache.clear()
+
+        assert cache.get(key) is None
+        assert list(cache.directory.iterdir()) == []
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.usefixtures("reset_active")
+    def test_enable_and_disable_at_package_level(self, tmp_path: Path) -> None:
+        """パッケージからキャッシュを有効化・無効化できること
+
+        Args:
+            tmp_path (Path): 一時ディレクトリ
+
+        """
+        cache = icon_generator.enable_disk_cache(tmp_path)
+
+        assert IconDiskCache.get_active() is cache
+        assert cache.directory == tmp_path
+
+        icon_generator.disable_disk_cache()
+        assert IconDiskCache.get_active() is None
@@ -0,0 +1,139 @@
+"""IconMemoryCache の正常系テストケースを定義するモジュール。"""
+# test_memory_cache_positive.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+import icon_generator
+from icon_generator.cache import CacheInfo, IconMemoryCache
+
+
+class TestIconMemoryCachePositiveCases:
+    """IconMemoryCacheにおける正常系の動作を検証するテストクラス。"""
+
+    @pytest.fixture
+    def cache(self) -> IconMemoryCache:
+        """合計10バイトまで保持する IconMemoryCache インスタンス"""
+        return IconMemoryCache(max_bytes=10)
+
+    @pytest.fixture
+    def reset_active(self) -> Iterator[None]:
+        """パッケージ全体のキャッシュをテスト後に無効化する"""
+        yield
+        IconMemoryCache.disable()
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_get_returns_put_data(self, cache: IconMemoryCache) -> None:
+        """Put したデータを get で取得でき、ヒット・ミス数が記録されること
+
+        Args:
+            cache (IconMemoryCache): IconMemoryCacheインスタンス
+
+        """
+        key = ("uuid", 64, "png")
+        assert cache.get(key) is None
+        cache.put(key, b"abc")
+
+        assert cache.get(key) == b"abc"
+        assert cache.info() == CacheInfo(
+            hits=1,
+            misses=1,
+            evictions=0,
+            entries=1,
+            current_bytes=3,
+            max_bytes=10,
+        )
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_least_recently_used_entry_is_evicted(self, cache: IconMemoryCache) -> None:
+        """合計バイト数が上限を超えると最も長く使われていないエントリが破棄されること
+
+        Args:
+            cache (IconMemoryCache): IconMemoryCacheインスタンス
+
+        """
+        cache.put("a", b"1234")
+        cache.put("b", b"1234")
+        cache.get("a")
+        cache.put("c", b"1234")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1234"
+        assert cache.get("c") == b"1234"
+        info = cache.info()
+        assert info.evictions == 1
+        assert info.current_bytes == 8  # noqa: PLR2004
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_put_replaces_existing_entry(self, cache: IconMemoryCache) -> None:
+        """同じキーに put すると値と合計バイト数が置き換わること
+
+        Args:
+            cache (IconMemoryCache): IconMemoryCacheインスタンス
+
+        """
+        cache.put("a", b"1234")
+        cache.put("a", b"12")
+
+        assert cache.get("a") == b"12"
+        assert cache.info().current_bytes == 2  # noqa: PLR2004
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_oversized_data_is_not_stored(self, cache: IconMemoryCache) -> None:
+        """上限を超える単一のデータは保持しないこと
+
+        Args:
+            cache (IconMemoryCache): IconMemoryCacheインスタンス
+
+        """
+        cache.put("a", b"1234")
+        cache.put("b", b"x" * 11)
+
+        assert len(cache) == 1
+        assert cache.get("a") == b"1234"
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_concurrent_access_keeps_byte_budget(self) -> None:
+        """複数スレッドから同時にアクセスしても合計バイト数が上限以内に保たれること"""
+        cache = IconMemoryCache(max_bytes=1000)
+
+        def worker(offset: int) -> None:
+            for i in range(500):
+                cache.put((offset, i), b"x" * 10)
+                cache.get((offset, i - 1))
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        info = cache.info()
+        assert info.current_bytes <= info.max_bytes
+        assert info.current_bytes == info.entries * 10
+        assert info.hits + info.misses == 8 * 500
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.usefixtures("reset_active")
+    def test_enable_and_disable_at_package_level(self) -> None:
+        """パッケージからキャッシュを有効化・無効化できること"""
+        cache = icon_generator.enable_memory_cache(max_bytes=1024)
+
+        assert IconMemoryCache.get_active() is cache
+        assert cache.max_bytes == 1024  # noqa: PLR2004
+
+        icon_generator.disable_memory_cache()
+        assert IconMemoryCache.get_active() is None
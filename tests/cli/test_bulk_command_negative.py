@@ -0,0 +1,191 @@
+"""icon-generator コマンドの異常系テストケースを定義するモジュール。"""
+# test_bulk_command_negative.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import re
+import uuid
+from pathlib import Path
+
+import pytest
+
+from icon_generator.cli import LatencyReservoir, main, read_uuids, run
+from icon_generator.errors import ErrorMessages
+
+
+class TestBulkCommandNegativeCases:
+    """icon-generator コマンドにおける異常系の動作を検証するテストクラス。"""
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_read_uuids_invalid_line(self) -> None:
+        """UUID として解釈できない行があると、行番号付きの ValueError が発生すること"""
+        error = ErrorMessages.INVALID_UUID_LINE.format(line=2, value="nope")
+
+        with pytest.raises(ValueError, match=re.escape(error)):
+            list(read_uuids([f"{uuid.uuid4()}\n", "nope\n"]))
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(
+        ("options", "error"),
+        [
+            ({"workers": 0}, ErrorMessages.INVALID_WORKERS),
+            ({"chunk_size": 0}, ErrorMessages.INVALID_CHUNK_SIZE),
+        ],
+    )
+    def test_run_invalid_options(
+        self,
+        options: dict[str, int],
+        error: ErrorMessages,
+    ) -> None:
+        """ワーカー数・チャンクサイズが正の整数でないと、ValueError が発生すること (run)
+
+        Args:
+            options (dict[str, int]): run に渡すオプション
+            error (ErrorMessages): 期待するエラーメッセージ
+
+        """
+        with pytest.raises(ValueError, match=re.escape(error.value)):
+            run([uuid.uuid4()], lambda *_: None, [16], "png", **options)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_latency_reservoir_invalid_capacity(self) -> None:
+        """標本数が正の整数でないと、ValueError が発生すること (LatencyReservoir)"""
+        error = ErrorMessages.INVALID_RESERVOIR_CAPACITY.value
+
+        with pytest.raises(ValueError, match=re.escape(error)):
+            LatencyReservoir(capacity=0)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_main_reports_invalid_uuid(
+        self,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """入力に不正な UUID があると、エラーを表示して終了コード1を返すこと
+
+        Args:
+            tmp_path (Path): 一時ディレクトリ
+            capsys (pytest.CaptureFixture[str]): 標準エラー出力のキャプチャ
+
+        """
+        uuid_file = tmp_path / "uuids.txt"
+        uuid_file.write_text("not-a-uuid\n")
+        error = ErrorMessages.INVALID_UUID_LINE.format(line=1, value="not-a-uuid")
+
+        code = main([str(tmp_path / "icons"), "-i", str(uuid_file)])
+
+        assert code == 1
+        assert error in capsys.readouterr().err
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_main_pack_with_several_sizes(
+        self,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """アイコンパックに複数のサイズを指定すると、何も作成せずに終了コード1を返すこと
+
+        Args:
+            tmp_path (Path): 一時ディレクトリ
+            capsys (pytest.CaptureFixture[str]): 標準エラー出力のキャプチャ
+
+        """
+        uuid_file = tmp_path / "uuids.txt"
+        uuid_file.write_text(f"{uuid.uuid4()}\n")
+        output = tmp_path / "icons.pack"
+
+        code = main([str(output), "-i", str(uuid_file), "-s", "16", "-s", "32"])
+
+        assert code == 1
+        assert ErrorMessages.PACK_REQUIRES_SINGLE_SIZE.value in capsys.readouterr().err
+        assert not output.exists()
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize("name", ["icons.zip", "icons.tar"])
+    def test_main_failure_keeps_existing_archive(
+        self,
+        tmp_path: Path,
+        name: str,
+    ) -> None:
+        """アーカイブの書き出し中に失敗すると、既存のファイルを残し一時ファイルを削除すること
+
+        Args:
+            tmp_path (Path): 一時ディレクトリ
+            name (str): 出力先のファイル名
+
+        """
+        uuid_file = tmp_path / "uuids.txt"
+        uuid_file.write_text(f"{uuid.uuid4()}\nnot-a-uuid\n")
+        output = tmp_path / name
+        output.write_bytes(b"previous archive")
+
+        code = main([str(output), "-i", str(uuid_file), "-s", "16"])
+
+        assert code == 1
+        assert output.read_bytes() == b"previous archive"
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            name,
+            "uuids.txt",
+        ]
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize("name", ["icons.tar.gz", "icons.tgz", "icons.7z"])
+    def test_main_rejects_unsupported_archive_suffix(
+        self,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+        name: str,
+    ) -> None:
+        """未対応のアーカイブの拡張子を指定すると、何も作成せずに終了コード1を返すこと
+
+        Args:
+            tmp_path (Path): 一時ディレクトリ
+            capsys (pytest.CaptureFixture[str]): 標準エラー出力のキャプチャ
+            name (str): 出力先のファイル名
+
+        """
+        uuid_file = tmp_path / "uuids.txt"
+        uuid_file.write_text(f"{uuid.uuid4()}\n")
+        output = tmp_path / name
+        error = ErrorMessages.UNSUPPORTED_ARCHIVE_FORMAT.format(
+            archive_format=output.suffix,
+        )
+
+        code = main([str(output), "-i", str(uuid_file)])
+
+        assert code == 1
+        assert error in capsys.readouterr().err
+        assert not output.exists()
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(
+        "arguments",
+        [["-s", "0"], ["-w", "abc"], ["-c", "-1"], ["-f", "gif"], ["-t", "rar"]],
+    )
+    def test_main_invalid_arguments(
+        self,
+        tmp_path: Path,
+        arguments: list[str],
+    ) -> None:
+        """不正なオプションを指定すると終了コード2で終了すること
+
+        Args:
+            tmp_path (Path): 一時ディレクトリ
+            arguments (list[str]): 不正なオプション
+
+        """
+        with pytest.raises(SystemExit) as exc_info:
+            main([str(tmp_path / "icons"), *arguments])
+
+        assert exc_info.value.code == 2  # noqa: PLR2004
@@ -0,0 +1,177 @@
+"""icon-generator コマンドの正常系テストケースを定義するモジュール。"""
+# test_bulk_command_positive.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import io
+import uuid
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from icon_generator.cli import BulkSummary, LatencyReservoir, main, read_uuids, run
+from icon_generator.generator.git import GitIconGenerator
+from icon_generator.pack import IconPackReader
+
+UUIDS = [uuid.UUID(int=index * 7919 + 1) for index in range(40)]
+
+
+@pytest.fixture
+def uuid_file(tmp_path: Path) -> Path:
+    """UUID を1行に1つ記載したファイル"""
+    path = tmp_path / "uuids.txt"
+    path.write_text("".join(f"{unique_uuid}\n" for unique_uuid in UUIDS))
+    return path
+
+
+class TestBulkCommandPositiveCases:
+    """icon-generator コマンドにおける正常系の動作を検証するテストクラス。"""
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_read_uuids_skips_blank_and_comment(self) -> None:
+        """read_uuids が空行とコメントを読み飛ばして UUID を返すこと"""
+        lines = ["# header\n", f"{UUIDS[0]}\n", "\n", f"  {UUIDS[1]}  # note\n"]
+
+        assert list(read_uuids(lines)) == UUIDS[:2]
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_run_renders_each_size_in_order(self) -> None:
+        """UUID ごとに全サイズの画像が入力順に書き出し先へ渡されること (run)"""
+        written: list[tuple[uuid.UUID, int, bytes]] = []
+
+        summary = run(
+            UUIDS,
+            lambda unique_uuid, size, data: written.append((unique_uuid, size, data)),
+            [16, 32],
+            GitIconGenerator.FORMAT_INDEXED_PNG,
+            workers=2,
+            chunk_size=3,
+        )
+
+        assert [(unique_uuid, size) for unique_uuid, size, _ in written] == [
+            (unique_uuid, size) for unique_uuid in UUIDS for size in (16, 32)
+        ]
+        assert written[0][2] == GitIconGenerator.generate_bytes(
+            UUIDS[0],
+            16,
+            GitIconGenerator.FORMAT_INDEXED_PNG,
+        )
+        assert summary.uuids == len(UUIDS)
+        assert summary.images == len(written)
+        assert summary.total_bytes == sum(len(data) for _, _, data in written)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_summary_report(self) -> None:
+        """BulkSummary がパーセンタイルを算出し、要約を出力すること"""
+        latencies = LatencyReservoir()
+        for index in range(1, 101):
+            latencies.add(index / 1000)
+        summary = BulkSummary.collect(
+            uuids=100,
+            images=100,
+            total_bytes=2_000_000,
+            elapsed=2.0,
+            latencies=latencies,
+        )
+        report = summary.report()
+
+        assert summary.images == 100  # noqa: PLR2004
+        assert summary.latency_p50 == pytest.approx(0.0505)
+        assert summary.latency_max == pytest.approx(0.1)
+        assert "throughput: 50.0 images/s, 1.00 MB/s" in report
+        assert "p50 50.500 ms" in report
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_latency_reservoir_is_bounded(self) -> None:
+        """標本数が capacity 件に抑えられ、件数と最大値は全件から求まること"""
+        latencies = LatencyReservoir(capacity=100)
+        for index in range(10_000):
+            latencies.add(index / 10_000)
+
+        assert len(latencies) == 100  # noqa: PLR2004
+        assert latencies.count == 10_000  # noqa: PLR2004
+        assert latencies.maximum == pytest.approx(0.9999)
+        p50, p99 = latencies.percentiles([50, 99])
+        assert 0.3 < p50 < 0.7  # noqa: PLR2004
+        assert p50 < p99 <= latencies.maximum
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_main_writes_directory_per_size(
+        self,
+        tmp_path: Path,
+        uuid_file: Path,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """複数サイズの場合、ディレクトリにサイズごとのサブディレクトリで書き出すこと
+
+        Args:
+            tmp_path (Path): 一時ディレクトリ
+            uuid_file (Path): UUID を記載したファイル
+            capsys (pytest.CaptureFixture[str]): 標準出力のキャプチャ
+
+        """
+        output = tmp_path / "icons"
+
+        code = main([str(output), "-i", str(uuid_file), "-s", "16", "-s", "24"])
+
+        assert code == 0
+        assert len(list((output / "16").iterdir())) == len(UUIDS)
+        assert (output / "24" / f"{UUIDS[3]}.png").read_bytes() == (
+            GitIconGenerator.generate_bytes(UUIDS[3], 24)
+        )
+        assert "throughput:" in capsys.readouterr().out
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_main_reads_stdin_into_archive(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """標準入力の UUID を、拡張子から判定した ZIP アーカイブに書き出すこと
+
+        Args:
+            tmp_path (Path): 一時ディレクトリ
+            monkeypatch (pytest.MonkeyPatch): MonkeyPatchインスタンス
+
+        """
+        output = tmp_path / "icons.zip"
+        lines = "".join(f"{unique_uuid}\n" for unique_uuid in UUIDS[:5])
+        monkeypatch.setattr("sys.stdin", io.StringIO(lines))
+
+        code = main([str(output), "-s", "20", "-f", "svg"])
+
+        with zipfile.ZipFile(output) as archive:
+            names = archive.namelist()
+            data = archive.read(f"{UUIDS[0]}.svg")
+        assert code == 0
+        assert names == [f"{unique_uuid}.svg" for unique_uuid in UUIDS[:5]]
+        assert data == GitIconGenerator.generate_bytes(UUIDS[0], 20, "svg")
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_main_writes_icon_pack(self, tmp_path: Path, uuid_file: Path) -> None:
+        """アイコンパックに UUID ごとの画像を書き出すこと
+
+        Args:
+            tmp_path (Path): 一時ディレクトリ
+            uuid_file (Path): UUID を記載したファイル
+
+        """
+        output = tmp_path / "icons.pack"
+
+        code = main([str(output), "-i", str(uuid_file), "-s", "16", "-c", "4"])
+
+        assert code == 0
+        with IconPackReader(output) as reader:
+            assert len(reader) == len(UUIDS)
+            assert reader[UUIDS[7]] == GitIconGenerator.generate_bytes(UUIDS[7], 16)
@@ -0,0 +1,82 @@
+"""ImageEncoder の異常系テストケースを定義するモジュール。"""
+# test_image_encoder_negative.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import re
+
+import pytest
+from PIL import Image
+
+from icon_generator.encoder import EncoderRegistry, RawEncoder
+from icon_generator.errors import ErrorMessages
+from icon_generator.generator.git import GitIconGenerator
+
+
+class TestImageEncoderNegativeCases:
+    """ImageEncoderにおける異常系の動作を検証するテストクラス。"""
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_unknown_encoder(self) -> None:
+        """登録されていない名前を取得すると ValueError が発生すること"""
+        error = ErrorMessages.UNSUPPORTED_ENCODER.format(name="bmp")
+
+        with pytest.raises(ValueError, match=re.escape(error)):
+            EncoderRegistry.get("bmp")
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize("name", sorted(EncoderRegistry.BUILTIN_PRESETS))
+    def test_register_builtin_preset(self, name: str) -> None:
+        """既定のプリセット名で登録すると ValueError が発生し、置き換わらないこと
+
+        Args:
+            name (str): 既定のプリセット名
+
+        """
+        encoder = EncoderRegistry.get(name)
+        error = ErrorMessages.RESERVED_ENCODER.format(name=name)
+
+        with pytest.raises(ValueError, match=re.escape(error)):
+            EncoderRegistry.register(name, RawEncoder("L"))
+        assert EncoderRegistry.get(name) is encoder
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(
+        "name",
+        [GitIconGenerator.FORMAT_SVG, GitIconGenerator.FORMAT_INDEXED_PNG],
+    )
+    def test_register_generator_format(self, name: str) -> None:
+        """GitIconGenerator のフォーマット名で登録すると ValueError が発生すること
+
+        Args:
+            name (str): GitIconGenerator が独自に扱うフォーマット名
+
+        """
+        error = ErrorMessages.RESERVED_ENCODER.format(name=name)
+
+        with pytest.raises(ValueError, match=re.escape(error)):
+            EncoderRegistry.register(name, RawEncoder("L"))
+        assert name not in EncoderRegistry.names()
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_pillow_without_webp(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Pillow に WebP のプラグインがない場合、ValueError が発生すること
+
+        Args:
+            monkeypatch (pytest.MonkeyPatch): MonkeyPatchインスタンス
+
+        """
+        Image.init()
+        monkeypatch.delitem(Image.SAVE, "WEBP")
+        encoder = EncoderRegistry.get(EncoderRegistry.PRESET_WEBP_LOSSLESS)
+        error = ErrorMessages.UNAVAILABLE_PILLOW_FORMAT.format(image_format="WEBP")
+
+        with pytest.raises(ValueError, match=re.escape(error)):
+            encoder.encode(Image.new("RGB", (4, 4)))
@@ -0,0 +1,221 @@
+"""ImageEncoder の正常系テストケースを定義するモジュール。"""
+# test_image_encoder_positive.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import uuid
+from collections.abc import Iterator
+from io import BytesIO
+from typing import BinaryIO
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from icon_generator.encoder import (
+    EncoderRegistry,
+    ImageEncoder,
+    PillowEncoder,
+    RawEncoder,
+)
+from icon_generator.generator import Generator
+
+
+class GrayEncoder(ImageEncoder):
+    """画像をグレースケールの画素値として書き出すテスト用のエンコーダ。"""
+
+    extension = ".gray"
+    media_type = "application/octet-stream"
+
+    def write(self, image: Image.Image, stream: BinaryIO) -> None:
+        """画像をグレースケールに変換して書き出す。
+
+        Args:
+            image (Image.Image): 描画済みの画像
+            stream (BinaryIO): 書き込み可能なバイナリストリーム
+
+        """
+        stream.write(image.convert("L").tobytes())
+
+
+class SolidGenerator(Generator):
+    """UUID の先頭3バイトの色で塗りつぶした PNG を生成するテスト用の生成器。"""
+
+    def __init__(self, unique_uuid: uuid.UUID) -> None:
+        """SolidGeneratorのコンストラクタ。
+
+        Args:
+            unique_uuid (uuid.UUID): UUID
+
+        """
+        self.rgb = tuple(unique_uuid.bytes[:3])
+
+    def generate_on_memory(self, image_size: int = 600) -> BytesIO:
+        """単色の PNG を生成する。
+
+        Args:
+            image_size (int, optional): イメージサイズ
+
+        Returns:
+            BytesIO: PNG画像
+
+        """
+        buffer = BytesIO()
+        Image.new("RGB", (image_size, image_size), self.rgb).save(buffer, "PNG")
+        buffer.seek(0)
+        return buffer
+
+
+@pytest.fixture
+def image() -> Image.Image:
+    """ランダムな画素値の RGB 画像"""
+    rng = np.random.default_rng(0)
+    return Image.fromarray(rng.integers(0, 256, (32, 32, 3), dtype=np.uint8))
+
+
+@pytest.fixture
+def gray_encoder() -> Iterator[GrayEncoder]:
+    """テスト用のエンコーダを gray として登録する (テスト後に登録を解除)"""
+    encoder = GrayEncoder()
+    EncoderRegistry.register("gray", encoder)
+    yield encoder
+    EncoderRegistry._encoders.pop("gray")
+
+
+class TestImageEncoderPositiveCases:
+    """ImageEncoderにおける正常系の動作を検証するテストクラス。"""
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(
+        ("name", "image_format"),
+        [
+            (EncoderRegistry.PRESET_PNG, "PNG"),
+            (EncoderRegistry.PRESET_PNG_FAST, "PNG"),
+            (EncoderRegistry.PRESET_PNG_MAX, "PNG"),
+            (EncoderRegistry.PRESET_WEBP_LOSSLESS, "WEBP"),
+        ],
+    )
+    def test_presets_are_lossless(
+        self,
+        image: Image.Image,
+        name: str,
+        image_format: str,
+    ) -> None:
+        """PNG・WebP のプリセットが可逆にエンコードすること
+
+        Args:
+            image (Image.Image): RGB 画像
+            name (str): プリセット名
+            image_format (str): 期待する画像フォーマット
+
+        """
+        encoded = Image.open(BytesIO(EncoderRegistry.get(name).encode(image)))
+
+        assert encoded.format == image_format
+        assert np.array_equal(np.asarray(encoded.convert("RGB")), np.asarray(image))
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_png_compress_levels(self, image: Image.Image) -> None:
+        """最大圧縮の PNG が高速な PNG 以下のサイズになること
+
+        Args:
+            image (Image.Image): RGB 画像
+
+        """
+        flat = image.resize((256, 256), Image.Resampling.NEAREST)
+        fast = EncoderRegistry.get(EncoderRegistry.PRESET_PNG_FAST).encode(flat)
+        small = EncoderRegistry.get(EncoderRegistry.PRESET_PNG_MAX).encode(flat)
+
+        assert len(small) <= len(fast)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(("mode", "channels"), [("RGB", 3), ("RGBA", 4)])
+    def test_raw_encoder(self, image: Image.Image, mode: str, channels: int) -> None:
+        """RawEncoder が画素値をヘッダなしで書き出すこと
+
+        Args:
+            image (Image.Image): RGB 画像
+            mode (str): 画像モード
+            channels (int): 1画素あたりのバイト数
+
+        """
+        encoder = EncoderRegistry.get(mode.lower())
+
+        data = encoder.encode(image)
+
+        assert isinstance(encoder, RawEncoder)
+        assert encoder.extension == f".{mode.lower()}"
+        assert len(data) == 32 * 32 * channels
+        assert data == image.convert(mode).tobytes()
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_register_custom_encoder(
+        self,
+        image: Image.Image,
+        gray_encoder: GrayEncoder,
+    ) -> None:
+        """独自のエンコーダを登録して名前で取得できること
+
+        Args:
+            image (Image.Image): RGB 画像
+            gray_encoder (GrayEncoder): 登録したエンコーダ
+
+        """
+        assert "gray" in EncoderRegistry.names()
+        assert EncoderRegistry.get("gray") is gray_encoder
+        assert EncoderRegistry.get("gray").encode(image) == image.convert("L").tobytes()
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_pillow_encoder_options(self, image: Image.Image) -> None:
+        """PillowEncoder が Image.save にオプションを渡すこと
+
+        Args:
+            image (Image.Image): RGB 画像
+
+        """
+        encoder = PillowEncoder("JPEG", ".jpg", "image/jpeg", quality=10)
+
+        low = encoder.encode(image)
+        high = PillowEncoder("JPEG", ".jpg", "image/jpeg", quality=95).encode(image)
+
+        assert Image.open(BytesIO(low)).format == "JPEG"
+        assert len(low) < len(high)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_cache_token_reflects_options(self, gray_encoder: GrayEncoder) -> None:
+        """cache_token がフォーマットやオプションの違いで異なる値となること
+
+        Args:
+            gray_encoder (GrayEncoder): 登録したエンコーダ
+
+        """
+        tokens = {
+            EncoderRegistry.get(name).cache_token
+            for name in EncoderRegistry.BUILTIN_PRESETS
+        }
+
+        assert len(tokens) == len(EncoderRegistry.BUILTIN_PRESETS)
+        fast = PillowEncoder("PNG", ".png", "image/png", compress_level=1)
+        preset = EncoderRegistry.get(EncoderRegistry.PRESET_PNG_FAST)
+        assert fast.cache_token == preset.cache_token
+        assert gray_encoder.cache_token.startswith(GrayEncoder.__qualname__)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_generator_default_encoding(self) -> None:
+        """Generator の既定の render_image・generate_encoded が動作すること"""
+        generator = SolidGenerator(uuid.UUID(bytes=bytes(range(16))))
+
+        raw = generator.generate_encoded(4, EncoderRegistry.PRESET_RGB).getvalue()
+
+        assert generator.render_image(4).size == (4, 4)
+        assert raw == bytes([0, 1, 2]) * 16
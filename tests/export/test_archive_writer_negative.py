@@ -0,0 +1,30 @@
+"""IconArchiveWriter の異常系テストケースを定義するモジュール。"""
+# test_archive_writer_negative.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import io
+import re
+
+import pytest
+
+from icon_generator.errors import ErrorMessages
+from icon_generator.export import IconArchiveWriter
+
+
+class TestIconArchiveWriterNegativeCases:
+    """IconArchiveWriterにおける異常系の動作を検証するテストクラス。"""
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_unsupported_archive_format(self) -> None:
+        """未対応のアーカイブ形式を指定すると ValueError が発生すること"""
+        expected = ErrorMessages.UNSUPPORTED_ARCHIVE_FORMAT.format(
+            archive_format="rar",
+        )
+
+        with pytest.raises(ValueError, match=re.escape(expected)):
+            IconArchiveWriter(io.BytesIO(), "rar")
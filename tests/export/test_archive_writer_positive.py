@@ -0,0 +1,117 @@
+"""IconArchiveWriter の正常系テストケースを定義するモジュール。"""
+# test_archive_writer_positive.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import io
+import tarfile
+import zipfile
+from typing import BinaryIO, cast
+
+import pytest
+
+from icon_generator.export import IconArchiveWriter
+
+
+class UnseekableStream(io.RawIOBase):
+    """書き込まれたデータを保持する、シーク不可能なテスト用のストリーム。"""
+
+    def __init__(self) -> None:
+        """UnseekableStreamのコンストラクタ。"""
+        self.data = bytearray()
+
+    def writable(self) -> bool:
+        """書き込み可能であることを返す。
+
+        Returns:
+            bool: 常に True
+
+        """
+        return True
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        """データを末尾に追加する。
+
+        Args:
+            data (bytes): 書き込むデータ
+
+        Returns:
+            int: 書き込んだバイト数
+
+        """
+        self.data += data
+        return len(data)
+
+
+ENTRIES = {"a.png": b"\x89PNG first", "b.png": b"\x89PNG second" * 100}
+
+
+class TestIconArchiveWriterPositiveCases:
+    """IconArchiveWriterにおける正常系の動作を検証するテストクラス。"""
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_zip_is_stored_on_unseekable_stream(self) -> None:
+        """シーク不可能なストリームに無圧縮の ZIP を書き出せること"""
+        stream = UnseekableStream()
+
+        with IconArchiveWriter(
+            cast("BinaryIO", stream),
+            IconArchiveWriter.FORMAT_ZIP,
+        ) as writer:
+            for name, data in ENTRIES.items():
+                writer.add(name, data)
+
+        assert writer.count == len(ENTRIES)
+        with zipfile.ZipFile(io.BytesIO(stream.data)) as archive:
+            assert archive.testzip() is None
+            assert {
+                info.filename: archive.read(info) for info in archive.infolist()
+            } == (ENTRIES)
+            assert all(
+                info.compress_type == zipfile.ZIP_STORED for info in archive.infolist()
+            )
+            assert [info.external_attr >> 16 for info in archive.infolist()] == [
+                0o644,
+            ] * len(ENTRIES)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_tar_on_unseekable_stream(self) -> None:
+        """シーク不可能なストリームに TAR を書き出せること"""
+        stream = UnseekableStream()
+
+        with IconArchiveWriter(
+            cast("BinaryIO", stream),
+            IconArchiveWriter.FORMAT_TAR,
+            timestamp=1_700_000_000,
+        ) as writer:
+            for name, data in ENTRIES.items():
+                writer.add(name, data)
+
+        with tarfile.open(fileobj=io.BytesIO(stream.data)) as archive:
+            members = archive.getmembers()
+            assert [member.mtime for member in members] == [1_700_000_000] * 2
+            assert [member.mode for member in members] == [0o644] * 2
+            assert {
+                member.name: archive.extractfile(member).read()  # type: ignore[union-attr]
+                for member in members
+            } == ENTRIES
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_entries_are_written_immediately(self) -> None:
+        """エントリが追加した時点でストリームに書き出されること"""
+        stream = UnseekableStream()
+        writer = IconArchiveWriter(
+            cast("BinaryIO", stream),
+            IconArchiveWriter.FORMAT_ZIP,
+        )
+
+        writer.add("a.png", ENTRIES["a.png"])
+
+        assert ENTRIES["a.png"] in stream.data
+        writer.close()
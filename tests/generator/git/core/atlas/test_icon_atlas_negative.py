@@ -0,0 +1,77 @@
+"""IconAtlas の異常系テストケースを定義するモジュール。"""
+# test_icon_atlas_negative.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import re
+import uuid
+
+import numpy as np
+import pytest
+
+from icon_generator.errors import ErrorMessages
+from icon_generator.generator.git.core.atlas import IconAtlas
+from icon_generator.generator.git.git_icon_generator import GitIconGenerator
+
+
+class TestIconAtlasNegativeCases:
+    """IconAtlasにおける異常系の動作を検証するテストクラス。"""
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_empty_uuids(self) -> None:
+        """UUID が空の場合に ValueError が発生すること"""
+        error = ErrorMessages.EMPTY_ATLAS.value
+        with pytest.raises(ValueError, match=re.escape(error)):
+            GitIconGenerator.generate_atlas([])
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(
+        ("tile_size", "columns", "error"),
+        [
+            (0, None, ErrorMessages.INVALID_TILE_SIZE),
+            (16, 0, ErrorMessages.INVALID_ATLAS_COLUMNS),
+        ],
+    )
+    def test_invalid_layout(
+        self,
+        tile_size: int,
+        columns: int | None,
+        error: ErrorMessages,
+    ) -> None:
+        """タイルサイズや列数が1未満の場合に ValueError が発生すること
+
+        Args:
+            tile_size (int): タイルサイズ
+            columns (int | None): 列数
+            error (ErrorMessages): 期待するエラーメッセージ
+
+        """
+        with pytest.raises(ValueError, match=re.escape(error.value)):
+            GitIconGenerator.generate_atlas([uuid.uuid4()], tile_size, columns)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_length_mismatch(self) -> None:
+        """キー・パターン・カラーの件数が一致しない場合に ValueError が発生すること"""
+        error = ErrorMessages.ATLAS_LENGTH_MISMATCH.value
+        with pytest.raises(ValueError, match=re.escape(error)):
+            IconAtlas.build(
+                keys=["a", "b"],
+                patterns=np.zeros((1, 5, 5), dtype=np.uint8),
+                colors=np.zeros((1, 3), dtype=np.uint8),
+                tile_size=8,
+            )
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_unknown_key(self) -> None:
+        """アトラスに含まれないキーの座標を参照すると KeyError が発生すること"""
+        atlas = GitIconGenerator.generate_atlas([uuid.uuid4()], 8)
+
+        with pytest.raises(KeyError):
+            atlas.position(str(uuid.uuid4()))
@@ -0,0 +1,120 @@
+"""IconAtlas の正常系テストケースを定義するモジュール。"""
+# test_icon_atlas_positive.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import json
+import uuid
+from io import BytesIO
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from icon_generator.generator.git.core.atlas import IconAtlas
+from icon_generator.generator.git.git_icon_generator import GitIconGenerator
+
+
+def open_rgb(data: bytes | BytesIO) -> np.ndarray:
+    """PNG 画像を RGB の配列として読み込む。
+
+    Args:
+        data (bytes | BytesIO): PNG 画像
+
+    Returns:
+        np.ndarray: shape=(高さ, 幅, 3) の配列
+
+    """
+    stream = BytesIO(data) if isinstance(data, bytes) else data
+    return np.asarray(Image.open(stream).convert("RGB"))
+
+
+class TestIconAtlasPositiveCases:
+    """IconAtlasにおける正常系の動作を検証するテストクラス。"""
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(
+        ("count", "tile_size", "mode"),
+        [(1, 8, "P"), (7, 30, "P"), (IconAtlas.PALETTE_LIMIT + 1, 5, "RGB")],
+    )
+    def test_tiles_match_generate_on_memory(
+        self,
+        count: int,
+        tile_size: int,
+        mode: str,
+    ) -> None:
+        """各タイルの画素が generate_on_memory で生成した画像と一致すること
+
+        Args:
+            count (int): アイコン数
+            tile_size (int): タイルサイズ
+            mode (str): 期待するアトラスの画像モード
+
+        """
+        uuids = [uuid.uuid4() for _ in range(count)]
+
+        atlas = GitIconGenerator.generate_atlas(uuids, tile_size)
+
+        image = Image.open(BytesIO(atlas.image))
+        assert image.mode == mode
+        assert image.size == (atlas.columns * tile_size, atlas.rows * tile_size)
+        pixels = open_rgb(atlas.image)
+        for unique_uuid in uuids:
+            x, y = atlas.position(str(unique_uuid))
+            expected = open_rgb(
+                GitIconGenerator(unique_uuid).generate_on_memory(tile_size),
+            )
+            assert (pixels[y : y + tile_size, x : x + tile_size] == expected).all()
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_layout_is_row_major(self) -> None:
+        """指定した列数で行優先に配置され、余りのタイルは白になること"""
+        uuids = [uuid.uuid4() for _ in range(5)]
+
+        atlas = GitIconGenerator.generate_atlas(uuids, tile_size=4, columns=3)
+
+        assert (atlas.columns, atlas.rows) == (3, 2)
+        assert [atlas.position(str(u)) for u in uuids] == [
+            (0, 0),
+            (4, 0),
+            (8, 0),
+            (0, 4),
+            (4, 4),
+        ]
+        assert (open_rgb(atlas.image)[4:8, 8:12] == 255).all()  # noqa: PLR2004
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_default_columns_is_near_square(self) -> None:
+        """列数を省略した場合、アトラスが正方形に近い列数になること"""
+        atlas = GitIconGenerator.generate_atlas([uuid.uuid4() for _ in range(10)], 4)
+
+        assert (atlas.columns, atlas.rows) == (4, 3)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_to_json_index(self) -> None:
+        """JSON のインデックスが画像サイズと UUID ごとの座標を持つこと"""
+        uuids = [uuid.uuid4() for _ in range(3)]
+        atlas = GitIconGenerator.generate_atlas(uuids, tile_size=16, columns=2)
+
+        index = json.loads(atlas.to_json())
+
+        assert index == {
+            "width": 32,
+            "height": 32,
+            "tile_size": 16,
+            "columns": 2,
+            "rows": 2,
+            "icons": {
+                str(uuids[0]): [0, 0],
+                str(uuids[1]): [16, 0],
+                str(uuids[2]): [0, 16],
+            },
+        }
+        assert " " not in atlas.to_json()
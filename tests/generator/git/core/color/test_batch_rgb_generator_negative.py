@@ -0,0 +1,50 @@
+"""BatchRGBGenerator の異常系テストケースを定義するモジュール。"""
+# test_batch_rgb_generator_negative.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+from typing import Any
+
+import pytest
+
+from icon_generator.generator.git.core.color import BatchRGBGenerator
+
+
+class TestBatchRGBGeneratorNegativeCases:
+    """BatchRGBGeneratorにおける異常系の動作を検証するテストクラス。"""
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(
+        ("invalid_patterns", "expected_message"),
+        [
+            (["abc"], "hex_pattern must be exactly"),
+            (["abcdef012"], "hex_pattern must be exactly"),
+            (["abcde0g"], "hex_pattern must only contain hexadecimal characters"),
+            (["abcde0é"], "hex_pattern must only contain hexadecimal characters"),
+            ([1.5], "hex_pattern must only contain hexadecimal characters"),
+            ([-1], "Each color value must be an integer between 0 and"),
+            ([0x10000000], "Each color value must be an integer between 0 and"),
+        ],
+    )
+    def test_from_patterns_invalid_input_raise_value_error(
+        self,
+        invalid_patterns: list[Any],
+        expected_message: str,
+    ) -> None:
+        """from_patterns に不正な値を渡すと ValueError が発生すること
+
+        文字列長が7でない場合に ValueError が発生すること
+        16進数以外の文字を含む場合に ValueError が発生すること
+        整数値が 0-0xFFFFFFF の範囲外の場合に ValueError が発生すること
+
+        Args:
+            invalid_patterns (list[Any]): 不正なカラーパターン
+            expected_message (str): 例外のメッセージ
+
+        """
+        with pytest.raises(ValueError, match=expected_message):
+            BatchRGBGenerator.from_patterns(invalid_patterns)
@@ -0,0 +1,131 @@
+"""BatchRGBGenerator の正常系テストケースを定義するモジュール。"""
+# test_batch_rgb_generator_positive.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import colorsys
+import math
+
+import numpy as np
+import pytest
+
+from icon_generator.generator.git.core.color import BatchRGBGenerator, RGBGenerator
+from icon_generator.generator.git.core.color.hsl_converter import HSLConverter
+
+
+class TestBatchRGBGeneratorPositiveCases:
+    """BatchRGBGeneratorにおける正常系の動作を検証するテストクラス。"""
+
+    @pytest.fixture
+    def color_patterns(self) -> list[str]:
+        """有効な16進数文字列(文字長7)のリスト"""
+        return ["0000000", "fffffff", "8008080", "abcde01", "1234567"]
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_from_values_shape(self, color_patterns: list[str]) -> None:
+        """from_values が shape=(N, 3) の uint8 配列を返すこと
+
+        Args:
+            color_patterns (list[str]): 有効な16進数文字列のリスト
+
+        """
+        values = np.array([int(pattern, 16) for pattern in color_patterns])
+        rgb = BatchRGBGenerator.from_values(values)
+
+        assert rgb.shape == (len(color_patterns), 3)
+        assert rgb.dtype == np.uint8
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_from_values_matches_rgb_generator(
+        self,
+        color_patterns: list[str],
+    ) -> None:
+        """from_values の結果が RGBGenerator と一致すること
+
+        Args:
+            color_patterns (list[str]): 有効な16進数文字列のリスト
+
+        """
+        values = np.array([int(pattern, 16) for pattern in color_patterns])
+        rgb = BatchRGBGenerator.from_values(values)
+
+        for pattern, color in zip(color_patterns, rgb, strict=True):
+            assert tuple(color.tolist()) == RGBGenerator(pattern).rgb
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_from_patterns_with_hex_strings(self, color_patterns: list[str]) -> None:
+        """from_patterns に16進数文字列を渡した結果が RGBGenerator と一致すること
+
+        Args:
+            color_patterns (list[str]): 有効な16進数文字列のリスト
+
+        """
+        rgb = BatchRGBGenerator.from_patterns(color_patterns)
+
+        for pattern, color in zip(color_patterns, rgb, strict=True):
+            assert tuple(color.tolist()) == RGBGenerator(pattern).rgb
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_from_patterns_accepts_strings_and_values(
+        self,
+        color_patterns: list[str],
+    ) -> None:
+        """文字列・大文字・bytes・整数値のいずれを渡しても同じ結果となること
+
+        Args:
+            color_patterns (list[str]): 有効な16進数文字列のリスト
+
+        """
+        expected = BatchRGBGenerator.from_patterns(color_patterns)
+
+        upper = [pattern.upper() for pattern in color_patterns]
+        encoded = np.array([pattern.encode() for pattern in color_patterns])
+        values = [int(pattern, 16) for pattern in color_patterns]
+
+        for color_input in (upper, encoded, values):
+            rgb = BatchRGBGenerator.from_patterns(color_input)
+            np.testing.assert_array_equal(rgb, expected)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_from_patterns_with_empty_input(self) -> None:
+        """from_patterns に空のリストを渡すと shape=(0, 3) の配列が返ること"""
+        rgb = BatchRGBGenerator.from_patterns([])
+
+        assert rgb.shape == (0, 3)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_from_values_is_bit_identical_for_all_hsl(self) -> None:
+        """丸め後に取り得るすべての HSL の組み合わせで colorsys の結果と一致すること
+
+        各フィールドの値から丸め後の代表値を1つずつ選び、全組み合わせについて
+        HSLConverter と colorsys.hls_to_rgb による変換結果と比較する。
+        """
+        fields = np.arange(0x1000)
+        hues, sats, lums = HSLConverter.from_arrays(
+            hue_values=fields,
+            sat_values=fields[:0x100],
+            lum_values=fields[:0x100],
+        )
+        _, hue_index = np.unique(hues, return_index=True)
+        _, sat_index = np.unique(sats, return_index=True)
+        _, lum_index = np.unique(lums, return_index=True)
+        hue, sat, lum = np.meshgrid(hue_index, sat_index, lum_index, indexing="ij")
+        values = (hue << 16 | sat << 8 | lum).reshape(-1)
+
+        rgb = BatchRGBGenerator.from_values(values)
+
+        expected = []
+        for value in values.tolist():
+            h, s, l = HSLConverter.from_pattern(f"{value:07x}")  # noqa: E741
+            icon_rgb = colorsys.hls_to_rgb(h / 360, l / 100, s / 100)
+            expected.append([math.floor(v * 255) for v in icon_rgb])
+        np.testing.assert_array_equal(rgb, np.array(expected, dtype=np.uint8))
@@ -0,0 +1,71 @@
+"""ColorLUT の異常系テストケースを定義するモジュール。"""
+# test_color_lut_negative.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from icon_generator.generator.git.core.color import ColorLUT
+
+
+class TestColorLUTNegativeCases:
+    """ColorLUTにおける異常系の動作を検証するテストクラス。"""
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(
+        "invalid_table",
+        [
+            np.zeros((361, 21, 21), dtype=np.uint8),
+            np.zeros((361, 21, 21, 3), dtype=np.int64),
+        ],
+    )
+    def test_invalid_table_raise_value_error(
+        self,
+        invalid_table: np.ndarray,
+    ) -> None:
+        """テーブルの形状・型が不正な場合に ValueError が発生すること
+
+        Args:
+            invalid_table (np.ndarray): 不正なテーブル
+
+        """
+        with pytest.raises(ValueError, match="color lookup table must be"):
+            ColorLUT(invalid_table)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_load_invalid_file_raise_value_error(self, tmp_path: Path) -> None:
+        """形状の異なる .npy ファイルを読み込むと ValueError が発生すること
+
+        Args:
+            tmp_path (Path): 一時ディレクトリ
+
+        """
+        path = tmp_path / "invalid.npy"
+        np.save(path, np.zeros((4, 3), dtype=np.uint8))
+
+        with pytest.raises(ValueError, match="color lookup table must be"):
+            ColorLUT.load(path)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize("invalid_pattern", ["abcde0g", "-123456"])
+    def test_lookup_invalid_pattern_raise_value_error(
+        self,
+        invalid_pattern: str,
+    ) -> None:
+        """ColorLUT.lookup に不正な文字列を渡すと ValueError が発生すること
+
+        Args:
+            invalid_pattern (str): 不正なカラーパターン
+
+        """
+        with pytest.raises(ValueError, match=r"invalid literal|hexadecimal"):
+            ColorLUT.get_default().lookup(invalid_pattern)
@@ -0,0 +1,129 @@
+"""ColorLUT の正常系テストケースを定義するモジュール。"""
+# test_color_lut_positive.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from icon_generator.generator.git.core.color import BatchRGBGenerator, ColorLUT
+
+
+class TestColorLUTPositiveCases:
+    """ColorLUTにおける正常系の動作を検証するテストクラス。"""
+
+    @pytest.fixture
+    def lut(self) -> ColorLUT:
+        """ColorLUTインスタンス"""
+        return ColorLUT.build()
+
+    @pytest.fixture
+    def color_values(self) -> list[int]:
+        """カラーパターンの整数値のリスト"""
+        return [0x0000000, 0xFFFFFFF, 0x8008080, 0xABCDE01, 0x1234567]
+
+    @pytest.fixture
+    def reset_default(self) -> Iterator[None]:
+        """既定の ColorLUT をテスト前後で破棄する"""
+        ColorLUT.set_default(None)
+        yield
+        ColorLUT.set_default(None)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_build_table_shape(self, lut: ColorLUT) -> None:
+        """ColorLUT.build で生成したテーブルの形状が (361, 21, 21, 3) であること
+
+        Args:
+            lut (ColorLUT): ColorLUTインスタンス
+
+        """
+        assert lut.table.shape == (361, 21, 21, 3)
+        assert lut.table.dtype == np.uint8
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_lookup_matches_batch_rgb_generator(
+        self,
+        lut: ColorLUT,
+        color_values: list[int],
+    ) -> None:
+        """Lookup・lookup_value の結果が BatchRGBGenerator の計算結果と一致すること
+
+        Args:
+            lut (ColorLUT): ColorLUTインスタンス
+            color_values (list[int]): カラーパターンの整数値のリスト
+
+        """
+        expected = BatchRGBGenerator.from_values(np.array(color_values))
+
+        for value, rgb in zip(color_values, expected, strict=True):
+            assert lut.lookup(f"{value:07x}") == tuple(rgb.tolist())
+            assert lut.lookup_value(value) == tuple(rgb.tolist())
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_from_values_matches_batch_rgb_generator(self, lut: ColorLUT) -> None:
+        """from_values の結果が全ての色相フィールドで BatchRGBGenerator と一致すること
+
+        Args:
+            lut (ColorLUT): ColorLUTインスタンス
+
+        """
+        values = np.arange(0x1000) << 16 | np.arange(0x1000) % 0x100 * 0x101
+
+        np.testing.assert_array_equal(
+            lut.from_values(values),
+            BatchRGBGenerator.from_values(values),
+        )
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_save_and_load_with_mmap(self, lut: ColorLUT, tmp_path: Path) -> None:
+        """ColorLUT.save したテーブルをメモリマップで読み込めること
+
+        Args:
+            lut (ColorLUT): ColorLUTインスタンス
+            tmp_path (Path): 一時ディレクトリ
+
+        """
+        path = tmp_path / "color_lut.npy"
+        lut.save(path)
+
+        loaded = ColorLUT.load(path)
+
+        assert isinstance(loaded.table, np.memmap)
+        np.testing.assert_array_equal(loaded.table, lut.table)
+        assert loaded.lookup("abcde01") == lut.lookup("abcde01")
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.usefixtures("reset_default")
+    def test_get_default_loads_from_env(
+        self,
+        lut: ColorLUT,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """環境変数でパスを指定すると既定の ColorLUT がファイルから読み込まれること
+
+        Args:
+            lut (ColorLUT): ColorLUTインスタンス
+            tmp_path (Path): 一時ディレクトリ
+            monkeypatch (pytest.MonkeyPatch): MonkeyPatchインスタンス
+
+        """
+        path = tmp_path / "color_lut.npy"
+        lut.save(path)
+        monkeypatch.setenv(ColorLUT.ENV_PATH, str(path))
+
+        default = ColorLUT.get_default()
+
+        assert isinstance(default.table, np.memmap)
+        assert ColorLUT.get_default() is default
@@ -0,0 +1,51 @@
+"""ICOWriter の異常系テストケースを定義するモジュール。"""
+# test_ico_writer_negative.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import re
+
+import pytest
+
+from icon_generator.errors import ErrorMessages
+from icon_generator.generator.git.core.ico import ICOWriter
+
+
+class TestICOWriterNegativeCases:
+    """ICOWriterにおける異常系の動作を検証するテストクラス。"""
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize("images", [{}, {0: b"png"}, {257: b"png"}])
+    def test_invalid_sizes(self, images: dict[int, bytes]) -> None:
+        """画像が空、もしくはサイズが 1〜256 の範囲外の場合に ValueError が発生すること
+
+        Args:
+            images (dict[int, bytes]): サイズごとの画像
+
+        """
+        error = ErrorMessages.INVALID_ICO_SIZES.format(maximum=ICOWriter.MAX_SIZE)
+
+        with pytest.raises(ValueError, match=re.escape(error)):
+            ICOWriter.encode(images)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(
+        "data",
+        [b"", b"GIF89a", b"\x89PNG\r\n\x1a\n", b"\x89PNG\r\n\x1a\n" + bytes(17)],
+    )
+    def test_not_png(self, data: bytes) -> None:
+        """PNG 画像でないデータが含まれる場合に ValueError が発生すること
+
+        Args:
+            data (bytes): 画像のデータ
+
+        """
+        error = ErrorMessages.INVALID_ICO_IMAGE.format(size=16)
+
+        with pytest.raises(ValueError, match=re.escape(error)):
+            ICOWriter.encode({16: data})
@@ -0,0 +1,83 @@
+"""ICOWriter の正常系テストケースを定義するモジュール。"""
+# test_ico_writer_positive.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from icon_generator.generator.git.core.ico import ICOWriter
+
+
+def solid_png(size: int, color: tuple[int, int, int]) -> bytes:
+    """単色の PNG 画像を生成する。
+
+    Args:
+        size (int): 一辺のサイズ
+        color (tuple[int, int, int]): 色
+
+    Returns:
+        bytes: PNG 画像
+
+    """
+    buffer = BytesIO()
+    Image.new("RGB", (size, size), color).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+class TestICOWriterPositiveCases:
+    """ICOWriterにおける正常系の動作を検証するテストクラス。"""
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_encode_multi_size_ico(self) -> None:
+        """複数サイズの PNG がサイズの昇順に ICO に格納されること"""
+        images = {
+            256: solid_png(256, (0, 0, 255)),
+            16: solid_png(16, (255, 0, 0)),
+            32: solid_png(32, (0, 255, 0)),
+        }
+
+        ico = ICOWriter.encode(images)
+
+        header = ICOWriter.HEADER.unpack_from(ico)
+        assert header == (0, ICOWriter.TYPE_ICON, 3)
+        entries = [
+            ICOWriter.ENTRY.unpack_from(ico, ICOWriter.HEADER.size + i * 16)
+            for i in range(3)
+        ]
+        assert [entry[0] for entry in entries] == [16, 32, 0]
+        for size, entry in zip((16, 32, 256), entries, strict=True):
+            length, offset = entry[6], entry[7]
+            assert ico[offset : offset + length] == images[size]
+
+        image = Image.open(BytesIO(ico))
+        assert image.format == "ICO"
+        assert sorted(image.info["sizes"]) == [(16, 16), (32, 32), (256, 256)]
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(
+        ("mode", "bits"),
+        [("RGB", 24), ("RGBA", 32), ("L", 8), ("LA", 16), ("1", 1)],
+    )
+    def test_entry_bits_follow_png(self, mode: str, bits: int) -> None:
+        """ICONDIRENTRY のビット数が PNG のビット深度とカラータイプに一致すること
+
+        Args:
+            mode (str): PNG の画像モード
+            bits (int): 期待する1画素あたりのビット数
+
+        """
+        buffer = BytesIO()
+        Image.new(mode, (8, 8)).save(buffer, "PNG")
+
+        ico = ICOWriter.encode({8: buffer.getvalue()})
+
+        entry = ICOWriter.ENTRY.unpack_from(ico, ICOWriter.HEADER.size)
+        assert entry[5] == bits
@@ -0,0 +1,71 @@
+"""BatchPatternGenerator の正常系テストケースを定義するモジュール。"""
+# test_batch_pattern_generator_positive.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import numpy as np
+import pytest
+
+from icon_generator.generator.git.core.pattern import (
+    BatchPatternGenerator,
+    PatternGenerator,
+)
+
+
+class TestBatchPatternGeneratorPositiveCases:
+    """BatchPatternGeneratorにおける正常系の動作を検証するテストクラス。"""
+
+    @pytest.fixture
+    def hex_patterns(self) -> list[str]:
+        """有効な16進数文字列のリスト"""
+        return [
+            "abcde0123456789",
+            "2468ace02468ace",
+            "13579bdf13579bd",
+            "f1f1f1111111111",
+        ]
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_from_nibbles_shape(self, hex_patterns: list[str]) -> None:
+        """from_nibbles が shape=(N, 5, 5) の uint8 配列を返すこと
+
+        対象メソッド: from_nibbles
+        in:  shape=(N, 15) のニブル配列
+        out: shape=(N, 5, 5) の uint8 配列
+        """
+        nibbles = np.array(
+            [[int(x, 16) for x in hex_pattern] for hex_pattern in hex_patterns],
+            dtype=np.uint8,
+        )
+        patterns = BatchPatternGenerator.from_nibbles(nibbles)
+
+        assert patterns.shape == (len(hex_patterns), 5, 5)
+        assert patterns.dtype == np.uint8
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_from_nibbles_matches_pattern_generator(
+        self,
+        hex_patterns: list[str],
+    ) -> None:
+        """from_nibbles の結果が PatternGenerator と一致すること
+
+        対象メソッド: from_nibbles
+        in:  shape=(N, 15) のニブル配列
+        out: 各行が PatternGenerator.pattern と一致する配列
+        """
+        nibbles = np.array(
+            [[int(x, 16) for x in hex_pattern] for hex_pattern in hex_patterns],
+            dtype=np.uint8,
+        )
+        patterns = BatchPatternGenerator.from_nibbles(nibbles)
+
+        for hex_pattern, pattern in zip(hex_patterns, patterns, strict=True):
+            np.testing.assert_array_equal(
+                pattern,
+                PatternGenerator(hex_pattern).pattern,
+            )
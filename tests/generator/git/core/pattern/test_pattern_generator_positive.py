@@ -161,3 +161,31 @@ class TestPatternGeneratorPositiveCases:
 
         expected = np.tile((255, 255, 255), (white_pixels.shape[0], 1))
         assert np.array_equal(white_pixels, expected)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_bits_identifies_pattern(self, generator: PatternGenerator) -> None:
+        """Bits がパターンの左3列を表す15ビットの整数であること
+
+        対象メソッド: bits, to_bits
+        in:  shape=(5, 5)の多次元配列
+        out: 左3列のセルを行優先で並べた15ビットの整数
+        """
+        expected = int("".join(str(v) for v in generator.pattern[:, :3].ravel()), 2)
+
+        assert generator.bits == expected
+        assert PatternGenerator.to_bits(generator.pattern) == expected
+        assert 0 <= generator.bits < 1 << 15
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_from_bits_restores_pattern(self, generator: PatternGenerator) -> None:
+        """from_bits で to_bits の結果から同じパターンを復元できること
+
+        対象メソッド: from_bits
+        in:  to_bits で得た15ビットの整数
+        out: 元と同じパターンを持つ PatternGenerator
+        """
+        restored = PatternGenerator.from_bits(generator.bits)
+
+        np.testing.assert_array_equal(restored.pattern, generator.pattern)
@@ -0,0 +1,31 @@
+"""PalettePNGWriter の異常系テストケースを定義するモジュール。"""
+# test_palette_png_writer_negative.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import pytest
+
+from icon_generator.generator.git.core.pattern import PatternGenerator
+from icon_generator.generator.git.core.png import PalettePNGWriter
+
+
+class TestPalettePNGWriterNegativeCases:
+    """PalettePNGWriterにおける異常系の動作を検証するテストクラス。"""
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize("invalid_size", [0, -1])
+    def test_invalid_size_raise_value_error(self, invalid_size: int) -> None:
+        """画像サイズが1未満の場合に ValueError が発生すること
+
+        Args:
+            invalid_size (int): 不正な画像サイズ
+
+        """
+        pattern = PatternGenerator("abcde0123456789").pattern
+
+        with pytest.raises(ValueError, match="image_size must be a positive integer"):
+            PalettePNGWriter.encode(pattern, (0, 0, 0), invalid_size)
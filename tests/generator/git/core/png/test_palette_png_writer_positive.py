@@ -0,0 +1,160 @@
+"""PalettePNGWriter の正常系テストケースを定義するモジュール。"""
+# test_palette_png_writer_positive.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import os
+import tracemalloc
+from io import BytesIO
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+from PIL.Image import Resampling
+
+from icon_generator.generator.git.core.pattern import PatternGenerator
+from icon_generator.generator.git.core.png import PalettePNGWriter
+
+
+class TestPalettePNGWriterPositiveCases:
+    """PalettePNGWriterにおける正常系の動作を検証するテストクラス。"""
+
+    @pytest.fixture
+    def pattern_generator(self) -> PatternGenerator:
+        """PatternGeneratorインスタンス"""
+        return PatternGenerator("abcde0123456789")
+
+    @pytest.fixture
+    def rgb(self) -> tuple[int, int, int]:
+        """アイコンの色"""
+        return (100, 150, 200)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_encode_palette_png(
+        self,
+        pattern_generator: PatternGenerator,
+        rgb: tuple[int, int, int],
+    ) -> None:
+        """1ビットのパレット形式 PNG が指定したサイズで生成されること
+
+        Args:
+            pattern_generator (PatternGenerator): PatternGeneratorインスタンス
+            rgb (tuple[int, int, int]): アイコンの色
+
+        """
+        size = 128
+        png = PalettePNGWriter.encode(pattern_generator.pattern, rgb, size)
+
+        img = Image.open(BytesIO(png))
+        assert img.format == "PNG"
+        assert img.mode == "P"
+        assert img.size == (size, size)
+        assert img.getpalette() == [255, 255, 255, *rgb]
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize("size", [1, 3, 5, 7, 64, 99, 600, 1001])
+    def test_encode_matches_pillow_nearest(
+        self,
+        pattern_generator: PatternGenerator,
+        rgb: tuple[int, int, int],
+        size: int,
+    ) -> None:
+        """Pillow の NEAREST リサイズと同じ画素の画像が生成されること
+
+        Args:
+            pattern_generator (PatternGenerator): PatternGeneratorインスタンス
+            rgb (tuple[int, int, int]): アイコンの色
+            size (int): 画像サイズ
+
+        """
+        colored = pattern_generator.apply_color(rgb).astype("uint8")
+        expected = Image.fromarray(colored).resize(
+            (size, size),
+            resample=Resampling.NEAREST,
+        )
+
+        png = PalettePNGWriter.encode(pattern_generator.pattern, rgb, size)
+        actual = Image.open(BytesIO(png)).convert("RGB")
+
+        np.testing.assert_array_equal(np.asarray(actual), np.asarray(expected))
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_encode_is_header_palette_and_body(
+        self,
+        pattern_generator: PatternGenerator,
+        rgb: tuple[int, int, int],
+    ) -> None:
+        """Encode の結果が header・palette・body の連結と一致すること
+
+        Args:
+            pattern_generator (PatternGenerator): PatternGeneratorインスタンス
+            rgb (tuple[int, int, int]): アイコンの色
+
+        """
+        size = 64
+        png = PalettePNGWriter.encode(pattern_generator.pattern, rgb, size)
+
+        assert png == (
+            PalettePNGWriter.header(size)
+            + PalettePNGWriter.palette(rgb)
+            + PalettePNGWriter.body(pattern_generator.pattern, size)
+        )
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize("size", [1, 600, 5000])
+    def test_write_matches_encode(
+        self,
+        pattern_generator: PatternGenerator,
+        rgb: tuple[int, int, int],
+        size: int,
+    ) -> None:
+        """Write でストリームに書き出した内容が encode の結果と一致すること
+
+        Args:
+            pattern_generator (PatternGenerator): PatternGeneratorインスタンス
+            rgb (tuple[int, int, int]): アイコンの色
+            size (int): 画像サイズ
+
+        """
+        stream = BytesIO()
+        written = PalettePNGWriter.write(stream, pattern_generator.pattern, rgb, size)
+
+        expected = PalettePNGWriter.encode(pattern_generator.pattern, rgb, size)
+        assert stream.getvalue() == expected
+        assert written == len(expected)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_write_large_image_with_bounded_memory(
+        self,
+        pattern_generator: PatternGenerator,
+        rgb: tuple[int, int, int],
+    ) -> None:
+        """巨大なサイズでも画像全体を保持せずに書き出せること
+
+        16384x16384 の RGB 画像 (約768MB) に対し、ピーク時のメモリ使用量が
+        数MB程度に収まることを確認する。
+
+        Args:
+            pattern_generator (PatternGenerator): PatternGeneratorインスタンス
+            rgb (tuple[int, int, int]): アイコンの色
+
+        """
+        size = 16384
+        tracemalloc.start()
+        try:
+            with Path(os.devnull).open("wb") as stream:
+                PalettePNGWriter.write(stream, pattern_generator.pattern, rgb, size)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert peak < 8 * 1024 * 1024
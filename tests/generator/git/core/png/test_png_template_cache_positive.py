@@ -0,0 +1,171 @@
+"""PNGTemplateCache の正常系テストケースを定義するモジュール。"""
+# test_png_template_cache_positive.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import numpy as np
+import pytest
+
+from icon_generator.generator.git.core.pattern import PatternGenerator
+from icon_generator.generator.git.core.png import PalettePNGWriter, PNGTemplateCache
+
+
+def template_bytes(pattern: np.ndarray, image_size: int = 600) -> int:
+    """PNGTemplateCache が1つのテンプレートとして保持するバイト数を返す。
+
+    Args:
+        pattern (np.ndarray): バイナリパターン
+        image_size (int, optional): 画像サイズ
+
+    Returns:
+        int: シグネチャ・IHDR と IDAT・IEND の合計バイト数
+
+    """
+    compress_level = PalettePNGWriter.DEFAULT_COMPRESS_LEVEL
+    header = PalettePNGWriter.header(image_size)
+    return len(header) + len(PalettePNGWriter.body(pattern, image_size, compress_level))
+
+
+class TestPNGTemplateCachePositiveCases:
+    """PNGTemplateCacheにおける正常系の動作を検証するテストクラス。"""
+
+    @pytest.fixture
+    def cache(self) -> PNGTemplateCache:
+        """PNGTemplateCacheインスタンス"""
+        return PNGTemplateCache()
+
+    @pytest.fixture
+    def patterns(self) -> list[PatternGenerator]:
+        """互いに異なる PatternGenerator のリスト"""
+        return [
+            PatternGenerator("abcde0123456789"),
+            PatternGenerator("2468ace02468ace"),
+            PatternGenerator("13579bdf13579bd"),
+        ]
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_render_matches_encode(
+        self,
+        cache: PNGTemplateCache,
+        patterns: list[PatternGenerator],
+    ) -> None:
+        """キャッシュの有無にかかわらず PalettePNGWriter.encode と同じ PNG を返すこと
+
+        Args:
+            cache (PNGTemplateCache): PNGTemplateCacheインスタンス
+            patterns (list[PatternGenerator]): PatternGeneratorのリスト
+
+        """
+        pattern = patterns[0].pattern
+        for rgb in [(10, 20, 30), (200, 100, 0)]:
+            png = cache.render(pattern, rgb, 64)
+            assert png == PalettePNGWriter.encode(pattern, rgb, 64)
+
+        assert cache.misses == 1
+        assert cache.hits == 1
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_render_keyed_by_pattern_and_size(
+        self,
+        cache: PNGTemplateCache,
+        patterns: list[PatternGenerator],
+    ) -> None:
+        """パターンまたは画像サイズが異なる場合は別のエントリとなること
+
+        Args:
+            cache (PNGTemplateCache): PNGTemplateCacheインスタンス
+            patterns (list[PatternGenerator]): PatternGeneratorのリスト
+
+        """
+        cache.render(patterns[0].pattern, (0, 0, 0), 64)
+        cache.render(patterns[0].pattern, (0, 0, 0), 128)
+        cache.render(patterns[1].pattern, (0, 0, 0), 64)
+
+        assert cache.misses == 3  # noqa: PLR2004
+        assert cache.hits == 0
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_least_recently_used_entry_is_evicted(
+        self,
+        patterns: list[PatternGenerator],
+    ) -> None:
+        """合計バイト数の上限を超えると最も長く使われていないエントリが破棄されること
+
+        Args:
+            patterns (list[PatternGenerator]): PatternGeneratorのリスト
+
+        """
+        first, second, third = (generator.pattern for generator in patterns)
+        cache = PNGTemplateCache(
+            max_bytes=template_bytes(first)
+            + max(template_bytes(second), template_bytes(third)),
+        )
+        cache.render(first, (0, 0, 0))
+        cache.render(second, (0, 0, 0))
+        cache.render(first, (0, 0, 0))
+        cache.render(third, (0, 0, 0))
+
+        assert len(cache) == 2  # noqa: PLR2004
+        assert cache.current_bytes == template_bytes(first) + template_bytes(third)
+        assert cache.current_bytes <= cache.max_bytes
+        cache.render(first, (0, 0, 0))
+        assert cache.hits == 2  # noqa: PLR2004
+        cache.render(second, (0, 0, 0))
+        assert cache.misses == 4  # noqa: PLR2004
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize("max_bytes", [0, 100])
+    def test_template_over_budget_is_not_cached(
+        self,
+        patterns: list[PatternGenerator],
+        max_bytes: int,
+    ) -> None:
+        """上限が0の場合や上限を超えるテンプレートはキャッシュしないこと
+
+        Args:
+            patterns (list[PatternGenerator]): PatternGeneratorのリスト
+            max_bytes (int): 合計バイト数の上限
+
+        """
+        cache = PNGTemplateCache(max_bytes=max_bytes)
+        pattern = patterns[0].pattern
+        assert template_bytes(pattern) > max_bytes
+
+        cache.render(pattern, (0, 0, 0))
+        png = cache.render(pattern, (0, 0, 0))
+
+        assert png == PalettePNGWriter.encode(pattern, (0, 0, 0), 600)
+        assert len(cache) == 0
+        assert cache.current_bytes == 0
+        assert cache.hits == 0
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_render_distinguishes_asymmetric_patterns(
+        self,
+        cache: PNGTemplateCache,
+    ) -> None:
+        """右2列のみが異なる左右非対称のパターンが別のエントリとなること
+
+        Args:
+            cache (PNGTemplateCache): PNGTemplateCacheインスタンス
+
+        """
+        left = np.zeros((5, 5), dtype=np.int_)
+        left[:, 0] = 1
+        right = left.copy()
+        right[:, 4] = 1
+
+        for pattern in (left, right):
+            png = cache.render(pattern, (10, 20, 30), 10)
+            assert png == PalettePNGWriter.encode(pattern, (10, 20, 30), 10)
+
+        assert cache.misses == 2  # noqa: PLR2004
+        assert len(cache) == 2  # noqa: PLR2004
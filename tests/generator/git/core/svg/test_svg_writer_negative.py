@@ -0,0 +1,29 @@
+"""SVGWriter の異常系テストケースを定義するモジュール。"""
+# test_svg_writer_negative.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import re
+
+import pytest
+
+from icon_generator.errors import ErrorMessages
+from icon_generator.generator.git.core.pattern import PatternGenerator
+from icon_generator.generator.git.core.svg import SVGWriter
+
+
+class TestSVGWriterNegativeCases:
+    """SVGWriterにおける異常系の動作を検証するテストクラス。"""
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_invalid_image_size(self) -> None:
+        """image_size が1未満の場合に ValueError が発生すること"""
+        pattern = PatternGenerator("abcde0123456789").pattern
+        error = ErrorMessages.INVALID_IMAGE_SIZE.value
+
+        with pytest.raises(ValueError, match=re.escape(error)):
+            SVGWriter.encode(pattern, (0, 0, 0), image_size=0)
@@ -0,0 +1,100 @@
+"""SVGWriter の正常系テストケースを定義するモジュール。"""
+# test_svg_writer_positive.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import random
+import xml.etree.ElementTree as ET
+
+import numpy as np
+import pytest
+
+from icon_generator.generator.git.core.pattern import PatternGenerator
+from icon_generator.generator.git.core.svg import SVGWriter
+
+
+def fill_rectangles(rectangles: list[tuple[int, int, int, int]]) -> np.ndarray:
+    """矩形を塗った 5x5 の配列を返す (重なった場合は2以上になる)
+
+    Args:
+        rectangles (list[tuple[int, int, int, int]]): (x, y, 幅, 高さ) のリスト
+
+    Returns:
+        np.ndarray: 各セルを塗った回数の配列
+
+    """
+    cells = np.zeros((5, 5), dtype=int)
+    for x, y, w, h in rectangles:
+        cells[y : y + h, x : x + w] += 1
+    return cells
+
+
+class TestSVGWriterPositiveCases:
+    """SVGWriterにおける正常系の動作を検証するテストクラス。"""
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize("seed", range(20))
+    def test_rectangles_cover_pattern_exactly(self, seed: int) -> None:
+        """矩形が塗るセルを重なりなく、過不足なく覆うこと
+
+        Args:
+            seed (int): パターンを生成する乱数のシード
+
+        """
+        hex_pattern = f"{random.Random(seed).getrandbits(60):015x}"  # noqa: S311
+        pattern = PatternGenerator(hex_pattern).pattern
+
+        rectangles = SVGWriter.rectangles(pattern)
+
+        assert (fill_rectangles(rectangles) == pattern).all()
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_adjacent_cells_are_merged(self) -> None:
+        """横と縦に連続するセルが1つの矩形にまとめられること"""
+        pattern = np.array(
+            [
+                [1, 1, 1, 1, 1],
+                [1, 1, 1, 1, 1],
+                [0, 1, 0, 1, 0],
+                [0, 1, 0, 1, 0],
+                [0, 0, 0, 0, 0],
+            ],
+        )
+
+        assert SVGWriter.rectangles(pattern) == [
+            (0, 0, 5, 2),
+            (1, 2, 1, 2),
+            (3, 2, 1, 2),
+        ]
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_encode_svg(self) -> None:
+        """SVG が背景と色付きの path を持ち、数百バイトに収まること"""
+        pattern = PatternGenerator("abcde0123456789").pattern
+
+        svg = SVGWriter.encode(pattern, (100, 150, 200), image_size=64)
+
+        root = ET.fromstring(svg)  # noqa: S314
+        namespace = f"{{{SVGWriter.NAMESPACE}}}"
+        assert root.tag == f"{namespace}svg"
+        assert root.get("viewBox") == "0 0 5 5"
+        assert (root.get("width"), root.get("height")) == ("64", "64")
+        assert root.find(f"{namespace}rect").get("fill") == "#ffffff"  # type: ignore[union-attr]
+        assert root.find(f"{namespace}path").get("fill") == "#6496c8"  # type: ignore[union-attr]
+        assert len(svg) < 500  # noqa: PLR2004
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_encode_without_size_and_cells(self) -> None:
+        """サイズ省略時は width・height を、塗るセルがない場合は path を持たないこと"""
+        svg = SVGWriter.encode(np.zeros((5, 5), dtype=int), (0, 0, 0))
+
+        root = ET.fromstring(svg)  # noqa: S314
+        assert root.get("width") is None
+        assert root.find(f"{{{SVGWriter.NAMESPACE}}}path") is None
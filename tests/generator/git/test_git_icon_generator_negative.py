@@ -5,9 +5,11 @@
 # Copyright (c) 2025 kazuma tunomori
 #
 # Permission is hereby granted, free of charge, to any person obtaining a copy...
+import re
 import uuid
+from io import BytesIO, RawIOBase
 from typing import Any, Self
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 import PIL
@@ -192,3 +194,207 @@ class TestGitIconGeneratorNegativeCases:
             match=ErrorMessages.IDENTICON_GENERATION_FAILED.value,
         ):
             gennerator.generate_on_memory()
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(
+        "invalid_uuids",
+        [
+            np.zeros((2, 15), dtype=np.uint8),
+            np.zeros((2, 16), dtype=np.int64),
+            np.zeros(16, dtype=np.uint8),
+            ["12345678-1234-5678-1234-567812345678"],
+        ],
+    )
+    def test_decode_many_invalid_input_raise_value_error(
+        self,
+        invalid_uuids: Any,  # noqa: ANN401
+    ) -> None:
+        """decode_many に不正な配列やUUID以外の要素を渡すと ValueError が発生すること
+
+        Args:
+            invalid_uuids (Any): 不正な入力
+
+        """
+        with pytest.raises(
+            ValueError,
+            match=re.escape(ErrorMessages.INVALID_UUID_ARRAY.value),
+        ):
+            GitIconGenerator.decode_many(invalid_uuids)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_generate_indexed_invalid_size_raise_runtime_error(self) -> None:
+        """パレット形式PNGの作成に失敗した場合に RuntimeError が発生すること"""
+        gennerator = GitIconGenerator(uuid.uuid4())
+
+        with pytest.raises(
+            RuntimeError,
+            match=ErrorMessages.IDENTICON_GENERATION_FAILED.value,
+        ):
+            gennerator.generate_indexed_on_memory(image_size=0)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_generate_indexed_to_stream_raise_runtime_error(self) -> None:
+        """ストリームへの書き込みに失敗した場合に RuntimeError が発生すること"""
+        stream = MagicMock()
+        stream.write.side_effect = OSError("write error")
+        gennerator = GitIconGenerator(uuid.uuid4())
+
+        with pytest.raises(
+            RuntimeError,
+            match=ErrorMessages.IDENTICON_GENERATION_FAILED.value,
+        ):
+            gennerator.generate_indexed_to_stream(stream)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_generate_bytes_unsupported_format(self) -> None:
+        """generate_bytes に未対応のフォーマットを渡すと ValueError が発生すること"""
+        expected = ErrorMessages.UNSUPPORTED_IMAGE_FORMAT.format(image_format="gif")
+
+        with pytest.raises(ValueError, match=re.escape(expected)):
+            GitIconGenerator.generate_bytes(uuid.uuid4(), 32, "gif")
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_iter_generate_negative_read_ahead(self) -> None:
+        """iter_generate に負の read_ahead を渡すと ValueError が発生すること"""
+        expected = ErrorMessages.INVALID_READ_AHEAD.value
+
+        with pytest.raises(ValueError, match=re.escape(expected)):
+            GitIconGenerator.iter_generate([uuid.uuid4()], 32, read_ahead=-1)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize("read_ahead", [0, 2])
+    def test_iter_generate_unsupported_format(self, read_ahead: int) -> None:
+        """iter_generate の反復中に未対応のフォーマットで ValueError が発生すること
+
+        Args:
+            read_ahead (int): 先読みする件数
+
+        """
+        expected = ErrorMessages.UNSUPPORTED_IMAGE_FORMAT.format(image_format="gif")
+        icons = GitIconGenerator.iter_generate(
+            [uuid.uuid4()],
+            32,
+            "gif",
+            read_ahead=read_ahead,
+        )
+
+        with pytest.raises(ValueError, match=re.escape(expected)):
+            next(icons)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_export_archive_unsupported_format(self) -> None:
+        """export_archive に未対応のフォーマットを渡すと ValueError が発生すること"""
+        expected = ErrorMessages.UNSUPPORTED_IMAGE_FORMAT.format(image_format="gif")
+        stream = BytesIO()
+
+        with pytest.raises(ValueError, match=re.escape(expected)):
+            GitIconGenerator.export_archive([uuid.uuid4()], stream, "zip", 16, "gif")
+        assert stream.getvalue() == b""
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_generate_svg_invalid_size_raise_runtime_error(self) -> None:
+        """generate_svg で画像作成に失敗した場合に RuntimeError が発生すること"""
+        generator = GitIconGenerator(uuid.uuid4())
+        error = ErrorMessages.IDENTICON_GENERATION_FAILED.value
+
+        with pytest.raises(RuntimeError, match=re.escape(error)):
+            generator.generate_svg(0)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_generate_ico_invalid_size(self) -> None:
+        """generate_ico に 256 超のサイズを渡すと描画前に ValueError が発生すること"""
+        error = ErrorMessages.INVALID_ICO_SIZES.format(maximum=256)
+
+        generator = GitIconGenerator(uuid.uuid4())
+
+        with (
+            patch.object(GitIconGenerator, "generate_sizes") as generate_sizes,
+            pytest.raises(ValueError, match=re.escape(error)),
+        ):
+            generator.generate_ico([16, 512])
+        generate_sizes.assert_not_called()
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(
+        "buffer",
+        [
+            bytes(16 * 16 * 3),
+            bytearray(16 * 16 * 3 - 1),
+            np.zeros((16, 16, 4), dtype=np.uint8),
+            np.zeros((16, 16, 3), dtype=np.float32),
+            np.broadcast_to(np.zeros(3, dtype=np.uint8), (16, 16, 3)),
+        ],
+    )
+    def test_generate_into_invalid_buffer(self, buffer: object) -> None:
+        """不正なバッファを generate_into に渡すと ValueError が発生すること
+
+        Args:
+            buffer (object): 不正なバッファ
+
+        """
+        error = ErrorMessages.INVALID_RASTER_BUFFER.format(size=16)
+
+        with pytest.raises(ValueError, match=re.escape(error)):
+            GitIconGenerator(uuid.uuid4()).generate_into(buffer, 16)  # type: ignore[arg-type]
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_generate_array_invalid_size(self) -> None:
+        """generate_array に1未満のサイズを渡すと ValueError が発生すること"""
+        error = ErrorMessages.INVALID_IMAGE_SIZE.value
+
+        with pytest.raises(ValueError, match=re.escape(error)):
+            GitIconGenerator(uuid.uuid4()).generate_array(0)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_generate_to_write_error_raise_runtime_error(self) -> None:
+        """generate_to で書き込みに失敗した場合に RuntimeError が発生すること"""
+        stream = MagicMock()
+        stream.write.side_effect = OSError("write error")
+        error = ErrorMessages.IDENTICON_GENERATION_FAILED.value
+
+        with pytest.raises(RuntimeError, match=re.escape(error)):
+            GitIconGenerator(uuid.uuid4()).generate_to(stream, 16)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize("result", [None, 0])
+    def test_generate_to_incomplete_write_raise_runtime_error(
+        self,
+        result: int | None,
+    ) -> None:
+        """バッファなしのストリームに書き込めない場合に RuntimeError が発生すること
+
+        Args:
+            result (int | None): write の返り値 (None は書き込み待ち)
+
+        """
+        stream = MagicMock(spec=RawIOBase)
+        stream.write.return_value = result
+        error = ErrorMessages.IDENTICON_GENERATION_FAILED.value
+
+        with pytest.raises(RuntimeError, match=re.escape(error)):
+            GitIconGenerator(uuid.uuid4()).generate_to(stream, 16)
+        stream.write.assert_called_once()
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_generate_to_unsupported_format(self) -> None:
+        """generate_to に未対応のフォーマットを渡すと ValueError が発生すること"""
+        expected = ErrorMessages.UNSUPPORTED_IMAGE_FORMAT.format(image_format="gif")
+        stream = BytesIO()
+
+        with pytest.raises(ValueError, match=re.escape(expected)):
+            GitIconGenerator(uuid.uuid4()).generate_to(stream, 16, "gif")
+        assert stream.getvalue() == b""
@@ -5,12 +5,38 @@
 # Copyright (c) 2025 kazuma tunomori
 #
 # Permission is hereby granted, free of charge, to any person obtaining a copy...
+import asyncio
+import inspect
+import mmap
+import pickle
+import re
+import socket
+import tarfile
 import uuid
-from io import BytesIO
+import zipfile
+from collections.abc import Iterator
+from io import BytesIO, RawIOBase
+from pathlib import Path
+from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 from PIL import Image
 
+from icon_generator.bulk import (
+    AsyncIconRenderer,
+    ProcessIconRenderer,
+    ThreadIconRenderer,
+)
+from icon_generator.cache import (
+    disable_disk_cache,
+    disable_memory_cache,
+    enable_disk_cache,
+    enable_memory_cache,
+)
+from icon_generator.encoder import EncoderRegistry, RawEncoder
+from icon_generator.generator.git.core.color import RGBGenerator
+from icon_generator.generator.git.core.pattern import PatternGenerator
 from icon_generator.generator.git.git_icon_generator import GitIconGenerator
 
 
@@ -80,3 +106,696 @@ class TestGitIconGeneratorPositiveCases:
         img1 = gen1.generate_on_memory().getvalue()
         img2 = gen2.generate_on_memory().getvalue()
         assert img1 != img2
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_decode_many_matches_single_generator(self) -> None:
+        """decode_many の結果が個別に生成した GitIconGenerator と一致すること"""
+        uuids = [uuid.uuid4() for _ in range(32)]
+        patterns, colors = GitIconGenerator.decode_many(uuids)
+
+        assert patterns.shape == (len(uuids), 5, 5)
+        assert colors.shape == (len(uuids), 3)
+        for unique_uuid, pattern, color in zip(uuids, patterns, colors, strict=True):
+            generator = GitIconGenerator(unique_uuid)
+            np.testing.assert_array_equal(pattern, generator.pattern)
+            assert tuple(color.tolist()) == generator.rgb
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_decode_many_accepts_uint8_array(self) -> None:
+        """decode_many に shape=(N, 16) の uint8 配列を渡しても同じ結果となること"""
+        uuids = [uuid.uuid4() for _ in range(8)]
+        uuid_array = np.array([list(unique_uuid.bytes) for unique_uuid in uuids])
+
+        from_sequence = GitIconGenerator.decode_many(uuids)
+        from_array = GitIconGenerator.decode_many(uuid_array.astype(np.uint8))
+
+        np.testing.assert_array_equal(from_sequence[0], from_array[0])
+        np.testing.assert_array_equal(from_sequence[1], from_array[1])
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_decode_many_with_empty_sequence(self) -> None:
+        """decode_many に空のシーケンスを渡すと空の配列が返ること"""
+        patterns, colors = GitIconGenerator.decode_many([])
+
+        assert patterns.shape == (0, 5, 5)
+        assert colors.shape == (0, 3)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_generate_indexed_matches_generate_on_memory(
+        self,
+        generator: GitIconGenerator,
+    ) -> None:
+        """generate_indexed_on_memory が generate_on_memory と同じ画素の PNG を返すこと
+
+        Args:
+            generator (GitIconGenerator): GitIconGeneratorインスタンス
+
+        """
+        size = 128
+        indexed = Image.open(generator.generate_indexed_on_memory(image_size=size))
+        expected = Image.open(generator.generate_on_memory(image_size=size))
+
+        assert indexed.format == "PNG"
+        np.testing.assert_array_equal(
+            np.asarray(indexed.convert("RGB")),
+            np.asarray(expected.convert("RGB")),
+        )
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_generate_indexed_to_stream(
+        self,
+        generator: GitIconGenerator,
+        tmp_path: Path,
+    ) -> None:
+        """generate_indexed_to_stream でファイルに PNG が書き出されること
+
+        Args:
+            generator (GitIconGenerator): GitIconGeneratorインスタンス
+            tmp_path (Path): 一時ディレクトリ
+
+        """
+        size = 2048
+        path = tmp_path / "icon.png"
+        with path.open("wb") as f:
+            written = generator.generate_indexed_to_stream(f, image_size=size)
+
+        assert written == path.stat().st_size
+        with Image.open(path) as img:
+            assert img.format == "PNG"
+            assert img.size == (size, size)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(
+        ("method_name", "image_format"),
+        [
+            ("generate_on_memory", GitIconGenerator.FORMAT_PNG),
+            ("generate_indexed_on_memory", GitIconGenerator.FORMAT_INDEXED_PNG),
+        ],
+    )
+    def test_generate_uses_memory_cache(
+        self,
+        hex_uuid: uuid.UUID,
+        method_name: str,
+        image_format: str,
+    ) -> None:
+        """キャッシュが有効な場合、2回目以降の生成結果がキャッシュから返ること
+
+        Args:
+            hex_uuid (uuid.UUID): uuid4インスタンス
+            method_name (str): 生成メソッド名
+            image_format (str): 画像フォーマット名
+
+        """
+        cache = enable_memory_cache()
+        try:
+            first = getattr(GitIconGenerator(hex_uuid), method_name)(64).getvalue()
+            second = getattr(GitIconGenerator(hex_uuid), method_name)(64).getvalue()
+        finally:
+            disable_memory_cache()
+
+        assert first == second
+        assert len(cache) == 1
+        assert cache.info().hits == 1
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_generate_uses_disk_cache(
+        self,
+        hex_uuid: uuid.UUID,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """ディスクキャッシュの結果を再利用し、描画仕様のバージョン変更で再生成すること
+
+        Args:
+            hex_uuid (uuid.UUID): uuid4インスタンス
+            tmp_path (Path): 一時ディレクトリ
+            monkeypatch (pytest.MonkeyPatch): pytestのモンキーパッチ用フィクスチャ
+
+        """
+        cache = enable_disk_cache(tmp_path)
+        try:
+            first = GitIconGenerator(hex_uuid).generate_on_memory(64).getvalue()
+            second = GitIconGenerator(hex_uuid).generate_on_memory(64).getvalue()
+            assert (cache.hits, cache.misses) == (1, 1)
+
+            monkeypatch.setattr(GitIconGenerator, "RENDER_SPEC_VERSION", 2)
+            third = GitIconGenerator(hex_uuid).generate_on_memory(64).getvalue()
+        finally:
+            disable_disk_cache()
+
+        assert first == second == third
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_generate_encoded_cache_depends_on_encoder_options(
+        self,
+        hex_uuid: uuid.UUID,
+    ) -> None:
+        """同じ名前で設定の異なるエンコーダを登録し直すとキャッシュを参照しないこと
+
+        Args:
+            hex_uuid (uuid.UUID): uuid4インスタンス
+
+        """
+        generator = GitIconGenerator(hex_uuid)
+        cache = enable_memory_cache()
+        try:
+            EncoderRegistry.register("custom", RawEncoder("RGB"))
+            rgb = generator.generate_encoded(8, "custom").getvalue()
+            EncoderRegistry.register("custom", RawEncoder("L"))
+            gray = generator.generate_encoded(8, "custom").getvalue()
+        finally:
+            EncoderRegistry._encoders.pop("custom")
+            disable_memory_cache()
+
+        assert rgb == generator.render_image(8).tobytes()
+        assert gray == generator.render_image(8).convert("L").tobytes()
+        assert len(cache) == 2  # noqa: PLR2004
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_state_matches_pattern_and_rgb_generators(
+        self,
+        hex_uuid: uuid.UUID,
+    ) -> None:
+        """保持するパターンと RGB カラーが PatternGenerator・RGBGenerator と一致すること
+
+        Args:
+            hex_uuid (uuid.UUID): uuid4インスタンス
+
+        """
+        generator = GitIconGenerator(hex_uuid)
+
+        assert generator.bits == PatternGenerator(hex_uuid.hex[:15]).bits
+        assert generator.rgb == RGBGenerator(hex_uuid.hex[25:]).rgb
+        assert not hasattr(generator, "__dict__")
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_pattern_is_created_lazily(self, generator: GitIconGenerator) -> None:
+        """PatternGenerator が初回の参照時まで生成されないこと
+
+        Args:
+            generator (GitIconGenerator): GitIconGeneratorインスタンス
+
+        """
+        assert generator._pattern_generator is None
+
+        pattern = generator.pattern
+
+        assert generator._pattern_generator is not None
+        assert PatternGenerator.to_bits(pattern) == generator.bits
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_pickle_round_trip_is_compact(self, generator: GitIconGenerator) -> None:
+        """Pickle の復元後も同じ画像を生成し、状態が1つの小さな整数で保存されること
+
+        Args:
+            generator (GitIconGenerator): GitIconGeneratorインスタンス
+
+        """
+        restored = pickle.loads(pickle.dumps(generator))  # noqa: S301
+        many = pickle.dumps([generator] * 1000 + [GitIconGenerator(uuid.uuid4())])
+
+        assert restored.bits == generator.bits
+        assert restored.rgb == generator.rgb
+        assert (
+            restored.generate_on_memory(32).getvalue()
+            == generator.generate_on_memory(32).getvalue()
+        )
+        assert generator.__getstate__() < 1 << 39
+        assert len(many) < 4096  # noqa: PLR2004
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(
+        ("image_format", "method_name"),
+        [
+            (GitIconGenerator.FORMAT_PNG, "generate_on_memory"),
+            (GitIconGenerator.FORMAT_INDEXED_PNG, "generate_indexed_on_memory"),
+            (GitIconGenerator.FORMAT_SVG, "generate_svg"),
+        ],
+    )
+    def test_generate_bytes_matches_format(
+        self,
+        hex_uuid: uuid.UUID,
+        image_format: str,
+        method_name: str,
+    ) -> None:
+        """generate_bytes が画像フォーマットに対応する生成メソッドと同じ結果を返すこと
+
+        Args:
+            hex_uuid (uuid.UUID): uuid4インスタンス
+            image_format (str): 画像フォーマット名
+            method_name (str): 生成メソッド名
+
+        """
+        expected = getattr(GitIconGenerator(hex_uuid), method_name)(48).getvalue()
+
+        assert GitIconGenerator.generate_bytes(hex_uuid, 48, image_format) == expected
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_agenerate_on_memory_matches_generate_on_memory(
+        self,
+        generator: GitIconGenerator,
+    ) -> None:
+        """agenerate_on_memory が generate_on_memory と同じ画像を返すこと
+
+        Args:
+            generator (GitIconGenerator): GitIconGeneratorインスタンス
+
+        """
+        result = asyncio.run(generator.agenerate_on_memory(64))
+
+        assert result.getvalue() == generator.generate_on_memory(64).getvalue()
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_agenerate_many_returns_icons_in_order(self) -> None:
+        """agenerate_many が入力順に (UUID, 画像) を返すこと"""
+        uuids = [uuid.uuid4() for _ in range(12)]
+        renderer = AsyncIconRenderer(max_in_flight=3)
+
+        async def collect() -> list[tuple[uuid.UUID, bytes]]:
+            icons = GitIconGenerator.agenerate_many(uuids, 32, renderer=renderer)
+            return [item async for item in icons]
+
+        results = asyncio.run(collect())
+
+        assert [unique_uuid for unique_uuid, _ in results] == uuids
+        for unique_uuid, data in results:
+            assert (
+                data == GitIconGenerator(unique_uuid).generate_on_memory(32).getvalue()
+            )
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_render_many_matches_generate_bytes(self) -> None:
+        """render_many が入力順に generate_bytes と同じ画像を返すこと"""
+        uuids = [uuid.uuid4() for _ in range(10)]
+
+        results = GitIconGenerator.render_many(
+            uuids,
+            32,
+            GitIconGenerator.FORMAT_INDEXED_PNG,
+            workers=2,
+            chunk_size=3,
+        )
+
+        assert results == [
+            GitIconGenerator.generate_bytes(u, 32, GitIconGenerator.FORMAT_INDEXED_PNG)
+            for u in uuids
+        ]
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(
+        "image_format",
+        [GitIconGenerator.FORMAT_PNG, GitIconGenerator.FORMAT_INDEXED_PNG],
+    )
+    def test_render_many_threaded_matches_generate_bytes(
+        self,
+        image_format: str,
+    ) -> None:
+        """render_many_threaded が入力順に generate_bytes と同じ画像を返すこと
+
+        Args:
+            image_format (str): 画像フォーマット名
+
+        """
+        uuids = [uuid.uuid4() for _ in range(10)]
+
+        results = GitIconGenerator.render_many_threaded(
+            uuids,
+            32,
+            image_format,
+            workers=3,
+            chunk_size=2,
+        )
+
+        assert results == [
+            GitIconGenerator.generate_bytes(u, 32, image_format) for u in uuids
+        ]
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize("read_ahead", [0, 1, 3])
+    def test_iter_generate_reads_uuids_lazily(self, read_ahead: int) -> None:
+        """iter_generate が UUID を消費に合わせて read_ahead 件先までしか取得しないこと
+
+        Args:
+            read_ahead (int): 先読みする件数
+
+        """
+        uuids = [uuid.uuid4() for _ in range(20)]
+        fetched: list[uuid.UUID] = []
+
+        def cursor() -> Iterator[uuid.UUID]:
+            for unique_uuid in uuids:
+                fetched.append(unique_uuid)
+                yield unique_uuid
+
+        icons = GitIconGenerator.iter_generate(
+            cursor(),
+            32,
+            GitIconGenerator.FORMAT_INDEXED_PNG,
+            read_ahead=read_ahead,
+        )
+        first = [next(icons) for _ in range(5)]
+
+        assert len(fetched) <= 5 + read_ahead
+        assert [*first, *icons] == [
+            (u, GitIconGenerator.generate_bytes(u, 32, "png-indexed")) for u in uuids
+        ]
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize("archive_format", ["zip", "tar"])
+    def test_export_archive(self, archive_format: str) -> None:
+        """export_archive が UUID ごとの画像をアーカイブに格納すること
+
+        Args:
+            archive_format (str): アーカイブ形式
+
+        """
+        uuids = [uuid.uuid4() for _ in range(4)]
+        stream = BytesIO()
+
+        count = GitIconGenerator.export_archive(uuids, stream, archive_format, 16)
+
+        expected = {f"{u}.png": GitIconGenerator.generate_bytes(u, 16) for u in uuids}
+        stream.seek(0)
+        if archive_format == "zip":
+            with zipfile.ZipFile(stream) as archive:
+                entries = {name: archive.read(name) for name in archive.namelist()}
+        else:
+            with tarfile.open(fileobj=stream) as archive:
+                entries = {
+                    member.name: archive.extractfile(member).read()  # type: ignore[union-attr]
+                    for member in archive.getmembers()
+                }
+        assert count == len(uuids)
+        assert entries == expected
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_generate_svg_matches_pattern(self, generator: GitIconGenerator) -> None:
+        """generate_svg の矩形がパターンと一致し、generate_bytes からも生成できること
+
+        Args:
+            generator (GitIconGenerator): GitIconGeneratorインスタンス
+
+        """
+        svg = generator.generate_svg(128).getvalue()
+
+        cells = np.zeros((5, 5), dtype=int)
+        for rectangle in re.findall(r"M(\d+) (\d+)h(\d+)v(\d+)", svg.decode()):
+            x, y, w, h = (int(v) for v in rectangle)
+            cells[y : y + h, x : x + w] += 1
+        assert (cells == generator.pattern).all()
+        assert f"#{bytes(generator.rgb).hex()}".encode() in svg
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_generate_sizes_colors_once(
+        self,
+        generator: GitIconGenerator,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """generate_sizes が各サイズの画像を生成し、色の適用は1回のみ行うこと
+
+        Args:
+            generator (GitIconGenerator): GitIconGeneratorインスタンス
+            monkeypatch (pytest.MonkeyPatch): MonkeyPatchインスタンス
+
+        """
+        calls = []
+        apply_color = PatternGenerator.apply_color
+
+        def counting_apply_color(
+            self: PatternGenerator,
+            rgb_pattern: tuple[int, int, int],
+        ) -> np.ndarray:
+            calls.append(rgb_pattern)
+            return apply_color(self, rgb_pattern)
+
+        monkeypatch.setattr(PatternGenerator, "apply_color", counting_apply_color)
+        sizes = [32, 64, 128]
+
+        images = generator.generate_sizes(sizes)
+        generator.generate_on_memory(256)
+
+        assert list(images) == sizes
+        for size, image in images.items():
+            assert Image.open(image).size == (size, size)
+        assert len(calls) == 1
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_generate_ico(self, generator: GitIconGenerator) -> None:
+        """generate_ico が各サイズの画像を格納した ICO を生成すること
+
+        Args:
+            generator (GitIconGenerator): GitIconGeneratorインスタンス
+
+        """
+        ico = generator.generate_ico([16, 32, 64]).getvalue()
+
+        image = Image.open(BytesIO(ico))
+        assert image.format == "ICO"
+        assert sorted(image.info["sizes"]) == [(16, 16), (32, 32), (64, 64)]
+        for size in (16, 32, 64):
+            assert generator.generate_on_memory(size).getvalue() in ico
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(
+        "preset",
+        [
+            EncoderRegistry.PRESET_PNG_FAST,
+            EncoderRegistry.PRESET_PNG_MAX,
+            EncoderRegistry.PRESET_WEBP_LOSSLESS,
+        ],
+    )
+    def test_generate_encoded_presets(
+        self,
+        generator: GitIconGenerator,
+        hex_uuid: uuid.UUID,
+        preset: str,
+    ) -> None:
+        """各プリセットが generate_on_memory と同じ画素の画像を生成すること
+
+        Args:
+            generator (GitIconGenerator): GitIconGeneratorインスタンス
+            hex_uuid (uuid.UUID): uuid4インスタンス
+            preset (str): プリセット名
+
+        """
+        encoded = generator.generate_encoded(64, preset).getvalue()
+
+        expected = Image.open(generator.generate_on_memory(64)).convert("RGB")
+        actual = Image.open(BytesIO(encoded)).convert("RGB")
+        assert np.array_equal(np.asarray(actual), np.asarray(expected))
+        assert GitIconGenerator.generate_bytes(hex_uuid, 64, preset) == encoded
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_generate_encoded_raw_and_extension(
+        self,
+        generator: GitIconGenerator,
+        hex_uuid: uuid.UUID,
+    ) -> None:
+        """無圧縮のプリセットが generate_bytes から使え、拡張子も対応すること
+
+        Args:
+            generator (GitIconGenerator): GitIconGeneratorインスタンス
+            hex_uuid (uuid.UUID): uuid4インスタンス
+
+        """
+        raw = GitIconGenerator.generate_bytes(hex_uuid, 8, EncoderRegistry.PRESET_RGBA)
+
+        expected = GitIconGenerator(hex_uuid).render_image(8).convert("RGBA")
+        assert raw == expected.tobytes()
+        assert GitIconGenerator.file_extension(EncoderRegistry.PRESET_RGBA) == ".rgba"
+        assert GitIconGenerator.file_extension(GitIconGenerator.FORMAT_SVG) == ".svg"
+        assert generator.generate_encoded(8, RawEncoder("L")).getvalue() == (
+            generator.render_image(8).convert("L").tobytes()
+        )
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize("size", [1, 7, 64])
+    def test_generate_array_matches_generate_on_memory(
+        self,
+        generator: GitIconGenerator,
+        size: int,
+    ) -> None:
+        """generate_array が generate_on_memory をデコードした画素と一致すること
+
+        Args:
+            generator (GitIconGenerator): GitIconGeneratorインスタンス
+            size (int): イメージサイズ
+
+        """
+        expected = np.asarray(Image.open(generator.generate_on_memory(size)))
+
+        raster = generator.generate_array(size)
+
+        assert raster.dtype == np.uint8
+        assert raster.shape == (size, size, 3)
+        assert np.array_equal(raster, expected)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_generate_into_buffers(self, generator: GitIconGenerator) -> None:
+        """generate_into が bytearray・mmap の先頭に行優先の RGB を書き込むこと
+
+        Args:
+            generator (GitIconGenerator): GitIconGeneratorインスタンス
+
+        """
+        expected = generator.generate_array(16).tobytes()
+        buffer = bytearray(len(expected) + 10)
+        mapped = mmap.mmap(-1, len(expected))
+
+        written = generator.generate_into(buffer, 16)
+        generator.generate_into(mapped, 16)
+
+        assert written == len(expected)
+        assert buffer[:written] == expected
+        assert buffer[written:] == bytes(10)
+        assert mapped[:] == expected
+        mapped.close()
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_generate_into_canvas_region(self, generator: GitIconGenerator) -> None:
+        """generate_into が合成先の画像の一部 (連続していないビュー) に描画できること
+
+        Args:
+            generator (GitIconGenerator): GitIconGeneratorインスタンス
+
+        """
+        canvas = np.zeros((40, 40, 3), dtype=np.uint8)
+
+        generator.generate_into(canvas[5:21, 10:26], 16)
+
+        assert np.array_equal(canvas[5:21, 10:26], generator.generate_array(16))
+        canvas[5:21, 10:26] = 0
+        assert not canvas.any()
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(
+        "image_format",
+        [
+            GitIconGenerator.FORMAT_PNG,
+            GitIconGenerator.FORMAT_INDEXED_PNG,
+            GitIconGenerator.FORMAT_SVG,
+            "webp-lossless",
+        ],
+    )
+    def test_generate_to_stream(
+        self,
+        hex_uuid: uuid.UUID,
+        image_format: str,
+    ) -> None:
+        """generate_to が generate_bytes と同じ内容をストリームに書き出すこと
+
+        Args:
+            hex_uuid (uuid.UUID): UUID
+            image_format (str): 画像フォーマット名
+
+        """
+        expected = GitIconGenerator.generate_bytes(hex_uuid, 32, image_format)
+        stream = BytesIO()
+
+        written = GitIconGenerator(hex_uuid).generate_to(stream, 32, image_format)
+
+        assert written == len(expected)
+        assert stream.getvalue() == expected
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_generate_to_retries_short_writes(
+        self,
+        generator: GitIconGenerator,
+    ) -> None:
+        """Write が一部のみを書き込んだ場合も、残りを書き出してすべて書き込むこと
+
+        Args:
+            generator (GitIconGenerator): GitIconGeneratorインスタンス
+
+        """
+        expected = generator.generate_on_memory(16).getvalue()
+        chunks: list[bytes] = []
+
+        def write(data: memoryview) -> int:
+            chunks.append(bytes(data[:7]))
+            return len(chunks[-1])
+
+        stream = MagicMock(spec=RawIOBase)
+        stream.write.side_effect = write
+
+        written = generator.generate_to(stream, 16)
+
+        assert written == len(expected)
+        assert b"".join(chunks) == expected
+        assert len(chunks) == -(-len(expected) // 7)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_generate_to_socket(self, generator: GitIconGenerator) -> None:
+        """generate_to がソケットに画像を送信すること
+
+        Args:
+            generator (GitIconGenerator): GitIconGeneratorインスタンス
+
+        """
+        expected = generator.generate_on_memory(16).getvalue()
+        sender, receiver = socket.socketpair()
+
+        with sender, receiver:
+            written = generator.generate_to(sender, 16)
+            sender.shutdown(socket.SHUT_WR)
+            received = b"".join(iter(lambda: receiver.recv(4096), b""))
+
+        assert written == len(expected)
+        assert received == expected
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_generate_buffer_returns_memoryview(
+        self,
+        generator: GitIconGenerator,
+    ) -> None:
+        """generate_buffer が画像のバイナリデータを memoryview で返すこと
+
+        Args:
+            generator (GitIconGenerator): GitIconGeneratorインスタンス
+
+        """
+        data = generator.generate_buffer(24, GitIconGenerator.FORMAT_INDEXED_PNG)
+
+        assert isinstance(data, memoryview)
+        assert data == generator.generate_indexed_on_memory(24).getvalue()
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_chunk_size_defaults_match_renderers(self) -> None:
+        """並列生成の chunk_size の既定値が各レンダラの既定値と一致すること"""
+        process = inspect.signature(GitIconGenerator.render_many).parameters
+        thread = inspect.signature(GitIconGenerator.render_many_threaded).parameters
+
+        assert process["chunk_size"].default == ProcessIconRenderer.DEFAULT_CHUNK_SIZE
+        assert thread["chunk_size"].default == ThreadIconRenderer.DEFAULT_CHUNK_SIZE
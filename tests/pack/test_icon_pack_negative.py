@@ -0,0 +1,216 @@
+"""IconPackBuilder・IconPackReader の異常系テストケースを定義するモジュール。"""
+# test_icon_pack_negative.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import errno
+import os
+import re
+import uuid
+from pathlib import Path
+
+import pytest
+
+from icon_generator.errors import ErrorMessages
+from icon_generator.pack import IconPackBuilder, IconPackFormat, IconPackReader
+
+
+def rewrite_slots(path: Path, key: bytes | None, offset: int, length: int) -> None:
+    """アイコンパックのインデックスの全スロットを書き換え、破損したファイルを作る。
+
+    Args:
+        path (Path): アイコンパックのパス
+        key (bytes | None): スロットの UUID のバイト列 (None は各スロットの値を維持)
+        offset (int): 画像データの開始位置
+        length (int): 画像データの長さ
+
+    """
+    data = bytearray(path.read_bytes())
+    *_, slots, index_offset = IconPackFormat.HEADER.unpack_from(data)
+    for slot in range(slots):
+        position = index_offset + slot * IconPackFormat.SLOT.size
+        current, _, _ = IconPackFormat.SLOT.unpack_from(data, position)
+        IconPackFormat.SLOT.pack_into(data, position, key or current, offset, length)
+    path.write_bytes(bytes(data))
+
+
+class TestIconPackNegativeCases:
+    """アイコンパックの作成・読み込みにおける異常系の動作を検証するテストクラス。"""
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_add_duplicate_uuid(self, tmp_path: Path) -> None:
+        """追加済みの UUID を追加すると ValueError が発生すること
+
+        Args:
+            tmp_path (Path): 一時ディレクトリ
+
+        """
+        unique_uuid = uuid.uuid4()
+        expected = ErrorMessages.DUPLICATE_PACK_ENTRY.format(uuid=str(unique_uuid))
+
+        with IconPackBuilder(tmp_path / "icons.pack") as builder:
+            builder.add(unique_uuid, b"png-data")
+            with pytest.raises(ValueError, match=re.escape(expected)):
+                builder.add(unique_uuid, b"png-data")
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_add_empty_data(self, tmp_path: Path) -> None:
+        """空のデータを追加すると ValueError が発生すること
+
+        Args:
+            tmp_path (Path): 一時ディレクトリ
+
+        """
+        expected = ErrorMessages.EMPTY_PACK_ENTRY.value
+
+        with (
+            IconPackBuilder(tmp_path / "icons.pack") as builder,
+            pytest.raises(ValueError, match=re.escape(expected)),
+        ):
+            builder.add(uuid.uuid4(), b"")
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_exception_in_builder_context_aborts(self, tmp_path: Path) -> None:
+        """コンテキスト内で例外が発生した場合はファイルを作成しないこと
+
+        Args:
+            tmp_path (Path): 一時ディレクトリ
+
+        """
+        path = tmp_path / "icons.pack"
+
+        def build() -> None:
+            with IconPackBuilder(path) as builder:
+                builder.add(uuid.uuid4(), b"png-data")
+                raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            build()
+
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_close_failure_aborts(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Close で書き込みに失敗すると一時ファイルを削除し、既存のファイルを残すこと
+
+        Args:
+            tmp_path (Path): 一時ディレクトリ
+            monkeypatch (pytest.MonkeyPatch): MonkeyPatchインスタンス
+
+        """
+        path = tmp_path / "icons.pack"
+        path.write_bytes(b"previous")
+
+        def fsync(_: int) -> None:
+            raise OSError(errno.ENOSPC, os.strerror(errno.ENOSPC))
+
+        builder = IconPackBuilder(path)
+        builder.add(uuid.uuid4(), b"png-data")
+        monkeypatch.setattr(os, "fsync", fsync)
+
+        with pytest.raises(OSError, match=os.strerror(errno.ENOSPC)):
+            builder.close()
+
+        assert list(tmp_path.iterdir()) == [path]
+        assert path.read_bytes() == b"previous"
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(
+        "content",
+        [b"", b"ICONPACK", b"NOTAPACK" + bytes(32), b"ICONPACK\x01\x00" + bytes(30)],
+    )
+    def test_reader_rejects_invalid_file(self, tmp_path: Path, content: bytes) -> None:
+        """アイコンパックの形式ではないファイルを開くと ValueError が発生すること
+
+        Args:
+            tmp_path (Path): 一時ディレクトリ
+            content (bytes): ファイルの内容
+
+        """
+        path = tmp_path / "invalid.pack"
+        path.write_bytes(content)
+        expected = ErrorMessages.INVALID_ICON_PACK.format(path=str(path))
+
+        with pytest.raises(ValueError, match=re.escape(expected)):
+            IconPackReader(path)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_reader_missing_key_raises_key_error(self, tmp_path: Path) -> None:
+        """格納されていない UUID を添字で参照すると KeyError が発生すること
+
+        Args:
+            tmp_path (Path): 一時ディレクトリ
+
+        """
+        path = tmp_path / "icons.pack"
+        with IconPackBuilder(path) as builder:
+            builder.add(uuid.uuid4(), b"png-data")
+
+        with IconPackReader(path) as reader, pytest.raises(KeyError):
+            reader[uuid.uuid4()]
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_reader_full_table_terminates(self, tmp_path: Path) -> None:
+        """空きスロットのない破損したインデックスでも、探査が終了すること
+
+        Args:
+            tmp_path (Path): 一時ディレクトリ
+
+        """
+        path = tmp_path / "icons.pack"
+        with IconPackBuilder(path) as builder:
+            builder.add(uuid.uuid4(), b"png-data")
+        rewrite_slots(path, uuid.uuid4().bytes, IconPackFormat.HEADER.size, 1)
+
+        with IconPackReader(path) as reader:
+            assert reader.get(uuid.uuid4()) is None
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(
+        ("offset", "length"),
+        [(0, 8), (IconPackFormat.HEADER.size, 1 << 40), (1 << 62, 8)],
+    )
+    def test_reader_rejects_entry_outside_data(
+        self,
+        tmp_path: Path,
+        offset: int,
+        length: int,
+    ) -> None:
+        """インデックスが画像データの範囲外を指している場合に ValueError が発生すること
+
+        Args:
+            tmp_path (Path): 一時ディレクトリ
+            offset (int): 書き換える開始位置
+            length (int): 書き換える長さ
+
+        """
+        path = tmp_path / "icons.pack"
+        unique_uuid = uuid.uuid4()
+        with IconPackBuilder(path) as builder:
+            builder.add(unique_uuid, b"png-data")
+        rewrite_slots(path, None, offset, length)
+        expected = ErrorMessages.CORRUPT_PACK_ENTRY.format(
+            path=str(path),
+            uuid=str(unique_uuid),
+        )
+
+        with (
+            IconPackReader(path) as reader,
+            pytest.raises(ValueError, match=re.escape(expected)),
+        ):
+            reader.get(unique_uuid)
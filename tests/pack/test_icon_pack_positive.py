@@ -0,0 +1,136 @@
+"""IconPackBuilder・IconPackReader の正常系テストケースを定義するモジュール。"""
+# test_icon_pack_positive.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import os
+import stat
+import uuid
+from pathlib import Path
+
+import pytest
+
+from icon_generator.generator.git.git_icon_generator import GitIconGenerator
+from icon_generator.pack import IconPackBuilder, IconPackReader
+
+
+class TestIconPackPositiveCases:
+    """アイコンパックの作成・読み込みにおける正常系の動作を検証するテストクラス。"""
+
+    @pytest.fixture
+    def icons(self) -> dict[uuid.UUID, bytes]:
+        """UUID とアイコン画像のバイナリデータの辞書"""
+        uuids = [uuid.uuid4() for _ in range(200)]
+        return {
+            unique_uuid: GitIconGenerator(unique_uuid)
+            .generate_indexed_on_memory(32)
+            .getvalue()
+            for unique_uuid in uuids
+        }
+
+    @pytest.fixture
+    def pack_path(self, tmp_path: Path, icons: dict[uuid.UUID, bytes]) -> Path:
+        """アイコンを格納したアイコンパックのパス"""
+        path = tmp_path / "icons.pack"
+        with IconPackBuilder(path) as builder:
+            builder.add_many(icons.items())
+        return path
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_reader_returns_added_icons(
+        self,
+        pack_path: Path,
+        icons: dict[uuid.UUID, bytes],
+    ) -> None:
+        """追加した全てのアイコンを UUID で取得できること
+
+        Args:
+            pack_path (Path): アイコンパックのパス
+            icons (dict[uuid.UUID, bytes]): UUID とバイナリデータの辞書
+
+        """
+        with IconPackReader(pack_path) as reader:
+            assert len(reader) == len(icons)
+            for unique_uuid, data in icons.items():
+                view = reader[unique_uuid]
+                assert isinstance(view, memoryview)
+                assert view == data
+                view.release()
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_reader_lookup_for_missing_uuid(self, pack_path: Path) -> None:
+        """格納されていない UUID では get が None を返し、in が False となること
+
+        Args:
+            pack_path (Path): アイコンパックのパス
+
+        """
+        missing = uuid.uuid4()
+        with IconPackReader(pack_path) as reader:
+            assert reader.get(missing) is None
+            assert missing not in reader
+            assert "not-a-uuid" not in reader
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_keys_returns_all_uuids(
+        self,
+        pack_path: Path,
+        icons: dict[uuid.UUID, bytes],
+    ) -> None:
+        """Keys で格納されている全ての UUID を取得できること
+
+        Args:
+            pack_path (Path): アイコンパックのパス
+            icons (dict[uuid.UUID, bytes]): UUID とバイナリデータの辞書
+
+        """
+        with IconPackReader(pack_path) as reader:
+            assert set(reader.keys()) == set(icons)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_empty_pack(self, tmp_path: Path) -> None:
+        """アイコンを追加せずに作成したアイコンパックを読み込めること
+
+        Args:
+            tmp_path (Path): 一時ディレクトリ
+
+        """
+        path = tmp_path / "empty.pack"
+        with IconPackBuilder(path):
+            pass
+
+        with IconPackReader(path) as reader:
+            assert len(reader) == 0
+            assert reader.get(uuid.uuid4()) is None
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_builder_leaves_only_pack_file(self, pack_path: Path) -> None:
+        """作成後は出力先のファイルのみが残り、一時ファイルが残らないこと
+
+        Args:
+            pack_path (Path): アイコンパックのパス
+
+        """
+        assert list(pack_path.parent.iterdir()) == [pack_path]
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_builder_applies_umask(self, pack_path: Path) -> None:
+        """作成したファイルが umask に従うパーミッションとなること
+
+        Args:
+            pack_path (Path): アイコンパックのパス
+
+        """
+        umask = os.umask(0)
+        os.umask(umask)
+
+        assert stat.S_IMODE(pack_path.stat().st_mode) == 0o666 & ~umask
@@ -0,0 +1,137 @@
+"""import icon_generator の所要時間を計測するベンチマーク。
+
+pytest -m perf -s で実行すると、遅延インポートのみの場合と
+GitIconGenerator やレンダラーを参照した場合の所要時間 (中央値) を表示する。
+"""
+# test_import_time.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import statistics
+import subprocess
+import sys
+from collections.abc import Iterable
+from pathlib import Path
+
+import pytest
+
+import icon_generator
+
+REPEAT = 7
+SOURCE_ROOT = str(Path(icon_generator.__path__[0]).parent)
+# サブパッケージのインポートだけでは読み込まない重いモジュール
+DEFERRED_MODULES = (
+    "asyncio",
+    "multiprocessing",
+    "multiprocessing.shared_memory",
+    "numpy",
+    "PIL",
+)
+
+
+def measure_import(statement: str) -> float:
+    """新しいインタプリタで statement を実行し、所要時間の中央値を秒で返す。
+
+    Args:
+        statement (str): 計測する Python の文
+
+    Returns:
+        float: REPEAT 回計測した所要時間の中央値 (秒)
+
+    """
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    timings = [
+        float(
+            subprocess.run(  # noqa: S603
+                [sys.executable, "-c", code],
+                capture_output=True,
+                check=True,
+                text=True,
+                env={"PYTHONPATH": SOURCE_ROOT},
+            ).stdout,
+        )
+        for _ in range(REPEAT)
+    ]
+    return statistics.median(timings)
+
+
+def loaded_modules(statement: str, modules: Iterable[str]) -> list[str]:
+    """新しいインタプリタで statement を実行し、読み込まれた modules を返す。
+
+    Args:
+        statement (str): 実行する Python の文
+        modules (Iterable[str]): 確認するモジュール名
+
+    Returns:
+        list[str]: modules のうち読み込まれたモジュール名 (ソート済み)
+
+    """
+    code = (
+        "import sys\n"
+        f"{statement}\n"
+        f"print(*sorted(set({list(modules)!r}) & set(sys.modules)))\n"
+    )
+    return subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+        env={"PYTHONPATH": SOURCE_ROOT},
+    ).stdout.split()
+
+
+class TestImportTimeBenchmark:
+    """パッケージのインポート時間を計測するベンチマーク。"""
+
+    @pytest.mark.perf
+    @pytest.mark.v1_1_0
+    def test_lazy_import_is_faster_than_generator_import(self) -> None:
+        """パッケージのインポートが GitIconGenerator を読み込む場合より速いこと"""
+        lazy = measure_import("import icon_generator")
+        eager = measure_import("import icon_generator; icon_generator.GitIconGenerator")
+
+        print(
+            f"\nimport icon_generator: {lazy * 1000:.1f} ms"
+            f"\n+ GitIconGenerator:     {eager * 1000:.1f} ms",
+        )
+        assert lazy < eager
+
+    @pytest.mark.perf
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(
+        ("package", "attribute"),
+        [
+            ("icon_generator.bulk", "ProcessIconRenderer"),
+            ("icon_generator.cli", "main"),
+            ("icon_generator.serve", "AvatarApp"),
+        ],
+    )
+    def test_subpackage_import_defers_renderers(
+        self,
+        package: str,
+        attribute: str,
+    ) -> None:
+        """サブパッケージのインポートで asyncio・multiprocessing などを読み込まないこと
+
+        Args:
+            package (str): インポートするサブパッケージ名
+            attribute (str): 遅延インポートの対象となる属性名
+
+        """
+        lazy = measure_import(f"import {package}")
+        eager = measure_import(f"import {package}; {package}.{attribute}")
+
+        print(
+            f"\nimport {package}: {lazy * 1000:.1f} ms"
+            f"\n+ {attribute}: {eager * 1000:.1f} ms",
+        )
+        assert loaded_modules(f"import {package}", DEFERRED_MODULES) == []
+        assert lazy < eager
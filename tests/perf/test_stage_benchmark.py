@@ -0,0 +1,350 @@
+"""GitIconGenerator.generate_on_memory の各段階の所要時間を計測するベンチマーク。
+
+pytest -m perf -s で実行すると、PatternGenerator の生成・RGBGenerator・
+apply_color・Image.fromarray・リサイズ・PNG 保存と全体の所要時間を
+サイズ (16〜4096px) ごとに計測し、結果を JSON に保存したうえで
+ベースライン (baseline/stage_timings.json) と比較する。
+所要時間は実行環境に依存するため、ベースラインには同じ実行で計測した
+基準処理 (固定データの zlib 圧縮と Python のループ) に対する比を保存し、
+比較時は今回の基準処理の時間を掛けて期待する時間に換算する。
+換算した時間に許容幅を加えた時間を超えた段階があればテストは失敗する。
+
+環境変数で次の設定を変更できる。
+    ICON_GENERATOR_PERF_BASELINE: ベースラインの JSON のパス
+    ICON_GENERATOR_PERF_RESULTS:
+        計測結果の JSON の出力先 (既定は .pytest_cache/d/perf/stage_timings.json)
+    ICON_GENERATOR_PERF_TOLERANCE:
+        すべての段階に適用する許容幅 (0.5 ならベースラインの1.5倍まで許容)
+    ICON_GENERATOR_PERF_UPDATE: 1 の場合は比較せず、計測結果でベースラインを更新
+
+CPU の種類によって段階ごとの速さの比が大きく異なる環境では、
+ICON_GENERATOR_PERF_UPDATE=1 でベースラインを作り直すこと。
+"""
+# test_stage_benchmark.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import json
+import os
+import platform
+import timeit
+import uuid
+import zlib
+from collections.abc import Callable, Iterator
+from io import BytesIO
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+from PIL import Image
+from PIL.Image import Resampling
+
+from icon_generator import GitIconGenerator
+from icon_generator.encoder import EncoderRegistry
+from icon_generator.generator.git.core.color import RGBGenerator
+from icon_generator.generator.git.core.pattern import PatternGenerator
+
+REPEAT = 5
+IMAGE_SIZES = (16, 64, 256, 1024, 4096)
+UNIQUE_UUID = uuid.UUID("9b2f4c1e-7d3a-4e8b-a5c6-0f1d2e3b4a59")
+
+BASELINE_PATH = Path(__file__).parent / "baseline" / "stage_timings.json"
+DEFAULT_TOLERANCE = 0.5
+# これより小さい差は計測誤差として扱う (秒)
+MIN_REGRESSION_SECONDS = 2e-6
+RESULTS_VERSION = 2
+# 基準処理で圧縮するデータ (PNG の IDAT と同程度に圧縮できる固定の擬似乱数列)
+REFERENCE_DATA = bytes(np.random.default_rng(0).integers(0, 16, 1 << 16, np.uint8))
+
+
+def reference_stage() -> None:
+    """ベースラインの比の基準とする、パッケージのコードに依存しない処理。
+
+    PNG 保存などの C 拡張の処理 (zlib 圧縮) と Python の処理 (ループ) の両方の
+    速さを反映するよう、固定データの圧縮と整数の総和を行う。
+    """
+    zlib.compress(REFERENCE_DATA)
+    sum(range(10_000))
+
+
+def env_tolerance() -> float | None:
+    """ICON_GENERATOR_PERF_TOLERANCE で指定した許容幅を返す。
+
+    Returns:
+        float | None: 許容幅。指定がない場合は None
+
+    """
+    tolerance = os.environ.get("ICON_GENERATOR_PERF_TOLERANCE")
+    return None if tolerance is None else float(tolerance)
+
+
+def baseline_path() -> Path:
+    """ベースラインの JSON のパスを返す。
+
+    Returns:
+        Path: ICON_GENERATOR_PERF_BASELINE、もしくは BASELINE_PATH
+
+    """
+    return Path(os.environ.get("ICON_GENERATOR_PERF_BASELINE", BASELINE_PATH))
+
+
+def measure(stage: Callable[[], object]) -> float:
+    """計測する処理を繰り返し実行し、1回あたりの所要時間の最小値を秒で返す。
+
+    timeit の autorange で1回の計測が0.2秒以上となる実行回数を求め、
+    REPEAT 回計測した中で最も速い結果を採用する。
+
+    Args:
+        stage (Callable[[], object]): 計測する処理
+
+    Returns:
+        float: 1回あたりの所要時間 (秒)
+
+    """
+    timer = timeit.Timer(stage)
+    number, _ = timer.autorange()
+    return min(timer.repeat(REPEAT, number)) / number
+
+
+def stage_name(key: str) -> str:
+    """計測結果のキー (例: png_save@256) から段階名を取り出す。
+
+    Args:
+        key (str): 計測結果のキー
+
+    Returns:
+        str: 段階名
+
+    """
+    return key.split("@", 1)[0]
+
+
+def to_ratios(timings: dict[str, float], reference: float) -> dict[str, float]:
+    """計測結果を基準処理の所要時間に対する比に変換する。
+
+    Args:
+        timings (dict[str, float]): 計測結果 (キーから秒への対応)
+        reference (float): 同じ実行で計測した基準処理の所要時間 (秒)
+
+    Returns:
+        dict[str, float]: キーから基準処理に対する比への対応
+
+    """
+    return {key: seconds / reference for key, seconds in timings.items()}
+
+
+def find_regressions(
+    timings: dict[str, float],
+    reference: float,
+    baseline: dict[str, Any],
+    tolerance: float | None = None,
+) -> list[str]:
+    """ベースラインの比から換算した時間に許容幅を加えた時間を超えた計測結果を列挙する。
+
+    Args:
+        timings (dict[str, float]): 計測結果 (キーから秒への対応)
+        reference (float): 同じ実行で計測した基準処理の所要時間 (秒)
+        baseline (dict[str, Any]): ベースライン ("ratios" に基準処理に対する比、
+            "tolerances" に段階名ごとの許容幅)
+        tolerance (float | None, optional):
+            すべての段階に適用する許容幅。None の場合はベースラインの値を使用する
+
+    Returns:
+        list[str]: 許容幅を超えた計測結果の説明
+
+    """
+    tolerances = baseline.get("tolerances", {})
+    default = tolerances.get("default", DEFAULT_TOLERANCE)
+    regressions = []
+    for key, seconds in timings.items():
+        ratio = baseline.get("ratios", {}).get(key)
+        if ratio is None:
+            continue
+        expected = ratio * reference
+        allowed = tolerances.get(stage_name(key), default)
+        if tolerance is not None:
+            allowed = tolerance
+        limit = max(expected * (1 + allowed), expected + MIN_REGRESSION_SECONDS)
+        if seconds > limit:
+            regressions.append(
+                f"{key}: {seconds * 1e6:.1f} us > {limit * 1e6:.1f} us "
+                f"(baseline {expected * 1e6:.1f} us, tolerance {allowed:.0%})",
+            )
+    return regressions
+
+
+def build_stages(image_size: int) -> dict[str, Callable[[], object]]:
+    """generate_on_memory を構成する各段階の処理を、前段の結果を入力として作成する。
+
+    Args:
+        image_size (int): イメージサイズ
+
+    Returns:
+        dict[str, Callable[[], object]]: 段階名から処理への対応
+
+    """
+    hex_uuid = UNIQUE_UUID.hex
+    pattern = PatternGenerator(hex_uuid[:15])
+    rgb = RGBGenerator(hex_uuid[25:]).rgb
+    colors = pattern.apply_color(rgb).astype(np.uint8)
+    image = Image.fromarray(colors)
+    resized = image.resize((image_size, image_size), resample=Resampling.NEAREST)
+    encoder = EncoderRegistry.get(EncoderRegistry.PRESET_PNG)
+
+    return {
+        "pattern_generator": lambda: PatternGenerator(hex_uuid[:15]),
+        "rgb_generator": lambda: RGBGenerator(hex_uuid[25:]),
+        "apply_color": lambda: pattern.apply_color(rgb).astype(np.uint8),
+        "fromarray": lambda: Image.fromarray(colors),
+        "resize": lambda: image.resize(
+            (image_size, image_size),
+            resample=Resampling.NEAREST,
+        ),
+        "png_save": lambda: encoder.write(resized, BytesIO()),
+        "generate_on_memory": lambda: GitIconGenerator(
+            UNIQUE_UUID,
+        ).generate_on_memory(image_size),
+    }
+
+
+# サイズによらない段階は最小のサイズでのみ計測する
+SIZE_INDEPENDENT_STAGES = (
+    "pattern_generator",
+    "rgb_generator",
+    "apply_color",
+    "fromarray",
+)
+CASES = [
+    *((stage, IMAGE_SIZES[0]) for stage in SIZE_INDEPENDENT_STAGES),
+    *(
+        (stage, image_size)
+        for image_size in IMAGE_SIZES
+        for stage in ("resize", "png_save", "generate_on_memory")
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def baseline() -> dict[str, Any]:
+    """ベースラインの JSON (存在しない場合は空)"""
+    path = baseline_path()
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="module")
+def reference() -> float:
+    """同じ実行で計測した基準処理の所要時間 (秒)"""
+    return measure(reference_stage)
+
+
+@pytest.fixture(scope="module")
+def timings(
+    request: pytest.FixtureRequest,
+    baseline: dict[str, Any],
+    reference: float,
+) -> Iterator[dict[str, float]]:
+    """計測結果を集め、モジュールの終了時に JSON として保存する"""
+    results: dict[str, float] = {}
+    yield results
+
+    document = {
+        "version": RESULTS_VERSION,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "reference": reference,
+        "timings": results,
+        "ratios": to_ratios(results, reference),
+        "regressions": find_regressions(
+            results,
+            reference,
+            baseline,
+            env_tolerance(),
+        ),
+    }
+    output = os.environ.get("ICON_GENERATOR_PERF_RESULTS")
+    if output:
+        results_path = Path(output)
+    elif (cache := getattr(request.config, "cache", None)) is not None:
+        results_path = cache.mkdir("perf") / "stage_timings.json"
+    else:
+        results_path = None
+    if results_path is not None:
+        results_path.write_text(
+            json.dumps(document, indent=2) + "\n",
+            encoding="utf-8",
+        )
+
+    if os.environ.get("ICON_GENERATOR_PERF_UPDATE") == "1":
+        updated = {
+            "version": RESULTS_VERSION,
+            "tolerances": baseline.get("tolerances", {"default": DEFAULT_TOLERANCE}),
+            "ratios": {
+                **baseline.get("ratios", {}),
+                **to_ratios(results, reference),
+            },
+        }
+        baseline_path().parent.mkdir(parents=True, exist_ok=True)
+        baseline_path().write_text(
+            json.dumps(updated, indent=2) + "\n",
+            encoding="utf-8",
+        )
+
+
+class TestStageBenchmark:
+    """generate_on_memory の段階ごとの所要時間を計測するベンチマーク。"""
+
+    @pytest.mark.perf
+    @pytest.mark.v1_1_0
+    def test_stages_compose_generate_on_memory(self) -> None:
+        """各段階を順に実行した結果が generate_on_memory と一致すること"""
+        for image_size in IMAGE_SIZES:
+            stages = build_stages(image_size)
+            resized = stages["resize"]()
+            assert isinstance(resized, Image.Image)
+            stream = BytesIO()
+            EncoderRegistry.get(EncoderRegistry.PRESET_PNG).write(resized, stream)
+
+            expected = GitIconGenerator(UNIQUE_UUID).generate_on_memory(image_size)
+            assert stream.getvalue() == expected.getvalue()
+
+    @pytest.mark.perf
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(("stage", "image_size"), CASES)
+    def test_stage_within_baseline(
+        self,
+        stage: str,
+        image_size: int,
+        timings: dict[str, float],
+        baseline: dict[str, Any],
+        reference: float,
+    ) -> None:
+        """段階の所要時間を計測し、ベースラインの比から換算した時間以内であること
+
+        Args:
+            stage (str): 段階名
+            image_size (int): イメージサイズ
+            timings (dict[str, float]): 計測結果
+            baseline (dict[str, Any]): ベースライン
+            reference (float): 基準処理の所要時間 (秒)
+
+        """
+        key = stage if stage in SIZE_INDEPENDENT_STAGES else f"{stage}@{image_size}"
+        seconds = measure(build_stages(image_size)[stage])
+        timings[key] = seconds
+        print(f"\n{key}: {seconds * 1e6:.1f} us ({seconds / reference:.3f}x reference)")
+
+        if os.environ.get("ICON_GENERATOR_PERF_UPDATE") == "1":
+            return
+        regressions = find_regressions(
+            {key: seconds},
+            reference,
+            baseline,
+            env_tolerance(),
+        )
+        assert not regressions, regressions[0]
@@ -0,0 +1,110 @@
+"""ThreadIconRenderer のスレッド数によるスケーリングを計測するベンチマーク。
+
+pytest -m perf -s で実行すると、スレッド数ごとの所要時間と1スレッドに対する
+速度向上率を、プロセスプール (render_many) の結果と並べて表示する。
+"""
+# test_thread_scaling.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import os
+import statistics
+import time
+import uuid
+from collections.abc import Callable
+
+import pytest
+
+from icon_generator import GitIconGenerator
+
+ICON_COUNT = 64
+REPEAT = 3
+IMAGE_SIZE = 512
+THREAD_COUNTS = (1, 2, 4, 8)
+
+
+def measure(
+    render: Callable[..., list[bytes]],
+    uuids: list[uuid.UUID],
+    image_format: str,
+    workers: int,
+) -> tuple[float, list[bytes]]:
+    """Render を REPEAT 回実行し、所要時間の中央値と生成結果を返す。
+
+    Args:
+        render (Callable[..., list[bytes]]): render_many などの一括生成メソッド
+        uuids (list[uuid.UUID]): UUID のリスト
+        image_format (str): 画像フォーマット名
+        workers (int): ワーカー数
+
+    Returns:
+        tuple[float, list[bytes]]: 所要時間の中央値 (秒) と生成結果
+
+    """
+    chunk_size = max(1, len(uuids) // (workers * 4))
+    timings = []
+    results: list[bytes] = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        results = render(uuids, IMAGE_SIZE, image_format, workers, chunk_size)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), results
+
+
+class TestThreadScalingBenchmark:
+    """スレッドプールによる生成のスケーリングを計測するベンチマーク。"""
+
+    @pytest.mark.perf
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(
+        "image_format",
+        [GitIconGenerator.FORMAT_PNG, GitIconGenerator.FORMAT_INDEXED_PNG],
+    )
+    def test_thread_scaling(self, image_format: str) -> None:
+        """スレッド数ごとの速度向上率を表示し、結果が逐次生成と一致すること
+
+        Args:
+            image_format (str): 画像フォーマット名
+
+        """
+        uuids = [uuid.uuid4() for _ in range(ICON_COUNT)]
+        expected = [
+            GitIconGenerator.generate_bytes(u, IMAGE_SIZE, image_format) for u in uuids
+        ]
+
+        timings = {}
+        for workers in THREAD_COUNTS:
+            timings[workers], results = measure(
+                GitIconGenerator.render_many_threaded,
+                uuids,
+                image_format,
+                workers,
+            )
+            assert results == expected
+
+        processes = os.cpu_count() or 1
+        process_timing, results = measure(
+            GitIconGenerator.render_many,
+            uuids,
+            image_format,
+            processes,
+        )
+        assert results == expected
+
+        baseline = timings[1]
+        lines = [
+            f"{image_format} x{ICON_COUNT} ({IMAGE_SIZE}px, CPU {processes})",
+            *[
+                f"  threads={workers}: {timing * 1000:8.1f} ms"
+                f"  speedup {baseline / timing:.2f}x"
+                for workers, timing in timings.items()
+            ],
+            (
+                f"  processes={processes}: {process_timing * 1000:6.1f} ms"
+                f"  speedup {baseline / process_timing:.2f}x"
+            ),
+        ]
+        print("\n" + "\n".join(lines))
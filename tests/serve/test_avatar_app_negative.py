@@ -0,0 +1,135 @@
+"""AvatarApp の異常系テストケースを定義するモジュール。"""
+# test_avatar_app_negative.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import asyncio
+import re
+from typing import Any
+
+import pytest
+
+from icon_generator.errors import ErrorMessages
+from icon_generator.serve import AvatarApp
+
+UNIQUE_UUID = "12345678-1234-5678-1234-567812345678"
+
+
+class TestAvatarAppNegativeCases:
+    """AvatarAppにおける異常系の動作を検証するテストクラス。"""
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(
+        ("default_size", "max_size"),
+        [(0, 128), (256, 128)],
+    )
+    def test_invalid_sizes(self, default_size: int, max_size: int) -> None:
+        """既定のサイズが1〜上限の範囲外の場合に ValueError が発生すること
+
+        Args:
+            default_size (int): size を省略した場合のイメージサイズ
+            max_size (int): 受け付けるイメージサイズの上限
+
+        """
+        error = ErrorMessages.INVALID_SERVER_SIZES.value
+
+        with pytest.raises(ValueError, match=re.escape(error)):
+            AvatarApp(default_size=default_size, max_size=max_size)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(
+        "path",
+        ["/", f"/{UNIQUE_UUID}", f"/{UNIQUE_UUID}.gif", "/not-a-uuid.png"],
+    )
+    def test_not_found(self, path: str) -> None:
+        """UUID や拡張子が不正なパスには 404 を返すこと
+
+        Args:
+            path (str): リクエストパス
+
+        """
+        response = AvatarApp().respond("GET", path)
+
+        assert response.status == 404  # noqa: PLR2004
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(
+        "query",
+        ["size=0", "size=-1", "size=abc", "size=1025", "size=%C2%B2", "size=1%C2%B2"],
+    )
+    def test_bad_size(self, query: str) -> None:
+        """数値でない ("²" などを含む)、もしくは範囲外のサイズには 400 を返すこと
+
+        Args:
+            query (str): クエリ文字列
+
+        """
+        response = AvatarApp().respond("GET", f"/{UNIQUE_UUID}.png", query)
+
+        assert response.status == 400  # noqa: PLR2004
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_method_not_allowed(self) -> None:
+        """GET・HEAD 以外のメソッドには Allow ヘッダ付きで 405 を返すこと"""
+        response = AvatarApp().respond("POST", f"/{UNIQUE_UUID}.png")
+
+        assert response.status == 405  # noqa: PLR2004
+        assert ("Allow", "GET, HEAD") in response.headers
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(
+        ("method", "path", "query", "status"),
+        [
+            ("HEAD", f"/{UNIQUE_UUID}.gif", "", 404),
+            ("HEAD", f"/{UNIQUE_UUID}.png", "size=%C2%B2", 400),
+            ("PUT", f"/{UNIQUE_UUID}.png", "", 405),
+        ],
+    )
+    def test_head_error_without_body(
+        self,
+        method: str,
+        path: str,
+        query: str,
+        status: int,
+    ) -> None:
+        """HEAD のエラーレスポンスは本文を返さず、PUT などでは本文を返すこと
+
+        Args:
+            method (str): リクエストメソッド
+            path (str): リクエストパス
+            query (str): クエリ文字列
+            status (int): 期待するステータスコード
+
+        """
+        response = AvatarApp().respond(method, path, query)
+        content_length = int(dict(response.headers)["Content-Length"])
+
+        assert response.status == status
+        assert content_length > 0
+        assert len(response.body) == (0 if method == "HEAD" else content_length)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_asgi_unsupported_scope(self) -> None:
+        """ASGI で http・lifespan 以外のスコープを受け取ると ValueError となること"""
+        app = AvatarApp()
+        sent: list[Any] = []
+        error = ErrorMessages.UNSUPPORTED_ASGI_SCOPE.format(scope_type="websocket")
+
+        async def receive() -> Any:  # noqa: ANN401
+            return {"type": "websocket.connect"}
+
+        async def send(message: Any) -> None:  # noqa: ANN401
+            sent.append(message)
+
+        with pytest.raises(ValueError, match=re.escape(error)):
+            asyncio.run(app.asgi({"type": "websocket", "path": "/"}, receive, send))
+        assert sent == []
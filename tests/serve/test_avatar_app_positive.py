@@ -0,0 +1,255 @@
+"""AvatarApp の正常系テストケースを定義するモジュール。"""
+# test_avatar_app_positive.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import asyncio
+import uuid
+from typing import Any
+from wsgiref.util import setup_testing_defaults
+
+import PIL
+import pytest
+from PIL import features
+
+from icon_generator.encoder import EncoderRegistry, PillowEncoder
+from icon_generator.generator.git import GitIconGenerator
+from icon_generator.serve import AvatarApp
+
+UNIQUE_UUID = uuid.UUID("12345678-1234-5678-1234-567812345678")
+
+
+@pytest.fixture
+def app() -> AvatarApp:
+    """既定の設定の AvatarApp"""
+    return AvatarApp()
+
+
+class TestAvatarAppPositiveCases:
+    """AvatarAppにおける正常系の動作を検証するテストクラス。"""
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(
+        ("extension", "image_format", "content_type"),
+        [
+            (".png", GitIconGenerator.FORMAT_PNG, "image/png"),
+            (".svg", GitIconGenerator.FORMAT_SVG, "image/svg+xml"),
+            (".webp", "webp-lossless", "image/webp"),
+        ],
+    )
+    def test_respond_image(
+        self,
+        app: AvatarApp,
+        extension: str,
+        image_format: str,
+        content_type: str,
+    ) -> None:
+        """拡張子に対応するフォーマットの画像を immutable なキャッシュ指定で返すこと
+
+        Args:
+            app (AvatarApp): AvatarAppインスタンス
+            extension (str): リクエストパスの拡張子
+            image_format (str): 画像フォーマット名
+            content_type (str): 期待する Content-Type
+
+        """
+        response = app.respond("GET", f"/{UNIQUE_UUID}{extension}", "size=48")
+        headers = dict(response.headers)
+
+        assert response.status == 200  # noqa: PLR2004
+        assert response.body == GitIconGenerator.generate_bytes(
+            UNIQUE_UUID,
+            48,
+            image_format,
+        )
+        assert headers["Content-Type"] == content_type
+        assert headers["Content-Length"] == str(len(response.body))
+        assert headers["Cache-Control"] == AvatarApp.CACHE_CONTROL
+        assert headers["ETag"] == AvatarApp.etag(UNIQUE_UUID, 48, image_format)
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_respond_default_size_and_head(self, app: AvatarApp) -> None:
+        """サイズの指定を省略すると既定のサイズとなり、HEAD では本文を返さないこと
+
+        Args:
+            app (AvatarApp): AvatarAppインスタンス
+
+        """
+        expected = GitIconGenerator.generate_bytes(UNIQUE_UUID, AvatarApp.DEFAULT_SIZE)
+
+        response = app.respond("HEAD", f"/{UNIQUE_UUID}.png")
+
+        assert response.status == 200  # noqa: PLR2004
+        assert response.body == b""
+        assert dict(response.headers)["Content-Length"] == str(len(expected))
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    @pytest.mark.parametrize(
+        "if_none_match",
+        ["{etag}", "W/{etag}", '"other", {etag}', "*"],
+    )
+    def test_not_modified_without_rendering(
+        self,
+        app: AvatarApp,
+        monkeypatch: pytest.MonkeyPatch,
+        if_none_match: str,
+    ) -> None:
+        """If-None-Match が一致すると、描画せずに 304 を返すこと
+
+        Args:
+            app (AvatarApp): AvatarAppインスタンス
+            monkeypatch (pytest.MonkeyPatch): MonkeyPatchインスタンス
+            if_none_match (str): If-None-Match ヘッダの値
+
+        """
+        etag = AvatarApp.etag(UNIQUE_UUID, 64, GitIconGenerator.FORMAT_PNG)
+
+        def generate_bytes(*args: object) -> bytes:
+            raise AssertionError
+
+        monkeypatch.setattr(GitIconGenerator, "generate_bytes", generate_bytes)
+
+        response = app.respond(
+            "GET",
+            f"/{UNIQUE_UUID}.png",
+            "size=64",
+            if_none_match.format(etag=etag),
+        )
+
+        assert response.status == 304  # noqa: PLR2004
+        assert response.body == b""
+        assert dict(response.headers)["ETag"] == etag
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_etag_follows_visual_content(self) -> None:
+        """見た目が同じ UUID は同じ ETag となり、サイズやフォーマットで異なること"""
+        # パターンと色に使われない桁 (偶奇が同じ) のみを変えた UUID
+        same_look = uuid.UUID("32345678-1234-5678-1234-567812345678")
+        png = GitIconGenerator.FORMAT_PNG
+
+        assert AvatarApp.etag(UNIQUE_UUID, 32, png) == AvatarApp.etag(
+            same_look,
+            32,
+            png,
+        )
+        assert AvatarApp.etag(UNIQUE_UUID, 32, png) != AvatarApp.etag(
+            UNIQUE_UUID,
+            64,
+            png,
+        )
+        assert AvatarApp.etag(UNIQUE_UUID, 32, png) != AvatarApp.etag(
+            UNIQUE_UUID,
+            32,
+            GitIconGenerator.FORMAT_SVG,
+        )
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_etag_follows_library_versions(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Pillow・libwebp のバージョンやエンコーダの設定が変わると ETag が変わること
+
+        Args:
+            monkeypatch (pytest.MonkeyPatch): pytestのモンキーパッチ用フィクスチャ
+
+        """
+        webp = EncoderRegistry.PRESET_WEBP_LOSSLESS
+        png = AvatarApp.etag(UNIQUE_UUID, 32, GitIconGenerator.FORMAT_PNG)
+        lossless = AvatarApp.etag(UNIQUE_UUID, 32, webp)
+
+        monkeypatch.setattr(PIL, "__version__", "0.0.0")
+        assert AvatarApp.etag(UNIQUE_UUID, 32, GitIconGenerator.FORMAT_PNG) != png
+        monkeypatch.undo()
+
+        monkeypatch.setattr(features, "version", lambda _: "0.0.0")
+        assert AvatarApp.etag(UNIQUE_UUID, 32, webp) != lossless
+        monkeypatch.undo()
+
+        monkeypatch.setitem(
+            EncoderRegistry._encoders,
+            webp,
+            PillowEncoder("WEBP", ".webp", "image/webp", lossless=True, quality=50),
+        )
+        assert AvatarApp.etag(UNIQUE_UUID, 32, webp) != lossless
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_wsgi(self, app: AvatarApp) -> None:
+        """WSGI アプリケーションとして画像と 304 を返すこと
+
+        Args:
+            app (AvatarApp): AvatarAppインスタンス
+
+        """
+        statuses: list[str] = []
+        environ: dict[str, Any] = {
+            "PATH_INFO": f"/{UNIQUE_UUID}.svg",
+            "QUERY_STRING": "size=20",
+        }
+        setup_testing_defaults(environ)
+
+        body = b"".join(app(environ, lambda status, _: statuses.append(status)))
+        environ["HTTP_IF_NONE_MATCH"] = AvatarApp.etag(UNIQUE_UUID, 20, "svg")
+        not_modified = b"".join(
+            app(environ, lambda status, _: statuses.append(status)),
+        )
+
+        assert statuses == ["200 OK", "304 Not Modified"]
+        assert body == GitIconGenerator.generate_bytes(UNIQUE_UUID, 20, "svg")
+        assert not_modified == b""
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_asgi(self, app: AvatarApp) -> None:
+        """ASGI アプリケーションとして画像を返し、lifespan に応答すること
+
+        Args:
+            app (AvatarApp): AvatarAppインスタンス
+
+        """
+        etag = AvatarApp.etag(UNIQUE_UUID, 16, GitIconGenerator.FORMAT_PNG)
+        sent: list[Any] = []
+
+        async def send(message: Any) -> None:  # noqa: ANN401
+            sent.append(message)
+
+        async def run() -> None:
+            lifespan = iter(
+                [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}],
+            )
+
+            async def receive() -> Any:  # noqa: ANN401
+                return next(lifespan)
+
+            await app.asgi({"type": "lifespan"}, receive, send)
+            await app.asgi(
+                {
+                    "type": "http",
+                    "method": "GET",
+                    "path": f"/{UNIQUE_UUID}.png",
+                    "query_string": b"size=16",
+                    "headers": [(b"if-none-match", etag.encode())],
+                },
+                receive,
+                send,
+            )
+
+        asyncio.run(run())
+
+        assert [message["type"] for message in sent] == [
+            "lifespan.startup.complete",
+            "lifespan.shutdown.complete",
+            "http.response.start",
+            "http.response.body",
+        ]
+        assert sent[2]["status"] == 304  # noqa: PLR2004
+        assert (b"etag", etag.encode()) in sent[2]["headers"]
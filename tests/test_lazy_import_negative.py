@@ -0,0 +1,32 @@
+"""LazyAttributes の異常系テストケースを定義するモジュール。"""
+# test_lazy_import_negative.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import pytest
+
+import icon_generator
+from icon_generator.lazy_import import LazyAttributes
+
+
+class TestLazyAttributesNegativeCases:
+    """LazyAttributesにおける異常系の動作を検証するテストクラス。"""
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_resolve_unknown_attribute(self) -> None:
+        """遅延インポートの対象ではない属性を解決すると AttributeError が発生すること"""
+        lazy = LazyAttributes("icon_generator", {})
+
+        with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+            lazy.resolve("missing")
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_package_unknown_attribute(self) -> None:
+        """パッケージに存在しない属性を参照すると AttributeError が発生すること"""
+        with pytest.raises(AttributeError):
+            icon_generator.missing  # type: ignore[attr-defined] # noqa: B018
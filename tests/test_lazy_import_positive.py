@@ -0,0 +1,128 @@
+"""LazyAttributes の正常系テストケースを定義するモジュール。"""
+# test_lazy_import_positive.py
+
+# MIT License
+# Copyright (c) 2025 kazuma tunomori
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy...
+
+import subprocess
+import sys
+import types
+
+import pytest
+
+import icon_generator
+from icon_generator.generator.git.git_icon_generator import GitIconGenerator
+from icon_generator.lazy_import import LazyAttributes
+
+
+class TestLazyAttributesPositiveCases:
+    """LazyAttributesにおける正常系の動作を検証するテストクラス。"""
+
+    @pytest.fixture
+    def package(self, monkeypatch: pytest.MonkeyPatch) -> types.ModuleType:
+        """テスト用に sys.modules へ登録した空のパッケージ"""
+        module = types.ModuleType("lazy_test_package")
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+        return module
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_resolve_imports_and_stores_attribute(
+        self,
+        package: types.ModuleType,
+    ) -> None:
+        """Resolve が属性をインポートし、パッケージの名前空間に格納すること
+
+        Args:
+            package (types.ModuleType): テスト用のパッケージ
+
+        """
+        lazy = LazyAttributes(package.__name__, {"dumps": "json"})
+
+        value = lazy.resolve("dumps")
+
+        assert value is sys.modules["json"].dumps
+        assert package.dumps is value
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_names_include_lazy_attributes(self, package: types.ModuleType) -> None:
+        """Names がパッケージの名前空間と遅延属性の名前を合わせて返すこと
+
+        Args:
+            package (types.ModuleType): テスト用のパッケージ
+
+        """
+        lazy = LazyAttributes(package.__name__, {"dumps": "json"})
+
+        assert lazy.names({"existing": None}) == ["dumps", "existing"]
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_package_attributes_resolve_lazily(self) -> None:
+        """パッケージから遅延インポートした属性が実体と一致し、dir に含まれること"""
+        assert icon_generator.GitIconGenerator is GitIconGenerator
+        assert set(icon_generator.__all__) <= set(dir(icon_generator))
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_import_does_not_load_numpy_or_pillow(self) -> None:
+        """インポートとキャッシュの有効化で NumPy と Pillow を読み込まないこと"""
+        code = (
+            "import sys, tempfile, icon_generator\n"
+            "icon_generator.enable_disk_cache(tempfile.mkdtemp())\n"
+            "icon_generator.enable_memory_cache()\n"
+            "print(sorted({'numpy', 'PIL'} & set(sys.modules)))\n"
+        )
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            text=True,
+            env={"PYTHONPATH": icon_generator.__path__[0].rsplit("/", 1)[0]},
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_generator_import_does_not_load_parallel_modules(self) -> None:
+        """GitIconGenerator の参照で並列処理のモジュールを読み込まないこと"""
+        code = (
+            "import sys, icon_generator\n"
+            "icon_generator.GitIconGenerator\n"
+            "modules = {'asyncio', 'multiprocessing', 'concurrent', 'zipfile', "
+            "'tarfile', 'icon_generator.bulk', 'icon_generator.export'}\n"
+            "print(sorted(modules & set(sys.modules)))\n"
+        )
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            text=True,
+            env={"PYTHONPATH": icon_generator.__path__[0].rsplit("/", 1)[0]},
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    @pytest.mark.reg
+    @pytest.mark.v1_1_0
+    def test_generator_base_does_not_load_pillow(self) -> None:
+        """基底クラス Generator のインポートで Pillow とエンコーダを読み込まないこと"""
+        code = (
+            "import sys\n"
+            "from icon_generator.generator.generator import Generator\n"
+            "modules = {'PIL', 'icon_generator.encoder'}\n"
+            "print(sorted(modules & set(sys.modules)))\n"
+        )
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            text=True,
+            env={"PYTHONPATH": icon_generator.__path__[0].rsplit("/", 1)[0]},
+        )
+
+        assert result.stdout.strip() == "[]"